@@ -1,11 +1,12 @@
 """Main entry point for the LLM evaluation system.
 
-This is a simple wrapper that runs the main evaluation script.
-For more options, use: python scripts/run_evaluation.py --help
+This is a simple wrapper that runs the main evaluation script in this
+process. For more options, use: python scripts/run_evaluation.py --help
 """
 
-import subprocess
+import importlib.util
 import sys
+from pathlib import Path
 
 
 def main():
@@ -16,17 +17,24 @@ def main():
     print("For available options, run: python scripts/run_evaluation.py --help")
     print()
     print("Quick commands:")
-    print("  - List all tasks: python scripts/run_evaluation.py --list-tasks")
-    print("  - List all models: python scripts/run_evaluation.py --list-models")
-    print("  - Validate tasks: python scripts/run_evaluation.py --validate-tasks")
-    print("  - Run evaluations: python scripts/run_evaluation.py")
+    print("  - List all tasks: python scripts/run_evaluation.py list-tasks")
+    print("  - List all models: python scripts/run_evaluation.py list-models")
+    print("  - Validate tasks: python scripts/run_evaluation.py validate")
+    print("  - Run evaluations: python scripts/run_evaluation.py run")
+    print("  - Generate a report: python scripts/run_evaluation.py report --latest")
+    print("  - Generate plots: python scripts/run_evaluation.py plot --latest")
     print()
     print("=" * 50)
     print()
 
-    # Forward to the actual script
-    subprocess.run([sys.executable, "scripts/run_evaluation.py"] + sys.argv[1:])
+    # Forward to the actual script, without starting a second interpreter
+    spec = importlib.util.spec_from_file_location(
+        "run_evaluation", Path(__file__).parent / "scripts" / "run_evaluation.py"
+    )
+    run_evaluation = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(run_evaluation)
+    return run_evaluation.main(sys.argv[1:])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
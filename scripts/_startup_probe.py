@@ -0,0 +1,100 @@
+"""Startup measurements of run_evaluation.py, shared by benchmark.py and the tests.
+
+Every measurement runs in a fresh interpreter, so the modules a command
+imports and its wall time are exactly what a user would see.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / "scripts" / "run_evaluation.py"
+
+# Subcommands that do not evaluate anything and must start quickly
+STARTUP_COMMANDS = (("list-tasks",), ("list-models",), ("validate",), ("run", "--help"))
+
+# Modules that are slow to import and only needed to evaluate, export or plot
+HEAVY_MODULES = ("pandas", "matplotlib", "seaborn", "numpy", "requests", "aiohttp")
+
+# Default allowed wall time of a command beyond a bare interpreter's, in seconds
+STARTUP_BUDGET_SEC = 0.25
+
+# Prefix of the line listing imported heavy modules; the command's own
+# output (e.g. argparse help) comes before it
+_HEAVY_PREFIX = "heavy:"
+
+# Runs a command in-process, then prints the heavy modules it imported
+_COMMAND_PROBE = f"""
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location("run_evaluation", {str(SCRIPT)!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+module.console.quiet = True
+try:
+    module.main(sys.argv[1:])
+except SystemExit:
+    pass
+"""
+
+
+def median_wall(command: Sequence[str], repeats: int = 5) -> float:
+    """Median wall time of running a command, in seconds.
+
+    Args:
+        command: Command line to run
+        repeats: Number of runs (default: 5)
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(list(command), cwd=ROOT, capture_output=True, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def interpreter_wall(repeats: int = 5) -> float:
+    """Median wall time of starting a bare interpreter, in seconds."""
+    return median_wall([sys.executable, "-c", "pass"], repeats)
+
+
+def command_wall(command: Sequence[str], repeats: int = 5) -> float:
+    """Median wall time of a run_evaluation.py subcommand, in seconds.
+
+    Args:
+        command: Subcommand and its arguments, e.g. ("list-tasks",)
+        repeats: Number of runs (default: 5)
+    """
+    return median_wall([sys.executable, str(SCRIPT), *command], repeats)
+
+
+def imported_heavy_modules(code: str, *args: str) -> List[str]:
+    """Heavy modules imported by running Python code in a fresh interpreter.
+
+    Args:
+        code: Code to run
+        *args: Arguments passed to the code as sys.argv[1:]
+
+    Returns:
+        The HEAVY_MODULES found in sys.modules once the code finished
+    """
+    code += f"\nprint({_HEAVY_PREFIX!r} + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}", *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    line = next(line for line in reversed(output.splitlines()) if line.startswith(_HEAVY_PREFIX))
+    return [m for m in line[len(_HEAVY_PREFIX):].split(",") if m]
+
+
+def command_heavy_modules(command: Sequence[str]) -> List[str]:
+    """Heavy modules imported by a run_evaluation.py subcommand.
+
+    Args:
+        command: Subcommand and its arguments, e.g. ("list-tasks",)
+    """
+    return imported_heavy_modules(_COMMAND_PROBE, *command)
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Benchmark the evaluation harness itself.
+
+Measures, at several scales of synthetic results:
+- Evaluation throughput and per-cell harness overhead of Evaluator against
+  an in-process mock Ollama server that answers instantly
+- ResultsStorage write and load throughput for each storage backend
+- Summary generation time (in-memory, file scan and SQLite index)
+- Plot generation time of generate_plots.py
+- Startup time of the run_evaluation.py listing subcommands, checked
+  against an import-time budget; this one does not depend on the scale
+
+Results are written as JSON together with the git commit, so runs can be
+compared across commits with --compare:
+
+    python scripts/benchmark.py --scales 100,10000
+    python scripts/benchmark.py --compare data/benchmarks/benchmark_abc1234_*.json
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import multiprocessing
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rich.console import Console
+from rich.table import Table
+
+from _startup_probe import (
+    STARTUP_BUDGET_SEC,
+    STARTUP_COMMANDS,
+    command_heavy_modules,
+    command_wall,
+    interpreter_wall
+)
+
+from llm_eval.evaluation import evaluator as evaluator_module
+from llm_eval.evaluation.evaluator import Evaluator
+from llm_eval.models.config import get_all_models
+from llm_eval.models.mock_server import MockOllamaConfig, MockOllamaServer
+from llm_eval.models.ollama_client import OllamaClient
+from llm_eval.results.backends import BACKENDS
+from llm_eval.results.result import EvaluationResult
+from llm_eval.results.storage import ResultsStorage
+from llm_eval.results.summary import summarize
+from llm_eval.tasks.base import Task
+from llm_eval.tasks.registry import TaskRegistry
+
+
+console = Console()
+
+# Metrics where a higher value is better; all others are durations
+HIGHER_IS_BETTER = ("_per_sec",)
+
+_WORDS = (
+    "the", "answer", "follows", "from", "each", "step", "because", "value",
+    "result", "model", "therefore", "so", "we", "check", "first", "then"
+)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark harness overhead, storage, summaries and plots"
+    )
+    parser.add_argument(
+        "--scales",
+        type=str,
+        default="100,10000",
+        help="Comma-separated numbers of synthetic results (default: 100,10000; "
+             "add 100000 for the large scale)"
+    )
+    parser.add_argument(
+        "--benchmarks",
+        type=str,
+        default="evaluation,storage,summary,plots,startup",
+        help="Comma-separated benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        "--backends",
+        type=str,
+        default=",".join(BACKENDS),
+        help=f"Storage backends to benchmark (default: {','.join(BACKENDS)})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Evaluator concurrency for the evaluation benchmark (default: 8)"
+    )
+    parser.add_argument(
+        "--max-evaluation-cells",
+        type=int,
+        default=10000,
+        help="Largest scale the evaluation benchmark runs at (default: 10000)"
+    )
+    parser.add_argument(
+        "--max-plot-results",
+        type=int,
+        default=10000,
+        help="Largest scale the plot benchmark runs at (default: 10000)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic data (default: 0)")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON output path (default: data/benchmarks/benchmark_<commit>_<time>.json)"
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Earlier benchmark JSON to compare against"
+    )
+    parser.add_argument(
+        "--regression-threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression with --compare (default: 0.2)"
+    )
+    parser.add_argument(
+        "--startup-budget-sec",
+        type=float,
+        default=STARTUP_BUDGET_SEC,
+        help="Allowed startup time of a listing subcommand beyond a bare interpreter's "
+             f"(default: {STARTUP_BUDGET_SEC})"
+    )
+    return parser.parse_args()
+
+
+def git_commit() -> Dict[str, Optional[str]]:
+    """Current commit and whether the tree has uncommitted changes."""
+    root = Path(__file__).parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": dirty}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of a list, or None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def timed(function: Callable, *args, **kwargs) -> float:
+    """Seconds taken by a call."""
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def synthetic_results(count: int, seed: int, distinct_cells: bool = True) -> List[EvaluationResult]:
+    """Build scored results shaped like real ones.
+
+    Args:
+        count: Number of results
+        seed: Random seed
+        distinct_cells: Give every result its own task ID, so no two results
+            share a cell in storage; otherwise reuse the registered task IDs
+
+    Returns:
+        List of EvaluationResult objects
+    """
+    rng = random.Random(seed)
+    tasks = TaskRegistry().get_complete_tasks()
+    models = get_all_models()
+    results = []
+    for i in range(count):
+        task = tasks[i % len(tasks)]
+        model = models[(i // len(tasks)) % len(models)]
+        strategy = model.supported_strategies[i % len(model.supported_strategies)]
+        scores = {aspect: rng.randint(0, points) for aspect, points in task.scoring_rubric.items()}
+        completion_tokens = rng.randint(50, 600)
+        results.append(EvaluationResult(
+            task_id=f"{task.id}_{i:06d}" if distinct_cells else task.id,
+            model_name=model.name,
+            strategy=strategy,
+            prompt=f"{task.description}\n\n{task.evaluation_input}",
+            response=" ".join(rng.choice(_WORDS) for _ in range(completion_tokens)),
+            timestamp=datetime(2026, 1, 1).isoformat(),
+            model_config=model.to_dict(),
+            generation_time_ms=rng.randint(500, 30000),
+            prompt_tokens=rng.randint(100, 800),
+            completion_tokens=completion_tokens,
+            load_duration_ms=rng.randint(0, 50),
+            prompt_eval_duration_ms=rng.randint(20, 400),
+            scores=scores,
+            total_score=sum(scores.values())
+        ))
+    return results
+
+
+def synthetic_tasks(count: int) -> List[Task]:
+    """Copies of the registered tasks with unique IDs, to build large matrices."""
+    tasks = TaskRegistry().get_complete_tasks()
+    return [
+        replace(tasks[i % len(tasks)], id=f"{tasks[i % len(tasks)].id}_{i:06d}")
+        for i in range(count)
+    ]
+
+
+class _TimedEvaluator(Evaluator):
+    """Evaluator that records each cell's time outside its generate call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.request_ms: List[float] = []
+        self.overhead_ms: List[float] = []
+        self._times_lock = threading.Lock()
+        self._current = threading.local()
+        generate = self.client.generate
+
+        def timed_generate(*call_args, **call_kwargs):
+            start = time.perf_counter()
+            try:
+                return generate(*call_args, **call_kwargs)
+            finally:
+                self._current.request_sec = time.perf_counter() - start
+
+        self.client.generate = timed_generate
+
+    def _evaluate_and_save(self, eval_config: Dict):
+        self._current.request_sec = 0.0
+        start = time.perf_counter()
+        try:
+            return super()._evaluate_and_save(eval_config)
+        finally:
+            cell_sec = time.perf_counter() - start
+            request_sec = self._current.request_sec
+            with self._times_lock:
+                self.request_ms.append(request_sec * 1000)
+                self.overhead_ms.append((cell_sec - request_sec) * 1000)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve_mock(config: MockOllamaConfig, port: int):
+    logging.disable(logging.INFO)
+    MockOllamaServer(config, port=port).serve_forever()
+
+
+def bench_evaluation(scale: int, backend: str, concurrency: int) -> Dict:
+    """Run a synthetic evaluation matrix against a mock server that answers instantly."""
+    models = get_all_models()
+    cells_per_task = sum(len(model.supported_strategies) for model in models)
+    tasks = synthetic_tasks(max(1, round(scale / cells_per_task)))
+
+    # The server runs in its own process so it does not compete for the GIL
+    port = _free_port()
+    server = multiprocessing.Process(
+        target=_serve_mock,
+        args=(MockOllamaConfig(
+            models=[model.name for model in models],
+            latency_ms=0,
+            load_duration_ms=0,
+            response_tokens=200,
+            num_parallel=concurrency,
+            time_scale=0,
+            seed=0
+        ), port),
+        daemon=True
+    )
+    server.start()
+    try:
+        client = OllamaClient(f"http://127.0.0.1:{port}", pool_size=concurrency)
+        deadline = time.monotonic() + 30
+        while not client.test_connection():
+            if time.monotonic() > deadline:
+                raise RuntimeError("Mock Ollama server did not start")
+            time.sleep(0.1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = ResultsStorage(Path(tmp), backend=backend)
+            evaluator = _TimedEvaluator(client, storage, max_concurrency=concurrency)
+            elapsed = timed(evaluator.run_evaluation, tasks, models, skip_validation=True)
+        client.close()
+    finally:
+        server.terminate()
+        server.join()
+
+    cells = len(evaluator.overhead_ms)
+    return {
+        "cells": cells,
+        "wall_time_sec": elapsed,
+        "evaluations_per_sec": cells / elapsed if elapsed else None,
+        "request_p50_ms": percentile(evaluator.request_ms, 0.5),
+        "request_p99_ms": percentile(evaluator.request_ms, 0.99),
+        "harness_overhead_p50_ms": percentile(evaluator.overhead_ms, 0.5),
+        "harness_overhead_p99_ms": percentile(evaluator.overhead_ms, 0.99)
+    }
+
+
+def bench_storage(results: List[EvaluationResult], backend: str) -> Dict:
+    """Write, load and summarize results with one storage backend."""
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = ResultsStorage(Path(tmp), backend=backend)
+        write_sec = timed(lambda: [storage.save_result(r, run_id="bench") for r in results])
+
+        # A new instance reads from disk rather than from any in-memory state
+        storage = ResultsStorage(Path(tmp), backend=backend)
+        start = time.perf_counter()
+        loaded = storage.load_results(run_id="bench")
+        load_sec = time.perf_counter() - start
+        summary_sec = timed(storage.generate_summary_report, "bench")
+
+    if len(loaded) != len(results):
+        raise RuntimeError(f"{backend} backend loaded {len(loaded)} of {len(results)} results")
+    return {
+        "write_sec": write_sec,
+        "writes_per_sec": len(results) / write_sec,
+        "load_sec": load_sec,
+        "loads_per_sec": len(results) / load_sec,
+        "scan_summary_sec": summary_sec
+    }
+
+
+def bench_summary(results: List[EvaluationResult]) -> Dict:
+    """Summary generation from memory and from the SQLite index."""
+    in_memory_sec = timed(summarize, results)
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = ResultsStorage(Path(tmp), backend="jsonl", use_index=True)
+        indexed_write_sec = timed(lambda: [storage.save_result(r, run_id="bench") for r in results])
+
+        storage = ResultsStorage(Path(tmp), backend="jsonl", use_index=True)
+        index_summary_sec = timed(storage.generate_summary_report, "bench")
+    return {
+        "in_memory_summary_sec": in_memory_sec,
+        "indexed_writes_per_sec": len(results) / indexed_write_sec,
+        "index_summary_sec": index_summary_sec
+    }
+
+
+def bench_plots(results: List[EvaluationResult]) -> Dict:
+    """Time generate_plots.py over a CSV export of the results."""
+    spec = importlib.util.spec_from_file_location(
+        "generate_plots", Path(__file__).parent / "generate_plots.py"
+    )
+    plots = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(plots)
+    plots.console.quiet = True
+    plots.plt.switch_backend("Agg")
+
+    import pandas as pd
+
+    plot_functions = [
+        plots.plot_total_score_by_model, plots.plot_performance_by_task,
+        plots.plot_performance_by_strategy, plots.plot_heatmap,
+        plots.plot_score_distribution, plots.plot_generation_time,
+        plots.plot_criteria_breakdown, plots.plot_radar_chart,
+        plots.plot_task_winner_comparison, plots.plot_model_specialization
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "results.csv"
+        pd.DataFrame([result.to_dict() for result in results]).to_csv(csv_path, index=False)
+
+        start = time.perf_counter()
+        df = plots.load_and_prepare_data(csv_path)
+        load_sec = time.perf_counter() - start
+
+        per_plot = {}
+        for i, plot in enumerate(plot_functions, start=1):
+            per_plot[plot.__name__] = timed(plot, df, Path(tmp) / f"{i}.png")
+    return {
+        "csv_load_sec": load_sec,
+        "plot_sec": sum(per_plot.values()),
+        "per_plot_sec": per_plot
+    }
+
+
+def bench_startup(budget_sec: float, repeats: int = 5) -> Dict:
+    """Time the listing subcommands of run_evaluation.py in fresh interpreters.
+
+    Each command's median wall time is compared with a bare interpreter's,
+    and the modules it imported are checked against HEAVY_MODULES (the
+    same checks as tests/test_startup.py).
+
+    Args:
+        budget_sec: Allowed time beyond the bare interpreter's
+        repeats: Runs per command; the median is reported
+
+    Returns:
+        Metrics, plus the commands that exceeded the budget under "over_budget"
+    """
+    interpreter_sec = interpreter_wall(repeats)
+    metrics: Dict = {"interpreter_sec": interpreter_sec}
+    over_budget = []
+    for command in STARTUP_COMMANDS:
+        wall_sec = command_wall(command, repeats)
+        heavy = command_heavy_modules(command)
+        name = "_".join(part.lstrip("-") for part in command).replace("-", "_")
+        metrics[f"{name}_sec"] = wall_sec
+        metrics[f"{name}_heavy_modules"] = heavy
+        if wall_sec - interpreter_sec > budget_sec or heavy:
+            over_budget.append(" ".join(command))
+    metrics["over_budget"] = over_budget
+    return metrics
+
+
+def run_benchmarks(args) -> Dict:
+    """Run every selected benchmark at every scale."""
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+    selected = {b.strip() for b in args.benchmarks.split(",") if b.strip()}
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+
+    report = {"scales": {}}
+    if not selected - {"startup"}:
+        scales = []
+    for scale in scales:
+        console.print(f"\n[bold cyan]Scale: {scale} results[/bold cyan]")
+        results = synthetic_results(scale, args.seed)
+        measured: Dict = {}
+
+        if "evaluation" in selected:
+            if scale <= args.max_evaluation_cells:
+                console.print("  evaluation...")
+                measured["evaluation"] = bench_evaluation(scale, backends[0], args.concurrency)
+            else:
+                console.print(f"  evaluation skipped (above --max-evaluation-cells)")
+
+        if "storage" in selected:
+            measured["storage"] = {}
+            for backend in backends:
+                console.print(f"  storage ({backend})...")
+                measured["storage"][backend] = bench_storage(results, backend)
+
+        if "summary" in selected:
+            console.print("  summary...")
+            measured["summary"] = bench_summary(results)
+
+        if "plots" in selected:
+            if scale <= args.max_plot_results:
+                console.print("  plots...")
+                measured["plots"] = bench_plots(
+                    synthetic_results(scale, args.seed, distinct_cells=False)
+                )
+            else:
+                console.print(f"  plots skipped (above --max-plot-results)")
+
+        report["scales"][str(scale)] = measured
+
+    if "startup" in selected:
+        console.print("\n[bold cyan]Startup[/bold cyan]")
+        report["startup"] = bench_startup(args.startup_budget_sec)
+    return report
+
+
+def flatten(metrics: Dict, prefix: str = "") -> Dict[str, float]:
+    """Flatten nested metrics into dotted names."""
+    flat = {}
+    for key, value in metrics.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> int:
+    """Print metric changes against a baseline report.
+
+    Returns:
+        Number of metrics that regressed by more than ``threshold``
+    """
+    now = {**flatten(current["scales"]), **flatten(current.get("startup", {}), "startup")}
+    before = {**flatten(baseline["scales"]), **flatten(baseline.get("startup", {}), "startup")}
+
+    table = Table(title=f"Compared with {(baseline.get('commit') or 'unknown')[:12]}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+
+    regressions = 0
+    for name in sorted(set(now) & set(before)):
+        if name.endswith("cells") or not before[name]:
+            continue
+        change = now[name] / before[name] - 1
+        higher_is_better = name.endswith(HIGHER_IS_BETTER)
+        slowdown = -change if higher_is_better else change
+        style = "red" if slowdown > threshold else "green" if slowdown < -threshold else ""
+        regressions += slowdown > threshold
+        table.add_row(
+            name, f"{before[name]:.4g}", f"{now[name]:.4g}",
+            f"[{style}]{change:+.1%}[/{style}]" if style else f"{change:+.1%}"
+        )
+    console.print(table)
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    # The evaluator's own progress and tables would dominate the timings
+    evaluator_module.console.quiet = True
+
+    git = git_commit()
+    report = {
+        "commit": git["commit"],
+        "dirty": git["dirty"],
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "arguments": {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+        **run_benchmarks(args)
+    }
+
+    output = args.output or Path("data/benchmarks") / (
+        f"benchmark_{(git['commit'] or 'nogit')[:7]}_"
+        f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    console.print(f"\n[bold green]Benchmark results saved to:[/bold green] {output}")
+
+    status = 0
+    over_budget = report.get("startup", {}).get("over_budget")
+    if over_budget:
+        console.print(
+            f"[bold red]Startup over budget or importing heavy modules:[/bold red] "
+            f"{', '.join(over_budget)}"
+        )
+        status = 1
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(report, baseline, args.regression_threshold)
+        if regressions:
+            console.print(f"[bold red]{regressions} metric(s) regressed[/bold red]")
+            return 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
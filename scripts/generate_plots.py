@@ -30,8 +30,8 @@ plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['figure.dpi'] = 100
 
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv=None):
+    """Parse command line arguments (default: sys.argv)."""
     parser = argparse.ArgumentParser(
         description="Generate visualization plots from evaluation CSV report"
     )
@@ -63,7 +63,7 @@ def parse_args():
         help="Output format for plots (default: png)"
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def find_latest_csv(reports_dir: Path = Path("data/results/reports")) -> Path:
@@ -644,9 +644,9 @@ def plot_model_specialization(df: pd.DataFrame, output_path: Path):
     console.print(f"[green]Saved:[/green] {output_path.name}")
 
 
-def main():
+def main(argv=None):
     """Main entry point."""
-    args = parse_args()
+    args = parse_args(argv)
 
     # Determine CSV path
     if args.latest:
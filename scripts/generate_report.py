@@ -48,8 +48,8 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv=None):
+    """Parse command line arguments (default: sys.argv)."""
     parser = argparse.ArgumentParser(
         description="Generate CSV report from evaluation run after manual scoring"
     )
@@ -74,13 +74,34 @@ def parse_args():
         help="Directory where results are stored (default: data/results)"
     )
 
+    parser.add_argument(
+        "--columnar",
+        type=str,
+        choices=["parquet", "feather"],
+        default=None,
+        help="Also write the run as a columnar file (requires pyarrow)"
+    )
+
+    parser.add_argument(
+        "--export-files",
+        action="store_true",
+        help="Export the run in the per-evaluation JSON + markdown layout "
+             "(for runs stored as JSONL)"
+    )
+
+    parser.add_argument(
+        "--results-index",
+        action="store_true",
+        help="Maintain and query a SQLite index of results (data/results/index.sqlite)"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose logging"
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def display_run_summary(storage: ResultsStorage, run_id: str):
@@ -119,15 +140,15 @@ def display_run_summary(storage: ResultsStorage, run_id: str):
     return True
 
 
-def main():
+def main(argv=None):
     """Main entry point."""
-    args = parse_args()
+    args = parse_args(argv)
 
     # Setup logging
     setup_logging(args.verbose)
 
     # Initialize storage
-    storage = ResultsStorage(base_path=args.results_dir)
+    storage = ResultsStorage(base_path=args.results_dir, use_index=args.results_index)
 
     # Determine run_id
     if args.latest:
@@ -160,6 +181,19 @@ def main():
     csv_path = storage.reports_dir / f"{run_id}_results.csv"
     storage.export_to_csv(csv_path, run_id=run_id)
 
+    # Optional exports
+    if args.columnar:
+        try:
+            columnar_path = storage.export_columnar(run_id, format=args.columnar)
+            console.print(f"[green]Columnar export saved to: {columnar_path}[/green]\n")
+        except (ImportError, ValueError) as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            return 1
+
+    if args.export_files:
+        export_dir = storage.export_files(run_id)
+        console.print(f"[green]Result files exported to: {export_dir}[/green]\n")
+
     console.print(f"[bold green]Report generated successfully![/bold green]")
     console.print(f"CSV saved to: {csv_path}\n")
 
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Run a mock Ollama server for offline benchmarking.
+
+The server implements /api/generate (streaming and non-streaming),
+/api/tags and /api/ps with simulated latency, token rates, model loading
+and injected failures, so the evaluation harness can be exercised without
+a model:
+
+    python scripts/mock_ollama_server.py --port 11500 --time-scale 0.01
+    python scripts/run_evaluation.py --ollama-url http://127.0.0.1:11500
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rich.console import Console
+from rich.logging import RichHandler
+
+from llm_eval.models.config import get_all_models
+from llm_eval.models.mock_server import LATENCY_DISTRIBUTIONS, MockOllamaConfig, MockOllamaServer
+
+
+console = Console()
+
+
+def parse_args():
+    """Parse command line arguments."""
+    defaults = MockOllamaConfig()
+    parser = argparse.ArgumentParser(
+        description="Serve a mock Ollama API with simulated latency and failures"
+    )
+
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=11500, help="Port to bind (default: 11500)")
+    parser.add_argument(
+        "--models",
+        type=str,
+        default=None,
+        help="Comma-separated model names to serve (default: the configured models)"
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=defaults.latency_ms,
+        help=f"Mean base latency per request (default: {defaults.latency_ms})"
+    )
+    parser.add_argument(
+        "--latency-distribution",
+        choices=LATENCY_DISTRIBUTIONS,
+        default=defaults.latency_distribution,
+        help=f"Shape of the base latency (default: {defaults.latency_distribution})"
+    )
+    parser.add_argument(
+        "--prompt-tokens-per-second",
+        type=float,
+        default=defaults.prompt_tokens_per_second,
+        help=f"Prompt processing rate (default: {defaults.prompt_tokens_per_second})"
+    )
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=defaults.tokens_per_second,
+        help=f"Decode rate (default: {defaults.tokens_per_second})"
+    )
+    parser.add_argument(
+        "--response-tokens",
+        type=int,
+        default=defaults.response_tokens,
+        help=f"Mean tokens per response without num_predict (default: {defaults.response_tokens})"
+    )
+    parser.add_argument(
+        "--load-duration-ms",
+        type=float,
+        default=defaults.load_duration_ms,
+        help=f"Time to load a model that is not loaded (default: {defaults.load_duration_ms})"
+    )
+    parser.add_argument(
+        "--max-loaded-models",
+        type=int,
+        default=defaults.max_loaded_models,
+        help=f"Models kept loaded at once (default: {defaults.max_loaded_models})"
+    )
+    parser.add_argument(
+        "--num-parallel",
+        type=int,
+        default=defaults.num_parallel,
+        help=f"Requests processed at once, like OLLAMA_NUM_PARALLEL (default: {defaults.num_parallel})"
+    )
+    parser.add_argument(
+        "--failure-rate",
+        type=float,
+        default=defaults.failure_rate,
+        help="Fraction of generate requests to fail (default: 0)"
+    )
+    parser.add_argument(
+        "--failure-status",
+        type=int,
+        default=defaults.failure_status,
+        help=f"HTTP status of injected failures (default: {defaults.failure_status})"
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=defaults.time_scale,
+        help="Real seconds slept per simulated second; 0 answers instantly (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for simulated randomness")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log every request")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True, console=console)]
+    )
+
+    models = (
+        [m.strip() for m in args.models.split(",") if m.strip()]
+        if args.models else [model.name for model in get_all_models()]
+    )
+    config = MockOllamaConfig(
+        models=models,
+        latency_ms=args.latency_ms,
+        latency_distribution=args.latency_distribution,
+        prompt_tokens_per_second=args.prompt_tokens_per_second,
+        tokens_per_second=args.tokens_per_second,
+        response_tokens=args.response_tokens,
+        load_duration_ms=args.load_duration_ms,
+        max_loaded_models=args.max_loaded_models,
+        num_parallel=args.num_parallel,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        time_scale=args.time_scale,
+        seed=args.seed
+    )
+
+    server = MockOllamaServer(config, host=args.host, port=args.port)
+    console.print(f"[bold green]Mock Ollama serving {', '.join(models)} at {server.url}[/bold green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        console.print(f"\nServed: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
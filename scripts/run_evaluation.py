@@ -6,28 +6,46 @@ This script orchestrates the complete evaluation pipeline:
 2. Loads model configurations
 3. Runs evaluations for all task-model-strategy combinations
 4. Saves results and generates reports
+
+Subcommands:
+    run          Run evaluations (the default without a subcommand)
+    list-tasks   List all available tasks
+    list-models  List all configured models
+    validate     Validate task definitions and show completion status
+    report       Generate a CSV report (scripts/generate_report.py)
+    plot         Generate plots from a CSV report (scripts/generate_plots.py)
+
+Modules that are slow to import (HTTP clients, pandas, matplotlib) are
+imported only by the subcommands that use them. The flags --list-tasks,
+--list-models and --validate-tasks still work in place of subcommands.
 """
 
 import argparse
+import importlib.util
+import json
 import logging
 import sys
+from dataclasses import replace
 from pathlib import Path
+from typing import List, Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from rich.console import Console
-from rich.logging import RichHandler
 
-from llm_eval.evaluation.evaluator import Evaluator
 from llm_eval.models.config import MODELS, get_all_models
-from llm_eval.models.ollama_client import OllamaClient
-from llm_eval.results.storage import ResultsStorage
+from llm_eval.tasks.dataset import TaskDataset
 from llm_eval.tasks.registry import TaskRegistry
 
 
 console = Console()
 
+COMMANDS = ("run", "list-tasks", "list-models", "validate", "report", "plot")
+
+# Subcommands implemented by sibling scripts, which parse their own arguments
+SCRIPT_COMMANDS = {"report": "generate_report.py", "plot": "generate_plots.py"}
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration.
@@ -35,6 +53,8 @@ def setup_logging(verbose: bool = False):
     Args:
         verbose: If True, set log level to DEBUG
     """
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
@@ -44,71 +64,330 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def parse_args():
-    """Parse command line arguments."""
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse command line arguments.
+
+    Without a subcommand, the arguments are parsed as ``run``.
+
+    Args:
+        argv: Arguments after the program name (default: sys.argv)
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        argv = ["run", *argv]
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose logging"
+    )
+
     parser = argparse.ArgumentParser(
         description="Run LLM evaluation across tasks, models, and prompting strategies"
     )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    run_parser = subparsers.add_parser(
+        "run",
+        parents=[common],
+        help="Run evaluations (default)",
+        description="Run LLM evaluation across tasks, models, and prompting strategies"
+    )
+    subparsers.add_parser("list-tasks", parents=[common], help="List all available tasks")
+    subparsers.add_parser("list-models", parents=[common], help="List all configured models")
+    subparsers.add_parser(
+        "validate",
+        parents=[common],
+        help="Validate task definitions and show completion status"
+    )
+    for command, script in SCRIPT_COMMANDS.items():
+        subparsers.add_parser(command, add_help=False, help=f"Run scripts/{script} (see its --help)")
 
-    parser.add_argument(
+    run_parser.add_argument(
         "--tasks",
         type=str,
         help="Comma-separated list of task IDs to run (default: all)",
         default=None
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
+        "--dataset",
+        action="append",
+        default=[],
+        metavar="TASK_ID=PATH",
+        help="Evaluate every item of a JSONL or CSV file (fields: id, input, reference) "
+             "instead of the task's single input; repeat for several tasks"
+    )
+
+    run_parser.add_argument(
         "--models",
         type=str,
         help="Comma-separated list of model keys to run (default: all)",
         default=None
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
+        "--ollama-option",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Ollama option sent with every request, e.g. num_ctx=8192 or num_thread=8; "
+             "repeat for several (overrides the models' additional_params)"
+    )
+
+    run_parser.add_argument(
+        "--few-shot-selection",
+        choices=["first", "similar"],
+        default=None,
+        help="How few-shot examples are chosen: in task order, or most similar to the "
+             "evaluation input (default: the models' few_shot_selection)"
+    )
+
+    run_parser.add_argument(
+        "--prompt-token-budget",
+        type=int,
+        default=None,
+        metavar="TOKENS",
+        help="Estimated tokens a few-shot prompt may use; examples that do not fit are "
+             "left out (default: the models' prompt_token_budget, else num_ctx if set)"
+    )
+
+    run_parser.add_argument(
         "--ollama-url",
         type=str,
         default="http://localhost:11434",
-        help="Ollama API base URL (default: http://localhost:11434)"
+        help=(
+            "Ollama API base URL, or a comma-separated list of URLs to load balance "
+            "across several hosts (default: http://localhost:11434)"
+        )
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
         "--results-dir",
         type=Path,
         default=Path("data/results"),
         help="Directory to store results (default: data/results)"
     )
 
-    parser.add_argument(
-        "--verbose", "-v",
+    run_parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="RUN_ID",
+        default=None,
+        help="Continue an existing run, only running missing or failed evaluations "
+             "(use 'latest' for the most recent run)"
+    )
+
+    run_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of generation requests in flight (default: 1)"
+    )
+
+    run_parser.add_argument(
+        "--per-model-concurrency",
+        type=int,
+        default=None,
+        help="Maximum in-flight requests per model, e.g. OLLAMA_NUM_PARALLEL "
+             "(default: same as --concurrency)"
+    )
+
+    run_parser.add_argument(
+        "--adaptive-concurrency",
         action="store_true",
-        help="Enable verbose logging"
+        help="Adjust in-flight requests between 1 and --concurrency from observed "
+             "latency per token (AIMD)"
+    )
+    run_parser.add_argument(
+        "--samples",
+        type=int,
+        default=None,
+        help="Generations per cell, each with its own seed (default: per model, usually 1)"
+    )
+
+    run_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per generation before storing an ERROR result; 1 disables retries (default: 3)"
+    )
+
+    run_parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=1.0,
+        help="Base delay in seconds before the first retry, doubled per retry with jitter (default: 1.0)"
+    )
+
+    run_parser.add_argument(
+        "--retry-status-codes",
+        type=str,
+        default="429,500,502,503,504",
+        help="Comma-separated HTTP statuses to retry (default: 429,500,502,503,504)"
+    )
+
+    run_parser.add_argument(
+        "--circuit-breaker-threshold",
+        type=int,
+        default=5,
+        help="Consecutive transient failures that pause dispatch to a server; 0 disables (default: 5)"
+    )
+
+    run_parser.add_argument(
+        "--circuit-breaker-reset",
+        type=float,
+        default=30.0,
+        help="Seconds dispatch stays paused before a probe request (default: 30)"
+    )
+
+    run_parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Drive requests from an asyncio event loop instead of worker threads "
+             "(requires aiohttp)"
+    )
+
+    run_parser.add_argument(
+        "--schedule",
+        type=str,
+        choices=["model", "task", "prefix"],
+        default="model",
+        help="Order evaluations by model (fewer model swaps), by task, or by model with "
+             "shared prompt prefixes back-to-back for KV cache reuse (default: model)"
+    )
+
+    run_parser.add_argument(
+        "--keep-alive",
+        type=str,
+        default=None,
+        help="How long Ollama keeps a model loaded between requests, e.g. 30m or -1 "
+             "(default: server setting)"
+    )
+
+    run_parser.add_argument(
+        "--max-loaded-models",
+        type=int,
+        default=None,
+        help="Maximum number of models with requests in flight at once, e.g. 1 on a "
+             "single GPU (default: unlimited)"
+    )
+
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream responses and record time-to-first-token and inter-token latency"
+    )
+
+    run_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse cached responses for identical (model, prompt, options) requests"
+    )
+
+    run_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path("data/cache/responses"),
+        help="Directory for the response cache (default: data/cache/responses)"
+    )
+
+    run_parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=1024,
+        help="Maximum response cache size in MiB before LRU eviction (default: 1024)"
+    )
+
+    run_parser.add_argument(
+        "--cache-bypass",
+        action="store_true",
+        help="Ignore cached responses but refresh the cache with new ones"
+    )
+
+    run_parser.add_argument(
+        "--storage-backend",
+        type=str,
+        choices=["files", "jsonl"],
+        default="files",
+        help="Result format: one JSON + markdown file per evaluation, or a single "
+             "append-only JSONL segment per run (default: files)"
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
+        "--results-index",
+        action="store_true",
+        help="Maintain and query a SQLite index of results (data/results/index.sqlite)"
+    )
+
+    run_parser.add_argument(
+        "--queue",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="SQLite work queue on a shared volume: publish the run for workers to "
+             "evaluate (coordinator), or with --worker, evaluate cells from it"
+    )
+
+    run_parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as a worker leasing cells from --queue"
+    )
+
+    run_parser.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help="Run for a worker to join (default: the most recently published run)"
+    )
+
+    run_parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=900.0,
+        help="Seconds before a dead worker's cells are handed out again (default: 900)"
+    )
+
+    run_parser.add_argument(
+        "--queue-max-attempts",
+        type=int,
+        default=3,
+        help="Leases of a cell whose result is an error before it is marked failed (default: 3)"
+    )
+
+    run_parser.add_argument(
+        "--no-wait",
+        action="store_true",
+        help="Coordinator: publish the run and exit without waiting for workers"
+    )
+
+    run_parser.add_argument(
         "--skip-validation",
         action="store_true",
         help="Skip Ollama connection validation"
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
         "--list-tasks",
         action="store_true",
         help="List all available tasks and exit"
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
         "--list-models",
         action="store_true",
         help="List all configured models and exit"
     )
 
-    parser.add_argument(
+    run_parser.add_argument(
         "--validate-tasks",
         action="store_true",
         help="Validate task definitions and show completion status"
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def list_tasks(registry: TaskRegistry):
@@ -121,7 +400,8 @@ def list_tasks(registry: TaskRegistry):
     table.add_column("Category", style="magenta")
     table.add_column("Complete", style="bold")
 
-    for task in registry.get_all_tasks():
+    tasks = registry.get_all_tasks()
+    for task in tasks:
         complete = "Yes" if task.is_complete else "No"
         complete_style = "green" if task.is_complete else "red"
         table.add_row(
@@ -132,7 +412,7 @@ def list_tasks(registry: TaskRegistry):
         )
 
     console.print(table)
-    console.print(f"\nTotal tasks: {len(registry.get_all_tasks())}")
+    console.print(f"\nTotal tasks: {len(tasks)}")
     console.print(f"Complete: {registry.count_complete_tasks()}")
     console.print(f"Incomplete: {registry.count_incomplete_tasks()}\n")
 
@@ -165,6 +445,37 @@ def list_models():
     console.print(f"\nTotal models: {len(MODELS)}\n")
 
 
+def parse_ollama_options(pairs: list) -> dict:
+    """Parse KEY=VALUE pairs into Ollama options.
+
+    Values are read as JSON where possible (numbers, booleans, lists) and
+    kept as strings otherwise.
+    """
+    options = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key.strip():
+            raise ValueError(f"Expected KEY=VALUE for --ollama-option, got: {pair}")
+        try:
+            options[key.strip()] = json.loads(value)
+        except json.JSONDecodeError:
+            options[key.strip()] = value
+    return options
+
+
+def parse_datasets(pairs: list) -> dict:
+    """Parse TASK_ID=PATH pairs into datasets by task ID."""
+    datasets = {}
+    for pair in pairs:
+        task_id, sep, path = pair.partition("=")
+        if not sep or not task_id.strip() or not path.strip():
+            raise ValueError(f"Expected TASK_ID=PATH for --dataset, got: {pair}")
+        if not Path(path).is_file():
+            raise ValueError(f"Dataset file not found: {path}")
+        datasets[task_id.strip()] = TaskDataset(Path(path))
+    return datasets
+
+
 def validate_tasks(registry: TaskRegistry):
     """Validate all task definitions and show completion status."""
     from rich.table import Table
@@ -200,30 +511,78 @@ def validate_tasks(registry: TaskRegistry):
         )
 
 
-def main():
-    """Main entry point."""
-    args = parse_args()
+def load_script(filename: str):
+    """Import a sibling script as a module."""
+    spec = importlib.util.spec_from_file_location(
+        Path(filename).stem, Path(__file__).parent / filename
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+
+    Args:
+        argv: Arguments after the program name (default: sys.argv)
+
+    Returns:
+        Exit status of the report and plot subcommands, otherwise None
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in SCRIPT_COMMANDS:
+        return load_script(SCRIPT_COMMANDS[argv[0]]).main(argv[1:])
+
+    args = parse_args(argv)
 
     # Setup logging
     setup_logging(args.verbose)
 
+    command = args.command
+    if command == "run":
+        if args.list_tasks:
+            command = "list-tasks"
+        elif args.list_models:
+            command = "list-models"
+        elif args.validate_tasks:
+            command = "validate"
+
+    # Handle list/validation commands
+    if command == "list-models":
+        list_models()
+        return
+
     # Initialize task registry
     console.print("[bold cyan]Loading tasks...[/bold cyan]")
     registry = TaskRegistry()
 
-    # Handle list/validation commands
-    if args.list_tasks:
+    if command == "list-tasks":
         list_tasks(registry)
         return
 
-    if args.list_models:
-        list_models()
-        return
-
-    if args.validate_tasks:
+    if command == "validate":
         validate_tasks(registry)
         return
 
+    run(args, registry)
+
+
+def run(args: argparse.Namespace, registry: TaskRegistry):
+    """Run (or publish, or work on) an evaluation.
+
+    Args:
+        args: Parsed arguments of the run subcommand
+        registry: Task registry
+    """
+    from llm_eval.evaluation.evaluator import Evaluator
+    from llm_eval.evaluation.work_queue import WorkQueue
+    from llm_eval.models.endpoint_pool import OllamaEndpointPool
+    from llm_eval.models.ollama_client import OllamaClient
+    from llm_eval.models.resilience import CircuitBreaker, RetryPolicy
+    from llm_eval.models.response_cache import ResponseCache
+    from llm_eval.results.storage import ResultsStorage
+
     # Filter tasks if specified
     if args.tasks:
         task_ids = [t.strip() for t in args.tasks.split(",")]
@@ -236,6 +595,24 @@ def main():
     else:
         tasks = registry.get_all_tasks()
 
+    if args.dataset:
+        try:
+            datasets = parse_datasets(args.dataset)
+        except ValueError as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            return
+        unknown = set(datasets) - {task.id for task in tasks}
+        if unknown:
+            console.print(
+                f"[bold red]Error:[/bold red] --dataset for task(s) not being run: "
+                f"{', '.join(sorted(unknown))}"
+            )
+            return
+        tasks = [
+            replace(task, dataset=datasets[task.id]) if task.id in datasets else task
+            for task in tasks
+        ]
+
     # Filter models if specified
     if args.models:
         model_keys = [m.strip() for m in args.models.split(",")]
@@ -252,19 +629,147 @@ def main():
     else:
         models = get_all_models()
 
+    if args.ollama_option:
+        try:
+            overrides = parse_ollama_options(args.ollama_option)
+        except ValueError as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            return
+        models = [
+            replace(model, additional_params={**model.additional_params, **overrides})
+            for model in models
+        ]
+
+    if args.few_shot_selection is not None:
+        models = [replace(model, few_shot_selection=args.few_shot_selection) for model in models]
+    if args.prompt_token_budget is not None:
+        models = [replace(model, prompt_token_budget=args.prompt_token_budget) for model in models]
+
     # Initialize components
     console.print("[bold cyan]Initializing evaluation system...[/bold cyan]")
-    client = OllamaClient(base_url=args.ollama_url)
-    storage = ResultsStorage(base_path=args.results_dir)
-    evaluator = Evaluator(client, storage)
+    ollama_urls = [url.strip() for url in args.ollama_url.split(",") if url.strip()]
+    if len(ollama_urls) > 1 and args.use_async:
+        console.print("[bold red]Error:[/bold red] --async supports a single --ollama-url")
+        return
 
-    # Run evaluations
-    evaluator.run_evaluation(
-        tasks=tasks,
-        models=models,
-        skip_validation=args.skip_validation
+    retry_policy = RetryPolicy(
+        max_attempts=args.max_attempts,
+        backoff_base=args.retry_backoff,
+        retryable_status_codes=tuple(
+            int(code) for code in args.retry_status_codes.split(",") if code.strip()
+        )
     )
 
+    def circuit_breaker():
+        if args.circuit_breaker_threshold <= 0:
+            return None
+        return CircuitBreaker(args.circuit_breaker_threshold, args.circuit_breaker_reset)
+
+    if len(ollama_urls) > 1:
+        client = OllamaEndpointPool(
+            ollama_urls,
+            pool_size=args.concurrency,
+            retry_policy=retry_policy,
+            circuit_breaker_factory=circuit_breaker
+        )
+    else:
+        client = OllamaClient(
+            base_url=args.ollama_url,
+            pool_size=args.concurrency,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker()
+        )
+    storage = ResultsStorage(
+        base_path=args.results_dir,
+        backend=args.storage_backend,
+        use_index=args.results_index
+    )
+
+    async_client = None
+    if args.use_async:
+        from llm_eval.models.async_ollama_client import AsyncOllamaClient
+
+        try:
+            async_client = AsyncOllamaClient(
+                base_url=args.ollama_url,
+                pool_size=args.concurrency,
+                retry_policy=retry_policy,
+                circuit_breaker=circuit_breaker()
+            )
+        except ImportError as e:
+            console.print(f"[bold red]Error:[/bold red] {e}")
+            return
+
+    response_cache = None
+    if args.cache or args.cache_bypass:
+        response_cache = ResponseCache(
+            args.cache_dir,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            bypass=args.cache_bypass
+        )
+
+    evaluator = Evaluator(
+        client,
+        storage,
+        max_concurrency=args.concurrency,
+        per_model_concurrency=args.per_model_concurrency,
+        async_client=async_client,
+        stream=args.stream,
+        response_cache=response_cache,
+        schedule=args.schedule,
+        keep_alive=args.keep_alive,
+        max_loaded_models=args.max_loaded_models,
+        adaptive_concurrency=args.adaptive_concurrency,
+        n_samples=args.samples
+    )
+
+    resume_run_id = args.resume
+    if resume_run_id == "latest":
+        resume_run_id = storage.get_latest_run_id()
+        if resume_run_id is None:
+            console.print("[bold red]Error:[/bold red] No runs found to resume")
+            return
+
+    if args.queue is not None:
+        queue = WorkQueue(
+            args.queue, lease_seconds=args.lease_seconds, max_attempts=args.queue_max_attempts
+        )
+        try:
+            if args.worker:
+                run_id = args.run_id or queue.latest_run_id()
+                if run_id is None:
+                    console.print(f"[bold red]Error:[/bold red] No runs published in: {args.queue}")
+                    return
+                evaluator.run_worker(
+                    queue,
+                    run_id,
+                    tasks=tasks,
+                    models=models,
+                    skip_validation=args.skip_validation
+                )
+            else:
+                evaluator.publish_evaluation(
+                    queue,
+                    tasks=tasks,
+                    models=models,
+                    resume_run_id=resume_run_id,
+                    wait_for_workers=not args.no_wait
+                )
+        finally:
+            client.close()
+        return
+
+    # Run evaluations
+    try:
+        evaluator.run_evaluation(
+            tasks=tasks,
+            models=models,
+            skip_validation=args.skip_validation,
+            resume_run_id=resume_run_id
+        )
+    finally:
+        client.close()
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
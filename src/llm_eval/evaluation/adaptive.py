@@ -0,0 +1,119 @@
+"""Adaptive concurrency limit driven by observed generation latency."""
+
+import logging
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on in-flight generation requests.
+
+    The signal is latency per generated token, tracked per model against a
+    baseline: the lowest value among that model's recent samples. While new
+    samples stay within ``tolerance`` times the baseline the server is
+    keeping up and the limit grows; once they exceed it requests are
+    queueing on the server and the limit is cut by ``decrease_factor``.
+    Failed requests count as congestion too.
+
+    Growth starts in slow start (+1 per good sample, doubling the limit
+    every round) and switches to additive increase (+1 per ``limit`` good
+    samples) after the first decrease. Only one decrease happens per round
+    of in-flight requests, since requests sent before the cut report the
+    same congestion.
+
+    Thread-safe; the limit is read by the dispatcher and updated by workers.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int = 1,
+        tolerance: float = 1.5,
+        decrease_factor: float = 0.7,
+        baseline_window: int = 100
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Upper bound for the limit
+            min_limit: Lower bound for the limit (default: 1)
+            initial_limit: Starting limit (default: 1)
+            tolerance: Latency-per-token ratio to the baseline treated as
+                congestion (default: 1.5)
+            decrease_factor: Multiplier applied to the limit on congestion
+                (default: 0.7)
+            baseline_window: Recent samples per model the baseline is taken
+                from (default: 100)
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                f"Adaptive concurrency needs 1 <= min_limit <= max_limit, "
+                f"got {min_limit} and {max_limit}"
+            )
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.tolerance = tolerance
+        self.decrease_factor = decrease_factor
+
+        self._lock = threading.Lock()
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._slow_start = True
+        self._good_samples = 0
+        self._samples_since_decrease = 0
+        self._recent: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=baseline_window))
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        with self._lock:
+            return self._limit
+
+    def on_sample(self, key: str, latency_ms: float, tokens: int, failed: bool = False):
+        """Record a finished request and adjust the limit.
+
+        Args:
+            key: Model name; each model has its own latency baseline
+            latency_ms: Client-measured request time
+            tokens: Number of generated tokens
+            failed: Whether the request failed
+        """
+        with self._lock:
+            self._samples_since_decrease += 1
+            if failed:
+                self._decrease(f"failed request for {key}")
+                return
+
+            per_token = latency_ms / max(tokens, 1)
+            recent = self._recent[key]
+            recent.append(per_token)
+            baseline = min(recent)
+
+            if per_token > baseline * self.tolerance:
+                self._decrease(
+                    f"{key} at {per_token:.1f} ms/token vs baseline {baseline:.1f} ms/token"
+                )
+                return
+
+            self._good_samples += 1
+            if self._slow_start or self._good_samples >= self._limit:
+                self._good_samples = 0
+                if self._limit < self.max_limit:
+                    self._limit += 1
+                    logger.debug(f"Concurrency limit raised to {self._limit}")
+
+    def _decrease(self, reason: str):
+        # Requests dispatched before the last cut are still reporting it
+        if self._samples_since_decrease < self._limit and not self._slow_start:
+            return
+        self._slow_start = False
+        self._good_samples = 0
+        self._samples_since_decrease = 0
+        new_limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        if new_limit != self._limit:
+            logger.info(f"Concurrency limit lowered to {new_limit} ({reason})")
+        self._limit = new_limit
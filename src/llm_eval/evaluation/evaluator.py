@@ -1,41 +1,155 @@
 """Main evaluation orchestrator for running LLM evaluations."""
 
+import asyncio
 import logging
+import os
+import socket
+import threading
 import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
 from ..models.config import ModelConfig
-from ..models.ollama_client import OllamaClient
-from ..prompts.strategies import get_strategy
+from ..models.ollama_client import OllamaClient, build_generate_payload
+from ..models.response_cache import ResponseCache, make_cache_key
+from ..prompts.cache import BuiltPrompt, PromptCache
 from ..results.storage import EvaluationResult, ResultsStorage
 from ..tasks.base import Task
+from ..tasks.dataset import EvaluationItem
+from .adaptive import AdaptiveConcurrencyLimiter
+from .work_queue import WorkQueue
+
+if TYPE_CHECKING:
+    # aiohttp is slow to import and only needed for async runs
+    from ..models.async_ollama_client import AsyncOllamaClient
 
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Orderings for the evaluation matrix:
+#   model  - all cells of one model before the next, so Ollama keeps it loaded
+#   task   - all models for one task before the next task
+#   prefix - like model, with each model's prompts in lexicographic order so
+#            prompts sharing a prefix run back-to-back and Ollama can reuse
+#            the KV cache of the previous prompt
+SCHEDULES = ("model", "task", "prefix")
+
+# Jobs read ahead of the running ones; dataset items beyond this are not
+# read from disk until earlier jobs finish
+DISPATCH_LOOKAHEAD = 1000
+
 
 class Evaluator:
     """Main orchestrator for running LLM evaluations.
 
     This class coordinates tasks, models, prompting strategies, and result storage
     to execute the complete evaluation pipeline.
+
+    Evaluations run one at a time by default. With ``max_concurrency`` above 1
+    they are dispatched to a worker pool, with at most ``per_model_concurrency``
+    requests in flight per model (matching Ollama's OLLAMA_NUM_PARALLEL).
+    When an ``async_client`` is given, the same limits are enforced with
+    asyncio semaphores on a single event loop instead of worker threads.
+
+    The matrix is ordered model-major by default so each model stays resident
+    while its cells run; ``max_loaded_models`` additionally stops concurrent
+    dispatch from interleaving more models than the server can hold at once.
+
+    With ``adaptive_concurrency`` the global cap starts low and is adjusted
+    by an AIMD limiter from observed latency per token, up to
+    ``max_concurrency``.
+
+    Cells of models with ``n_samples`` above 1 are split into one job per
+    sample, each with its own seed, and dispatched like any other cell. The
+    samples are combined into a single result once the last one finishes.
+
+    Tasks with a dataset contribute one cell per item. The matrix holds one
+    entry per (task, model, strategy); items are read from the dataset as
+    jobs are dispatched, with at most DISPATCH_LOOKAHEAD jobs waiting.
     """
 
-    def __init__(self, ollama_client: OllamaClient, storage: ResultsStorage):
+    def __init__(
+        self,
+        ollama_client: OllamaClient,
+        storage: ResultsStorage,
+        max_concurrency: int = 1,
+        per_model_concurrency: Optional[int] = None,
+        async_client: Optional["AsyncOllamaClient"] = None,
+        stream: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        schedule: str = "model",
+        keep_alive: Optional[str] = None,
+        max_loaded_models: Optional[int] = None,
+        adaptive_concurrency: bool = False,
+        n_samples: Optional[int] = None
+    ):
         """Initialize the evaluator.
 
         Args:
             ollama_client: Ollama client for model interactions
             storage: Results storage manager
+            max_concurrency: Global cap on in-flight generation requests (default: 1)
+            per_model_concurrency: Cap on in-flight requests per model
+                (default: same as max_concurrency)
+            async_client: Optional async client; when set, evaluations run on
+                an asyncio event loop instead of a thread pool
+            stream: If True, read responses incrementally and record
+                time-to-first-token and inter-token latency metrics
+            response_cache: Optional cache; identical (model, prompt, options)
+                requests are served from it instead of calling Ollama
+            schedule: Matrix ordering, one of SCHEDULES (default: "model")
+            keep_alive: Ollama keep_alive sent with every request (e.g. "30m")
+            max_loaded_models: Maximum number of models with requests in flight
+                at once (default: unlimited)
+            adaptive_concurrency: Adjust the global cap between 1 and
+                max_concurrency from observed latency (default: False)
+            n_samples: Generations per cell for every model, overriding
+                ModelConfig.n_samples (default: per model)
         """
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Unknown schedule '{schedule}'. Available schedules: {list(SCHEDULES)}")
+        if max_loaded_models is not None and max_loaded_models < 1:
+            raise ValueError(f"max_loaded_models must be at least 1, got {max_loaded_models}")
+        if n_samples is not None and n_samples < 1:
+            raise ValueError(f"n_samples must be at least 1, got {n_samples}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if per_model_concurrency is None:
+            per_model_concurrency = max_concurrency
+        if per_model_concurrency < 1:
+            raise ValueError(
+                f"per_model_concurrency must be at least 1, got {per_model_concurrency}"
+            )
+
         self.client = ollama_client
+        self.async_client = async_client
         self.storage = storage
+        self.stream = stream
+        self.response_cache = response_cache
+        self.prompts = PromptCache()
+        self.max_concurrency = max_concurrency
+        self.per_model_concurrency = min(per_model_concurrency, max_concurrency)
+        self.schedule = schedule
+        self.keep_alive = keep_alive
+        self.max_loaded_models = max_loaded_models
+        self.n_samples = n_samples
+        self._pending_samples: Dict[Tuple, Dict[int, EvaluationResult]] = {}
+        self._samples_lock = threading.Lock()
+        self._completed: Set[Tuple] = set()
+        # Called with (cell, error or None) as each cell finishes; see run_worker
+        self._cell_listener: Optional[Callable[[Tuple, Optional[str]], None]] = None
+        self.limiter: Optional[AdaptiveConcurrencyLimiter] = None
+        if adaptive_concurrency and max_concurrency > 1:
+            self.limiter = AdaptiveConcurrencyLimiter(max_limit=max_concurrency)
         self.run_id = datetime.now().strftime("run_%Y-%m-%d_%H-%M-%S")
 
         logger.info(f"Evaluator initialized with run ID: {self.run_id}")
@@ -44,7 +158,8 @@ class Evaluator:
         self,
         tasks: List[Task],
         models: List[ModelConfig],
-        skip_validation: bool = False
+        skip_validation: bool = False,
+        resume_run_id: Optional[str] = None
     ):
         """Run evaluations for all tasks and models.
 
@@ -52,7 +167,15 @@ class Evaluator:
             tasks: List of Task objects to evaluate
             models: List of ModelConfig objects to use
             skip_validation: If True, skip Ollama connection check
+            resume_run_id: Existing run to continue; cells that already have a
+                successful result are skipped and results are added to that run
         """
+        if resume_run_id is not None:
+            if not (self.storage.raw_dir / resume_run_id).is_dir():
+                console.print(f"[bold red]Error:[/bold red] Run not found: {resume_run_id}")
+                return
+            self.run_id = resume_run_id
+
         # Validate Ollama connection
         if not skip_validation:
             console.print("\n[bold cyan]Checking Ollama connection...[/bold cyan]")
@@ -66,25 +189,247 @@ class Evaluator:
         # Build evaluation matrix
         evaluations = self._build_evaluation_matrix(tasks, models)
 
-        console.print(f"\n[bold green]Starting evaluation run: {self.run_id}[/bold green]")
-        console.print(f"Total evaluations to run: [bold]{len(evaluations)}[/bold]\n")
+        if resume_run_id is not None:
+            evaluations = self._skip_completed(evaluations)
+            console.print(f"\n[bold green]Resuming evaluation run: {self.run_id}[/bold green]")
+        else:
+            console.print(f"\n[bold green]Starting evaluation run: {self.run_id}[/bold green]")
+        console.print(f"Total evaluations to run: [bold]{self._count_cells(evaluations)}[/bold]")
+        console.print(
+            f"Concurrency: [bold]{self.max_concurrency}[/bold]"
+            f"{' (adaptive)' if self.limiter is not None else ''} "
+            f"(per model: {self.per_model_concurrency})\n"
+        )
 
         # Display evaluation plan
         self._display_evaluation_plan(evaluations)
 
+        # Aggregate the summary as results are saved
+        self.storage.track_run(self.run_id)
+
         # Run evaluations with progress tracking
         self._run_evaluations_with_progress(evaluations)
 
         # Generate summary report
         console.print("\n[bold cyan]Generating summary report...[/bold cyan]")
-        self.storage.save_summary_report(self.run_id)
+        summary = self.storage.save_summary_report(self.run_id)
 
         # Display summary
-        self._display_summary()
+        self._display_summary(summary)
 
         console.print(f"\n[bold green]Evaluation complete![/bold green]")
         console.print(f"Results saved in: {self.storage.raw_dir / self.run_id}\n")
 
+    def publish_evaluation(
+        self,
+        queue: WorkQueue,
+        tasks: List[Task],
+        models: List[ModelConfig],
+        resume_run_id: Optional[str] = None,
+        wait_for_workers: bool = True,
+        poll_interval: float = 5.0
+    ):
+        """Publish the evaluation matrix to a work queue for workers to run.
+
+        Args:
+            queue: Work queue shared with the workers
+            tasks: List of Task objects to evaluate
+            models: List of ModelConfig objects to use
+            resume_run_id: Existing run to continue; only cells without a
+                successful result are published again
+            wait_for_workers: If True, show progress until every cell is
+                finished, then generate the summary report (default: True)
+            poll_interval: Seconds between progress checks (default: 5)
+        """
+        if resume_run_id is not None:
+            if not (self.storage.raw_dir / resume_run_id).is_dir():
+                console.print(f"[bold red]Error:[/bold red] Run not found: {resume_run_id}")
+                return
+            self.run_id = resume_run_id
+
+        evaluations = self._build_evaluation_matrix(tasks, models)
+        if resume_run_id is not None:
+            evaluations = self._skip_completed(evaluations)
+
+        queue.publish(self.run_id, map(self._cell_of, self._iter_cells(evaluations)))
+        # Cells a previous attempt finished with an error run again
+        queue.requeue(self.run_id, map(self._cell_of, self._iter_cells(evaluations)))
+
+        console.print(f"\n[bold green]Published evaluation run: {self.run_id}[/bold green]")
+        console.print(f"Cells queued: [bold]{self._count_cells(evaluations)}[/bold] in {queue.db_path}")
+        console.print(
+            f"Start workers with: [bold]--queue {queue.db_path} --worker "
+            f"--run-id {self.run_id}[/bold]\n"
+        )
+        self._display_evaluation_plan(evaluations)
+
+        if not wait_for_workers:
+            return
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console
+        ) as progress:
+            counts = queue.progress(self.run_id)
+            task_progress = progress.add_task("[cyan]Waiting for workers...", total=counts["total"])
+            while counts["pending"] or counts["leased"]:
+                progress.update(
+                    task_progress,
+                    completed=counts["done"] + counts["failed"],
+                    description=f"[cyan]Waiting for workers ({counts['leased']} leased)..."
+                )
+                time.sleep(poll_interval)
+                counts = queue.progress(self.run_id)
+            progress.update(task_progress, completed=counts["total"])
+
+        for (task_id, model_name, strategy, item_id), error in queue.failures(self.run_id):
+            item = f" item {item_id}" if item_id is not None else ""
+            console.print(
+                f"[bold red]Error:[/bold red] Failed to evaluate {task_id}{item} with "
+                f"{model_name} using {strategy}: {error}"
+            )
+
+        console.print("\n[bold cyan]Generating summary report...[/bold cyan]")
+        summary = self.storage.save_summary_report(self.run_id)
+        self._display_summary(summary)
+
+        console.print(f"\n[bold green]Evaluation complete![/bold green]")
+        console.print(f"Results saved in: {self.storage.raw_dir / self.run_id}\n")
+
+    def run_worker(
+        self,
+        queue: WorkQueue,
+        run_id: str,
+        tasks: List[Task],
+        models: List[ModelConfig],
+        worker_id: Optional[str] = None,
+        skip_validation: bool = False,
+        poll_interval: float = 5.0
+    ):
+        """Lease cells of a published run from a work queue and evaluate them.
+
+        Cells are resolved against the given tasks and models by task ID,
+        dataset item ID and model name, run with this evaluator's execution settings and saved to
+        its storage, which should be shared with the coordinator. Leases are
+        renewed while the worker is alive. Each cell is marked done as soon
+        as its result is saved; a cell whose result is an error goes back to
+        the queue until it runs out of attempts (see WorkQueue.retry). A
+        crashed worker's unfinished cells are run again by another worker
+        after the lease expires.
+
+        Args:
+            queue: Work queue shared with the coordinator
+            run_id: Run to work on
+            tasks: Tasks available to this worker
+            models: Models available to this worker
+            worker_id: Identifier for leases (default: hostname and PID)
+            skip_validation: If True, skip Ollama connection check
+            poll_interval: Seconds to wait when no cell is available (default: 5)
+        """
+        self.run_id = run_id
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        tasks_by_id = {task.id: task for task in tasks}
+        models_by_name = {model.name: model for model in models}
+
+        if not skip_validation:
+            console.print("\n[bold cyan]Checking Ollama connection...[/bold cyan]")
+            if not self.client.test_connection():
+                console.print(
+                    "[bold red]Error:[/bold red] Could not connect to Ollama. "
+                    "Make sure Ollama is running (try: ollama serve)"
+                )
+                return
+
+        console.print(f"\n[bold green]Worker {worker_id} joining run: {run_id}[/bold green]\n")
+
+        stop = threading.Event()
+
+        def renew_leases():
+            while not stop.wait(queue.lease_seconds / 3):
+                queue.renew(run_id, worker_id)
+
+        heartbeat = threading.Thread(target=renew_leases, name="lease-heartbeat", daemon=True)
+        heartbeat.start()
+
+        finished: Set[Tuple] = set()
+
+        def cell_finished(cell: Tuple, error: Optional[str]):
+            finished.add(cell)
+            if error is None:
+                queue.complete(run_id, cell, worker_id)
+            elif queue.retry(run_id, cell, worker_id, error):
+                logger.warning(f"Requeued {'/'.join(filter(None, cell))} after error: {error}")
+
+        self._cell_listener = cell_finished
+        evaluated = 0
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console
+            ) as progress:
+                task_progress = progress.add_task("[cyan]Running evaluations...", total=None)
+
+                while True:
+                    cells = queue.lease(run_id, worker_id, limit=2 * self.max_concurrency)
+                    if not cells:
+                        counts = queue.progress(run_id)
+                        if not counts["pending"] and not counts["leased"]:
+                            break
+                        # Other workers hold the rest; their leases may still expire
+                        time.sleep(poll_interval)
+                        continue
+
+                    evaluations = []
+                    for cell in cells:
+                        task_id, model_name, strategy, item_id = cell
+                        if task_id not in tasks_by_id or model_name not in models_by_name:
+                            queue.fail(
+                                run_id, cell, worker_id,
+                                f"Worker {worker_id} has no task '{task_id}' or model '{model_name}'"
+                            )
+                            continue
+                        item = tasks_by_id[task_id].get_item(item_id)
+                        if item_id is not None and item is None:
+                            queue.fail(
+                                run_id, cell, worker_id,
+                                f"Worker {worker_id} has no item '{item_id}' in the dataset of '{task_id}'"
+                            )
+                            continue
+                        evaluations.append({
+                            "task": tasks_by_id[task_id],
+                            "model": models_by_name[model_name],
+                            "strategy": strategy,
+                            "item": item
+                        })
+
+                    counts = queue.progress(run_id)
+                    progress.update(
+                        task_progress,
+                        total=counts["total"],
+                        completed=counts["done"] + counts["failed"]
+                    )
+                    self._dispatch(evaluations, progress, task_progress)
+
+                    # Cells that never saved a result (e.g. a sample raised)
+                    for eval_config in evaluations:
+                        cell = self._cell_of(eval_config)
+                        if cell not in finished:
+                            cell_finished(cell, "Evaluation did not produce a result")
+                    finished.clear()
+                    evaluated += len(evaluations)
+        finally:
+            self._cell_listener = None
+            stop.set()
+            heartbeat.join()
+
+        console.print(f"\n[bold green]Worker finished:[/bold green] {evaluated} evaluation(s) run\n")
+
     def _build_evaluation_matrix(
         self,
         tasks: List[Task],
@@ -92,12 +437,14 @@ class Evaluator:
     ) -> List[Dict]:
         """Build the matrix of all evaluations to run.
 
+        Dataset items are not expanded here; see _iter_cells.
+
         Args:
             tasks: List of tasks
             models: List of models
 
         Returns:
-            List of evaluation configurations
+            List of evaluation configurations, one per (task, model, strategy)
         """
         evaluations = []
         skipped_tasks = []
@@ -125,8 +472,93 @@ class Evaluator:
                 f"{', '.join(skipped_tasks)}\n"
             )
 
+        model_order = {model.name: i for i, model in enumerate(models)}
+        if self.schedule == "model":
+            # Stable sort keeps task order within each model
+            evaluations.sort(key=lambda e: model_order[e["model"].name])
+        elif self.schedule == "prefix":
+            # Sorted prompts place every shared prefix next to each other
+            evaluations.sort(key=lambda e: (
+                model_order[e["model"].name],
+                self._build_prompt(e["task"], e["model"], e["strategy"]).text
+            ))
+
         return evaluations
 
+    def _skip_completed(self, evaluations: List[Dict]) -> List[Dict]:
+        """Drop cells that already have a successful result in this run.
+
+        Completed dataset items are remembered and skipped as items are
+        read, since the matrix does not list them.
+
+        Args:
+            evaluations: Full evaluation matrix
+
+        Returns:
+            Matrix entries with cells that are missing or previously failed
+        """
+        total = self._count_cells(evaluations)
+        self._completed = self.storage.get_completed_cells(self.run_id)
+        remaining = [
+            eval_config for eval_config in evaluations
+            if self._remaining_items(eval_config, self._completed_items()) > 0
+        ]
+
+        console.print(
+            f"[cyan]Resume:[/cyan] {total - self._count_cells(remaining)} of "
+            f"{total} evaluation(s) already completed"
+        )
+        return remaining
+
+    def _completed_items(self) -> Counter:
+        """Completed dataset items per (task_id, model_name, strategy)."""
+        return Counter(key[:3] for key in self._completed if key[3] is not None)
+
+    def _remaining_items(self, eval_config: Dict, completed_items: Counter) -> int:
+        """Cells of a matrix entry that have not completed."""
+        task = eval_config["task"]
+        if task.dataset is None:
+            return 0 if self._cell_of(eval_config) in self._completed else 1
+        key = (task.id, eval_config["model"].name, eval_config["strategy"])
+        return max(0, task.item_count() - completed_items[key])
+
+    def _count_cells(self, evaluations: List[Dict]) -> int:
+        """Number of cells still to run for matrix entries."""
+        completed_items = self._completed_items()
+        return sum(self._remaining_items(eval_config, completed_items) for eval_config in evaluations)
+
+    @staticmethod
+    def _cell_of(eval_config: Dict) -> Tuple[str, str, str, Optional[str]]:
+        """Cell key of an evaluation configuration, like EvaluationResult.cell_key."""
+        item = eval_config.get("item")
+        return (
+            eval_config["task"].id,
+            eval_config["model"].name,
+            eval_config["strategy"],
+            item.id if item is not None else None
+        )
+
+    def _iter_cells(self, evaluations: Iterable[Dict]) -> Iterator[Dict]:
+        """Expand matrix entries into one configuration per dataset item.
+
+        Items are read lazily; completed cells of a resumed run are skipped.
+        Configurations that already name an item (worker leases) pass through.
+
+        Args:
+            evaluations: Matrix entries
+
+        Yields:
+            Evaluation configurations with an ``item`` (None without a dataset)
+        """
+        for eval_config in evaluations:
+            if "item" in eval_config:
+                yield eval_config
+                continue
+            for item in eval_config["task"].iter_items():
+                cell = {**eval_config, "item": item}
+                if self._cell_of(cell) not in self._completed:
+                    yield cell
+
     def _display_evaluation_plan(self, evaluations: List[Dict]):
         """Display a table showing the evaluation plan.
 
@@ -137,12 +569,15 @@ class Evaluator:
         table.add_column("Task", style="cyan")
         table.add_column("Model", style="magenta")
         table.add_column("Strategy", style="green")
+        table.add_column("Items", justify="right")
 
+        completed_items = self._completed_items()
         for eval_config in evaluations:
             table.add_row(
                 eval_config["task"].name,
                 eval_config["model"].display_name,
-                eval_config["strategy"]
+                eval_config["strategy"],
+                str(self._remaining_items(eval_config, completed_items))
             )
 
         console.print(table)
@@ -164,33 +599,367 @@ class Evaluator:
 
             task_progress = progress.add_task(
                 "[cyan]Running evaluations...",
-                total=len(evaluations)
+                total=self._count_cells(evaluations)
             )
+            self._dispatch(evaluations, progress, task_progress)
+
+    def _dispatch(self, evaluations: List[Dict], progress: Progress, task_progress):
+        """Run evaluations with the configured execution mode.
+
+        Args:
+            evaluations: List of evaluation configurations
+            progress: Active rich Progress instance
+            task_progress: Progress task ID to advance
+        """
+        for batch in self._model_batches(evaluations):
+            jobs = self._expand_samples(self._iter_cells(batch))
+            if self.async_client is not None:
+                asyncio.run(self._arun_evaluations(jobs, progress, task_progress))
+            elif self.max_concurrency == 1:
+                for eval_config in jobs:
+                    try:
+                        self._evaluate_and_save(eval_config)
+                    except Exception as e:
+                        self._report_failure(eval_config, e)
+
+                    self._advance_progress(progress, task_progress, eval_config)
+            else:
+                self._run_evaluations_concurrently(jobs, progress, task_progress)
+
+    def _expand_samples(self, evaluations: Iterable[Dict]) -> Iterator[Dict]:
+        """Split cells with several samples into one job per sample.
+
+        Sample jobs carry ``sample`` (index) and ``n_samples`` and stay next
+        to each other, so a cell's samples are dispatched together.
+
+        Args:
+            evaluations: Evaluation configurations, one per cell
+
+        Yields:
+            Evaluation configurations, one per generation
+        """
+        for eval_config in evaluations:
+            n_samples = self.n_samples or eval_config["model"].n_samples
+            if n_samples == 1:
+                yield eval_config
+                continue
+            for sample in range(n_samples):
+                yield {**eval_config, "sample": sample, "n_samples": n_samples}
+
+    @staticmethod
+    def _sample_seed(eval_config: Dict) -> Optional[int]:
+        """Seed of a sample job: the model's base seed (default 0) plus the sample index."""
+        if "sample" not in eval_config:
+            return None
+        return eval_config["model"].additional_params.get("seed", 0) + eval_config["sample"]
+
+    def _model_batches(self, evaluations: List[Dict]) -> List[List[Dict]]:
+        """Split evaluations so each batch touches at most max_loaded_models models.
+
+        Batches run one after another, so models from different batches are
+        never in flight at the same time.
+
+        Args:
+            evaluations: Ordered evaluation configurations
+
+        Returns:
+            List of evaluation batches, preserving order within each model
+        """
+        if self.max_loaded_models is None:
+            return [evaluations] if evaluations else []
+
+        by_model: Dict[str, List[Dict]] = {}
+        for eval_config in evaluations:
+            by_model.setdefault(eval_config["model"].name, []).append(eval_config)
+
+        groups = list(by_model.values())
+        return [
+            [eval_config for group in groups[i:i + self.max_loaded_models] for eval_config in group]
+            for i in range(0, len(groups), self.max_loaded_models)
+        ]
+
+    def _run_evaluations_concurrently(
+        self,
+        evaluations: Iterable[Dict],
+        progress: Progress,
+        task_progress
+    ):
+        """Dispatch evaluations to a worker pool with per-model limits.
+
+        Work is queued per model and submitted round-robin, so a model that
+        has reached its in-flight limit never blocks workers that could be
+        serving another model. At most DISPATCH_LOOKAHEAD jobs are taken from
+        ``evaluations`` ahead of completion. Progress is only touched from
+        this thread.
+
+        Args:
+            evaluations: Evaluation configurations, possibly a lazy iterator
+            progress: Active rich Progress instance
+            task_progress: Progress task ID to advance
+        """
+        jobs = iter(evaluations)
+        pending: Dict[str, Deque[Dict]] = defaultdict(deque)
+        queued = 0
+        exhausted = False
+
+        in_flight: Dict[str, int] = defaultdict(int)
+        futures: Dict[Future, Dict] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="evaluator"
+        ) as executor:
+            while True:
+                # Read ahead, keeping queued plus running jobs bounded
+                if not exhausted:
+                    for eval_config in islice(jobs, DISPATCH_LOOKAHEAD - queued - len(futures)):
+                        pending[eval_config["model"].name].append(eval_config)
+                        queued += 1
+                    exhausted = queued + len(futures) < DISPATCH_LOOKAHEAD
+                if not pending and not futures:
+                    break
 
-            for eval_config in evaluations:
+                # Fill free slots, honouring both the global and per-model caps
+                for model_name in list(pending):
+                    queue = pending[model_name]
+                    while (
+                        queue
+                        and in_flight[model_name] < self.per_model_concurrency
+                        and len(futures) < self._concurrency_limit()
+                    ):
+                        eval_config = queue.popleft()
+                        queued -= 1
+                        future = executor.submit(self._evaluate_and_save, eval_config)
+                        futures[future] = eval_config
+                        in_flight[model_name] += 1
+                    if not queue:
+                        del pending[model_name]
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    eval_config = futures.pop(future)
+                    in_flight[eval_config["model"].name] -= 1
+
+                    error = future.exception()
+                    if error is not None:
+                        self._report_failure(eval_config, error)
+
+                    self._advance_progress(progress, task_progress, eval_config)
+
+    async def _arun_evaluations(
+        self,
+        evaluations: Iterable[Dict],
+        progress: Progress,
+        task_progress
+    ):
+        """Run evaluations on the event loop, bounded by semaphores.
+
+        Every cell becomes a coroutine; a per-model semaphore is acquired
+        before a global slot so a waiting cell never holds a global slot.
+        Global slots are counted against the current concurrency limit.
+        At most DISPATCH_LOOKAHEAD coroutines exist at once.
+
+        Args:
+            evaluations: Evaluation configurations, possibly a lazy iterator
+            progress: Active rich Progress instance
+            task_progress: Progress task ID to advance
+        """
+        in_flight = 0
+        slot_freed = asyncio.Condition()
+        model_limits: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_model_concurrency)
+        )
+
+        async def evaluate(eval_config: Dict) -> Optional[EvaluationResult]:
+            nonlocal in_flight
+            async with model_limits[eval_config["model"].name]:
+                async with slot_freed:
+                    await slot_freed.wait_for(lambda: in_flight < self._concurrency_limit())
+                    in_flight += 1
                 try:
-                    result = self._run_single_evaluation(
+                    result = await self._arun_single_evaluation(
                         eval_config["task"],
                         eval_config["model"],
-                        eval_config["strategy"]
-                    )
-                    self.storage.save_result(result, run_id=self.run_id)
-
-                except Exception as e:
-                    logger.error(f"Evaluation failed: {e}")
-                    console.print(
-                        f"[bold red]Error:[/bold red] Failed to evaluate "
-                        f"{eval_config['task'].id} with {eval_config['model'].name} "
-                        f"using {eval_config['strategy']}: {e}"
+                        eval_config["strategy"],
+                        seed=self._sample_seed(eval_config),
+                        item=eval_config.get("item")
                     )
+                finally:
+                    async with slot_freed:
+                        in_flight -= 1
+                        slot_freed.notify_all()
+            self._record_latency(result)
+            return self._save_job_result(eval_config, result)
+
+        async def tracked(eval_config: Dict):
+            try:
+                await evaluate(eval_config)
+            except Exception as e:
+                self._report_failure(eval_config, e)
+            self._advance_progress(progress, task_progress, eval_config)
+
+        jobs = iter(evaluations)
+        running: Set[asyncio.Task] = set()
+        try:
+            while True:
+                for eval_config in islice(jobs, DISPATCH_LOOKAHEAD - len(running)):
+                    running.add(asyncio.ensure_future(tracked(eval_config)))
+                if not running:
+                    break
+                _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            await self.async_client.aclose()
+
+    def _evaluate_and_save(self, eval_config: Dict) -> Optional[EvaluationResult]:
+        """Run one evaluation job and persist its result.
+
+        Args:
+            eval_config: Evaluation configuration from the matrix
+
+        Returns:
+            The saved EvaluationResult, or None while a cell still has
+            samples outstanding
+        """
+        result = self._run_single_evaluation(
+            eval_config["task"],
+            eval_config["model"],
+            eval_config["strategy"],
+            seed=self._sample_seed(eval_config),
+            item=eval_config.get("item")
+        )
+        self._record_latency(result)
+        return self._save_job_result(eval_config, result)
+
+    def _save_job_result(
+        self,
+        eval_config: Dict,
+        result: EvaluationResult
+    ) -> Optional[EvaluationResult]:
+        """Save a job's result, or hold a sample until its cell is complete.
+
+        Args:
+            eval_config: Evaluation configuration of the job
+            result: Result of the job's generation
 
-                progress.update(task_progress, advance=1)
+        Returns:
+            The saved EvaluationResult, or None if the cell is not complete
+        """
+        if "sample" in eval_config:
+            result = self._collect_sample(eval_config, result)
+            if result is None:
+                return None
+        self.storage.save_result(result, run_id=self.run_id)
+        if self._cell_listener is not None:
+            error = result.response if result.response.startswith("ERROR:") else None
+            self._cell_listener(result.cell_key, error)
+        return result
+
+    def _collect_sample(
+        self,
+        eval_config: Dict,
+        result: EvaluationResult
+    ) -> Optional[EvaluationResult]:
+        """Hold a sample and combine the cell's samples once all have arrived.
+
+        The combined result keeps the first sample's fields and lists every
+        sample under ``samples``. If any sample failed, the cell's response
+        is that error so resuming the run evaluates the cell again.
+
+        Args:
+            eval_config: Sample job configuration
+            result: Result of the sample
+
+        Returns:
+            Combined EvaluationResult, or None if samples are outstanding
+        """
+        with self._samples_lock:
+            collected = self._pending_samples.setdefault(result.cell_key, {})
+            collected[eval_config["sample"]] = result
+            if len(collected) < eval_config["n_samples"]:
+                return None
+            del self._pending_samples[result.cell_key]
+
+        ordered = [collected[sample] for sample in sorted(collected)]
+        samples = [
+            {
+                "seed": self._sample_seed({**eval_config, "sample": sample}),
+                "response": sample_result.response,
+                "generation_time_ms": sample_result.generation_time_ms,
+                "prompt_tokens": sample_result.prompt_tokens,
+                "completion_tokens": sample_result.completion_tokens,
+                "cache_hit": sample_result.cache_hit,
+                "retries": sample_result.retries
+            }
+            for sample, sample_result in zip(sorted(collected), ordered)
+        ]
+
+        combined = replace(ordered[0], samples=samples)
+        failed = next((r for r in ordered if r.response.startswith("ERROR:")), None)
+        if failed is not None:
+            combined.response = failed.response
+        return combined
+
+    def _concurrency_limit(self) -> int:
+        """Current global cap on in-flight requests."""
+        if self.limiter is None:
+            return self.max_concurrency
+        return self.limiter.limit
+
+    def _record_latency(self, result: EvaluationResult):
+        """Feed a finished generation to the adaptive limiter."""
+        if self.limiter is None or result.cache_hit:
+            return
+        # Model loading is not a sign of server congestion
+        latency_ms = result.generation_time_ms - (result.load_duration_ms or 0)
+        self.limiter.on_sample(
+            result.model_name,
+            latency_ms,
+            result.completion_tokens,
+            failed=result.response.startswith("ERROR:")
+        )
+
+    def _advance_progress(self, progress: Progress, task_progress, eval_config: Dict):
+        """Advance the progress bar by one job, showing the adaptive limit if enabled.
+
+        Progress counts cells, so each sample of a cell advances a fraction.
+        """
+        advance = 1 / eval_config.get("n_samples", 1)
+        if self.limiter is None:
+            progress.update(task_progress, advance=advance)
+            return
+        progress.update(
+            task_progress,
+            advance=advance,
+            description=(
+                f"[cyan]Running evaluations "
+                f"(concurrency {self.limiter.limit}/{self.max_concurrency})..."
+            )
+        )
+
+    def _report_failure(self, eval_config: Dict, error: BaseException):
+        """Log and display a failed evaluation.
+
+        Args:
+            eval_config: Evaluation configuration that failed
+            error: The raised exception
+        """
+        if self._cell_listener is not None and "sample" not in eval_config:
+            self._cell_listener(self._cell_of(eval_config), f"ERROR: {error}")
+        item = eval_config.get("item")
+        logger.error(f"Evaluation failed: {error}")
+        console.print(
+            f"[bold red]Error:[/bold red] Failed to evaluate "
+            f"{eval_config['task'].id}{f' item {item.id}' if item is not None else ''} "
+            f"with {eval_config['model'].name} using {eval_config['strategy']}: {error}"
+        )
 
     def _run_single_evaluation(
         self,
         task: Task,
         model: ModelConfig,
-        strategy_name: str
+        strategy_name: str,
+        seed: Optional[int] = None,
+        item: Optional[EvaluationItem] = None
     ) -> EvaluationResult:
         """Run a single evaluation.
 
@@ -198,13 +967,22 @@ class Evaluator:
             task: Task to evaluate
             model: Model to use
             strategy_name: Prompting strategy to apply
+            seed: Sampling seed for this generation (default: server default)
+            item: Dataset item to evaluate (default: the task's own input)
 
         Returns:
             EvaluationResult object
         """
-        # Build prompt using strategy
-        strategy = get_strategy(strategy_name)
-        prompt = strategy.build_prompt(task)
+        built = self._build_prompt(task, model, strategy_name, item)
+        prompt = built.text
+
+        cached = self._lookup_cache(model, prompt, seed)
+        if cached is not None:
+            return self._create_result(
+                task, model, strategy_name, prompt,
+                cached["response"], cached["duration_ms"], cache_hit=True, item=item,
+                prompt_hash=built.hash
+            )
 
         # Call Ollama to generate response
         start_time = time.time()
@@ -212,24 +990,177 @@ class Evaluator:
             response = self.client.generate(
                 model=model.name,
                 prompt=prompt,
-                temperature=model.temperature,
-                top_p=model.top_p,
-                max_tokens=model.max_tokens
+                **self._generation_options(model, seed)
             )
-            duration_ms = int((time.time() - start_time) * 1000)
+        except Exception as e:
+            logger.error(f"Generation failed for {task.id}: {e}")
+            response = self._error_response(e)
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        self._store_cache(model, prompt, response, duration_ms, seed)
+        return self._create_result(
+            task, model, strategy_name, prompt, response, duration_ms, item=item,
+            prompt_hash=built.hash
+        )
 
-            # Extract response text and metadata
-            response_text = response.get("response", "")
-            prompt_tokens = response.get("prompt_eval_count", 0)
-            completion_tokens = response.get("eval_count", 0)
+    async def _arun_single_evaluation(
+        self,
+        task: Task,
+        model: ModelConfig,
+        strategy_name: str,
+        seed: Optional[int] = None,
+        item: Optional[EvaluationItem] = None
+    ) -> EvaluationResult:
+        """Run a single evaluation on the async client.
 
+        Produces exactly the same result as _run_single_evaluation.
+
+        Args:
+            task: Task to evaluate
+            model: Model to use
+            strategy_name: Prompting strategy to apply
+            seed: Sampling seed for this generation (default: server default)
+            item: Dataset item to evaluate (default: the task's own input)
+
+        Returns:
+            EvaluationResult object
+        """
+        built = self._build_prompt(task, model, strategy_name, item)
+        prompt = built.text
+
+        cached = self._lookup_cache(model, prompt, seed)
+        if cached is not None:
+            return self._create_result(
+                task, model, strategy_name, prompt,
+                cached["response"], cached["duration_ms"], cache_hit=True, item=item,
+                prompt_hash=built.hash
+            )
+
+        start_time = time.time()
+        try:
+            response = await self.async_client.agenerate(
+                model=model.name,
+                prompt=prompt,
+                **self._generation_options(model, seed)
+            )
         except Exception as e:
             logger.error(f"Generation failed for {task.id}: {e}")
-            # Create error result
-            duration_ms = int((time.time() - start_time) * 1000)
-            response_text = f"ERROR: {str(e)}"
-            prompt_tokens = 0
-            completion_tokens = 0
+            response = self._error_response(e)
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        self._store_cache(model, prompt, response, duration_ms, seed)
+        return self._create_result(
+            task, model, strategy_name, prompt, response, duration_ms, item=item,
+            prompt_hash=built.hash
+        )
+
+    def _build_prompt(
+        self,
+        task: Task,
+        model: ModelConfig,
+        strategy_name: str,
+        item: Optional[EvaluationItem] = None
+    ) -> BuiltPrompt:
+        """Build the prompt for a task (or one of its dataset items) using the named strategy.
+
+        Prompts come from the prompt cache, so samples and retries of a cell
+        and the prefix schedule's sort do not rebuild them. The model's
+        few-shot selection and token budget are passed to the strategy.
+        """
+        return self.prompts.build(task, strategy_name, item, **model.prompt_params)
+
+    def _generation_options(self, model: ModelConfig, seed: Optional[int] = None) -> Dict:
+        """Generation keyword arguments for a model configuration.
+
+        The model's own keep_alive takes precedence over the run-wide one,
+        and a sample seed over the model's seed option.
+        """
+        return {
+            "temperature": model.temperature,
+            "top_p": model.top_p,
+            "max_tokens": model.max_tokens,
+            "stream": self.stream,
+            "keep_alive": model.keep_alive or self.keep_alive,
+            "seed": seed,
+            "options": model.ollama_options
+        }
+
+    @staticmethod
+    def _error_response(error: BaseException) -> Dict:
+        """Stand-in generation response recording a failed call."""
+        return {
+            "response": f"ERROR: {str(error)}",
+            "error": str(error),
+            "retries": getattr(error, "retries", 0)
+        }
+
+    def _cache_key(self, model: ModelConfig, prompt: str, seed: Optional[int] = None) -> str:
+        """Cache key for the exact request that would be sent for a model."""
+        options = self._generation_options(model, seed)
+        options.pop("stream")
+        payload = build_generate_payload(model.name, prompt, **options)
+        return make_cache_key(model.name, prompt, payload["options"])
+
+    def _lookup_cache(
+        self,
+        model: ModelConfig,
+        prompt: str,
+        seed: Optional[int] = None
+    ) -> Optional[Dict]:
+        """Return a cached response entry, or None if caching is off or missed."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(self._cache_key(model, prompt, seed))
+
+    def _store_cache(
+        self,
+        model: ModelConfig,
+        prompt: str,
+        response: Dict,
+        duration_ms: int,
+        seed: Optional[int] = None
+    ):
+        """Cache a successful response; failed generations are never cached."""
+        if self.response_cache is None or "error" in response:
+            return
+        self.response_cache.put(self._cache_key(model, prompt, seed), response, duration_ms)
+
+    def _create_result(
+        self,
+        task: Task,
+        model: ModelConfig,
+        strategy_name: str,
+        prompt: str,
+        response: Dict,
+        duration_ms: int,
+        cache_hit: bool = False,
+        item: Optional[EvaluationItem] = None,
+        prompt_hash: Optional[str] = None
+    ) -> EvaluationResult:
+        """Create an EvaluationResult from a generation response.
+
+        Args:
+            task: Evaluated task
+            model: Model used
+            strategy_name: Prompting strategy applied
+            prompt: The prompt that was sent
+            response: Generation response dict (or error stand-in)
+            duration_ms: Client-measured generation time
+            cache_hit: Whether the response was served from the response cache
+            item: Dataset item that was evaluated, if any
+            prompt_hash: Hash of the prompt, from the prompt cache
+
+        Returns:
+            EvaluationResult object
+        """
+        # Extract response text and metadata
+        response_text = response.get("response", "")
+        prompt_tokens = response.get("prompt_eval_count", 0)
+        completion_tokens = response.get("eval_count", 0)
+        load_duration_ms = self._ns_to_ms(response.get("load_duration"))
+        prompt_eval_duration_ms = self._ns_to_ms(response.get("prompt_eval_duration"))
+        total_duration_ms = self._ns_to_ms(response.get("total_duration"))
+        eval_duration_ms = self._ns_to_ms(response.get("eval_duration"))
 
         # Create evaluation result
         result = EvaluationResult(
@@ -239,22 +1170,58 @@ class Evaluator:
             prompt=prompt,
             response=response_text,
             timestamp=datetime.now().isoformat(),
+            item_id=item.id if item is not None else None,
+            prompt_hash=prompt_hash,
             model_config=model.to_dict(),
             generation_time_ms=duration_ms,
             prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens
+            completion_tokens=completion_tokens,
+            time_to_first_token_ms=response.get("time_to_first_token_ms"),
+            tokens_per_second=response.get("tokens_per_second"),
+            inter_token_latency_ms=response.get("inter_token_latency_ms"),
+            inter_token_latency_p95_ms=response.get("inter_token_latency_p95_ms"),
+            load_duration_ms=load_duration_ms,
+            prompt_eval_duration_ms=prompt_eval_duration_ms,
+            total_duration_ms=total_duration_ms,
+            eval_duration_ms=eval_duration_ms,
+            prompt_tokens_per_second=self._rate(prompt_tokens, response.get("prompt_eval_duration")),
+            eval_tokens_per_second=self._rate(completion_tokens, response.get("eval_duration")),
+            client_overhead_ms=(
+                max(0, duration_ms - total_duration_ms) if total_duration_ms is not None else None
+            ),
+            cache_hit=cache_hit,
+            retries=0 if cache_hit else response.get("retries", 0)
         )
 
         logger.info(
-            f"Completed: {task.id} | {model.name} | {strategy_name} "
-            f"({duration_ms}ms, {completion_tokens} tokens)"
+            f"Completed: {task.id}{f' [{item.id}]' if item is not None else ''} | "
+            f"{model.name} | {strategy_name} "
+            f"({duration_ms}ms, {completion_tokens} tokens"
+            f"{', cached' if cache_hit else ''})"
         )
 
         return result
 
-    def _display_summary(self):
-        """Display a summary of the evaluation run."""
-        summary = self.storage.generate_summary_report(run_id=self.run_id)
+    @staticmethod
+    def _ns_to_ms(duration_ns: Optional[int]) -> Optional[int]:
+        """Convert an Ollama duration in nanoseconds to milliseconds."""
+        return int(duration_ns / 1e6) if duration_ns is not None else None
+
+    @staticmethod
+    def _rate(tokens: int, duration_ns: Optional[int]) -> Optional[float]:
+        """Tokens per second over an Ollama duration, if both are known."""
+        if not tokens or not duration_ns:
+            return None
+        return tokens / (duration_ns / 1e9)
+
+    def _display_summary(self, summary: Optional[Dict] = None):
+        """Display a summary of the evaluation run.
+
+        Args:
+            summary: Summary report of the run (default: generated from storage)
+        """
+        if summary is None:
+            summary = self.storage.generate_summary_report(run_id=self.run_id)
 
         table = Table(title=f"Evaluation Summary - {self.run_id}")
         table.add_column("Metric", style="cyan")
@@ -272,7 +1239,73 @@ class Evaluator:
             "Average Generation Time",
             f"{summary.get('average_generation_time_sec', 0):.2f}s"
         )
+        if "generation_time_percentiles_sec" in summary:
+            percentiles = summary["generation_time_percentiles_sec"]
+            table.add_row(
+                "Generation Time p50 / p90 / p99",
+                f"{percentiles['p50']:.2f}s / {percentiles['p90']:.2f}s / {percentiles['p99']:.2f}s"
+            )
         table.add_row("Total Tokens Generated", str(summary.get("total_tokens_generated", 0)))
+        if "total_load_time_sec" in summary:
+            table.add_row(
+                "Total Model Load Time",
+                f"{summary['total_load_time_sec']:.2f}s"
+            )
+        if "total_prompt_eval_time_sec" in summary:
+            table.add_row(
+                "Total Prompt Eval Time",
+                f"{summary['total_prompt_eval_time_sec']:.2f}s"
+            )
+        if "total_eval_time_sec" in summary:
+            table.add_row("Total Decode Time", f"{summary['total_eval_time_sec']:.2f}s")
+        if "total_client_overhead_sec" in summary:
+            table.add_row(
+                "Total Client Overhead",
+                f"{summary['total_client_overhead_sec']:.2f}s"
+            )
+        if "average_prompt_tokens_per_second" in summary:
+            table.add_row(
+                "Average Prompt Tokens/sec",
+                f"{summary['average_prompt_tokens_per_second']:.1f}"
+            )
+        if "average_eval_tokens_per_second" in summary:
+            table.add_row(
+                "Average Decode Tokens/sec",
+                f"{summary['average_eval_tokens_per_second']:.1f}"
+            )
+        if "average_time_to_first_token_ms" in summary:
+            table.add_row(
+                "Average Time to First Token",
+                f"{summary['average_time_to_first_token_ms'] / 1000:.2f}s"
+            )
+        if "average_tokens_per_second" in summary:
+            table.add_row(
+                "Average Tokens/sec",
+                f"{summary['average_tokens_per_second']:.1f}"
+            )
+        if "sampling" in summary:
+            sampling = summary["sampling"]
+            table.add_row(
+                "Samples",
+                f"{sampling['total_samples']} over {sampling['sampled_cells']} cells"
+            )
+            table.add_row(
+                "Within-Cell Stdev (time / tokens)",
+                f"{sampling['mean_generation_time_stdev_sec']:.2f}s / "
+                f"{sampling['mean_completion_tokens_stdev']:.1f}"
+            )
+            table.add_row(
+                "Distinct Responses per Cell",
+                f"{sampling['mean_distinct_response_ratio']:.0%}"
+            )
+
+        if self.response_cache is not None:
+            cache_stats = self.response_cache.stats()
+            table.add_row(
+                "Response Cache",
+                f"{cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                f"({cache_stats['hit_rate']:.0%})"
+            )
 
         console.print("\n", table, "\n")
 
@@ -280,7 +1313,8 @@ class Evaluator:
         self,
         task: Task,
         model: ModelConfig,
-        strategy_name: str
+        strategy_name: str,
+        item: Optional[EvaluationItem] = None
     ) -> EvaluationResult:
         """Run a single evaluation and return the result without saving.
 
@@ -290,8 +1324,9 @@ class Evaluator:
             task: Task to evaluate
             model: Model to use
             strategy_name: Prompting strategy
+            item: Dataset item to evaluate (default: the task's own input)
 
         Returns:
             EvaluationResult object
         """
-        return self._run_single_evaluation(task, model, strategy_name)
+        return self._run_single_evaluation(task, model, strategy_name, item=item)
@@ -0,0 +1,337 @@
+"""SQLite work queue for distributing evaluation cells across worker processes."""
+
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# A cell is identified by (task_id, model_name, strategy, item_id), like
+# EvaluationResult.cell_key; item_id is None for tasks without a dataset
+Cell = Tuple[str, str, str, Optional[str]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cells (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    item_id TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL DEFAULT 'pending',
+    worker_id TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    UNIQUE (run_id, task_id, model_name, strategy, item_id)
+);
+CREATE INDEX IF NOT EXISTS idx_cells_state ON cells (run_id, state);
+"""
+
+# Cell states:
+#   pending - waiting for a worker
+#   leased  - claimed by a worker until lease_expires
+#   done    - result committed to storage
+#   failed  - could not be run by any worker (e.g. unknown task or model), or
+#             its result was an error on every one of max_attempts leases
+STATES = ("pending", "leased", "done", "failed")
+
+# Stored column value for an item ID; SQLite treats NULLs as distinct in UNIQUE
+_NO_ITEM = ""
+
+
+def _cell_params(cell: Cell) -> Tuple[str, str, str, str]:
+    """Query parameters of a cell."""
+    task_id, model_name, strategy, item_id = cell
+    return task_id, model_name, strategy, item_id if item_id is not None else _NO_ITEM
+
+
+def _row_cell(row: sqlite3.Row) -> Cell:
+    """The cell of a queue row."""
+    return row["task_id"], row["model_name"], row["strategy"], row["item_id"] or None
+
+
+class WorkQueue:
+    """Queue of evaluation cells shared by a coordinator and its workers.
+
+    The coordinator publishes a run's cells in schedule order; workers lease
+    them in that order, run them and mark them done. A lease expires after
+    ``lease_seconds`` unless renewed, so cells held by a worker that died are
+    handed out again. A cell whose result is an error goes back to pending
+    until it has been leased ``max_attempts`` times, and then fails.
+
+    The database can live on a volume shared by all machines. It uses the
+    default rollback journal rather than WAL, since WAL does not work on
+    network file systems. Each method opens its own short transaction, so a
+    WorkQueue can be shared between threads.
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = 900.0, max_attempts: int = 3):
+        """Open (or create) the queue database.
+
+        Args:
+            db_path: Path to the SQLite database file
+            lease_seconds: How long a leased cell stays claimed without renewal
+                (default: 900)
+            max_attempts: Leases of a cell before an error result fails it
+                (default: 3)
+
+        Raises:
+            ValueError: If max_attempts is less than 1
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=60)
+        try:
+            self._migrate(conn)
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """Copy a queue created before item IDs into the current schema.
+
+        The uniqueness constraint changed, which SQLite cannot alter in place.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cells)")}
+        if not columns or "item_id" in columns:
+            return
+        logger.info(f"Migrating work queue {self.db_path} to item IDs")
+        copied = "seq, run_id, task_id, model_name, strategy, state, worker_id, lease_expires, attempts, error"
+        conn.executescript(
+            "BEGIN IMMEDIATE;"
+            "ALTER TABLE cells RENAME TO cells_old;"
+            "DROP INDEX IF EXISTS idx_cells_state;"
+            f"{_SCHEMA}"
+            f"INSERT INTO cells ({copied}) SELECT {copied} FROM cells_old;"
+            "DROP TABLE cells_old;"
+            "COMMIT;"
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection holding the write lock for one transaction."""
+        conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def publish(self, run_id: str, cells: Iterable[Cell]) -> int:
+        """Add a run's cells to the queue.
+
+        Cells already in the queue keep their state, so publishing a run
+        again only adds new cells. Cells are leased in the order given.
+
+        Args:
+            run_id: Run identifier
+            cells: Cells in the order they should run; may be a generator,
+                which is consumed without being held in memory
+
+        Returns:
+            Number of cells added
+        """
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO cells (run_id, task_id, model_name, strategy, item_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((run_id, *_cell_params(cell)) for cell in cells)
+            )
+            added = conn.total_changes - before
+        logger.info(f"Published {added} cell(s) for run {run_id}")
+        return added
+
+    def requeue(self, run_id: str, cells: Iterable[Cell]):
+        """Return finished cells of a run to pending with fresh attempts, e.g. to retry failures.
+
+        Args:
+            run_id: Run identifier
+            cells: Cells to run again
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE cells SET state = 'pending', worker_id = NULL, lease_expires = NULL, "
+                "attempts = 0 WHERE run_id = ? AND task_id = ? AND model_name = ? AND strategy = ? "
+                "AND item_id = ? AND state IN ('done', 'failed')",
+                ((run_id, *_cell_params(cell)) for cell in cells)
+            )
+
+    def lease(self, run_id: str, worker_id: str, limit: int = 1) -> List[Cell]:
+        """Claim up to ``limit`` cells for a worker.
+
+        Pending cells and cells whose lease expired are eligible.
+
+        Args:
+            run_id: Run identifier
+            worker_id: Identifier of the leasing worker
+            limit: Maximum number of cells to claim
+
+        Returns:
+            Claimed cells, in publish order (empty if none are available)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT seq, task_id, model_name, strategy, item_id, state FROM cells "
+                "WHERE run_id = ? AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?)) "
+                "ORDER BY seq LIMIT ?",
+                (run_id, now, limit)
+            ).fetchall()
+            for row in rows:
+                if row["state"] == "leased":
+                    logger.warning(f"Lease expired, re-leasing {'/'.join(filter(None, _row_cell(row)))}")
+            conn.executemany(
+                "UPDATE cells SET state = 'leased', worker_id = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE seq = ?",
+                [(worker_id, now + self.lease_seconds, row["seq"]) for row in rows]
+            )
+        return [_row_cell(row) for row in rows]
+
+    def renew(self, run_id: str, worker_id: str) -> int:
+        """Extend every lease a worker holds in a run.
+
+        Args:
+            run_id: Run identifier
+            worker_id: Identifier of the worker
+
+        Returns:
+            Number of leases renewed
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE cells SET lease_expires = ? "
+                "WHERE run_id = ? AND worker_id = ? AND state = 'leased'",
+                (time.time() + self.lease_seconds, run_id, worker_id)
+            )
+            return cursor.rowcount
+
+    def _finish(self, run_id: str, cell: Cell, worker_id: str, state: str, error: Optional[str]):
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE cells SET state = ?, error = ?, lease_expires = NULL "
+                "WHERE run_id = ? AND task_id = ? AND model_name = ? AND strategy = ? "
+                "AND item_id = ? AND worker_id = ?",
+                (state, error, run_id, *_cell_params(cell), worker_id)
+            )
+
+    def complete(self, run_id: str, cell: Cell, worker_id: str):
+        """Mark a leased cell as done once its result is stored.
+
+        Ignored if the lease expired and another worker took the cell over.
+
+        Args:
+            run_id: Run identifier
+            cell: The finished cell
+            worker_id: Identifier of the worker holding the lease
+        """
+        self._finish(run_id, cell, worker_id, "done", None)
+
+    def fail(self, run_id: str, cell: Cell, worker_id: str, error: str):
+        """Mark a leased cell as failed so no worker picks it up again.
+
+        Args:
+            run_id: Run identifier
+            cell: The cell that cannot be run
+            worker_id: Identifier of the worker holding the lease
+            error: Reason for the failure
+        """
+        self._finish(run_id, cell, worker_id, "failed", error)
+
+    def retry(self, run_id: str, cell: Cell, worker_id: str, error: str) -> bool:
+        """Record an error result of a leased cell, returning it to pending if it has attempts left.
+
+        Args:
+            run_id: Run identifier
+            cell: The cell whose result was an error
+            worker_id: Identifier of the worker holding the lease
+            error: The error, kept for failures()
+
+        Returns:
+            True if the cell will be leased again, False if it failed
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE cells SET state = CASE WHEN attempts < ? THEN 'pending' ELSE 'failed' END, "
+                "error = ?, lease_expires = NULL "
+                "WHERE run_id = ? AND task_id = ? AND model_name = ? AND strategy = ? "
+                "AND item_id = ? AND worker_id = ? AND state = 'leased'",
+                (self.max_attempts, error, run_id, *_cell_params(cell), worker_id)
+            )
+            row = conn.execute(
+                "SELECT state FROM cells WHERE run_id = ? AND task_id = ? AND model_name = ? "
+                "AND strategy = ? AND item_id = ?",
+                (run_id, *_cell_params(cell))
+            ).fetchone()
+        return row is not None and row["state"] == "pending"
+
+    def release(self, run_id: str, cell: Cell, worker_id: str):
+        """Give a leased cell back to the queue without running it.
+
+        Args:
+            run_id: Run identifier
+            cell: The cell to release
+            worker_id: Identifier of the worker holding the lease
+        """
+        self._finish(run_id, cell, worker_id, "pending", None)
+
+    def progress(self, run_id: str) -> Dict[str, int]:
+        """Count a run's cells by state.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Dict mapping each of STATES to its cell count, plus "total"
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT state, COUNT(*) AS n FROM cells WHERE run_id = ? GROUP BY state",
+                (run_id,)
+            ).fetchall()
+        counts = {state: 0 for state in STATES}
+        counts.update({row["state"]: row["n"] for row in rows})
+        counts["total"] = sum(counts[state] for state in STATES)
+        return counts
+
+    def failures(self, run_id: str) -> List[Tuple[Cell, str]]:
+        """Get the failed cells of a run and their errors.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            List of (cell, error) pairs
+        """
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT task_id, model_name, strategy, item_id, error FROM cells "
+                "WHERE run_id = ? AND state = 'failed' ORDER BY seq",
+                (run_id,)
+            ).fetchall()
+        return [(_row_cell(row), row["error"]) for row in rows]
+
+    def latest_run_id(self) -> Optional[str]:
+        """Get the most recently published run ID.
+
+        Returns:
+            Run ID string or None if the queue is empty
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT run_id FROM cells ORDER BY seq DESC LIMIT 1").fetchone()
+        return row["run_id"] if row else None
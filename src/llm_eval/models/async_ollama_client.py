@@ -0,0 +1,339 @@
+"""Asyncio Ollama HTTP API client for high fan-out evaluation runs."""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .ollama_client import StreamAccumulator, build_generate_payload, check_generation_result
+from .resilience import CircuitBreaker, RetryPolicy, acall_with_retry
+
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_timeout(timeout: float) -> "aiohttp.ClientTimeout":
+    """Timeout of a generate request, matching OllamaClient's requests timeout.
+
+    Only connecting and each read are limited, not the whole request, so a
+    long generation keeps streaming as long as chunks keep arriving.
+    """
+    return aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+
+class AsyncOllamaClient:
+    """Async counterpart to OllamaClient built on aiohttp.
+
+    Many requests can be in flight from a single event loop without one OS
+    thread per request. Result dicts are identical to OllamaClient.generate.
+
+    The underlying aiohttp session is created lazily inside the running
+    event loop and discarded by ``aclose()``, so one client can be reused
+    across several ``asyncio.run`` calls.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        pool_size: int = 100,
+        keepalive_timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize async Ollama client.
+
+        Args:
+            base_url: Base URL for Ollama API (default: http://localhost:11434)
+            pool_size: Maximum number of simultaneous connections (default: 100)
+            keepalive_timeout: Seconds to keep idle connections open (default: 30)
+            retry_policy: Retries of failed generate calls (default: no retries)
+            circuit_breaker: Optional breaker that pauses generate calls while
+                the server keeps failing
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncOllamaClient requires aiohttp. "
+                "Install it with: uv sync --extra async"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.generate_endpoint = f"{self.base_url}/api/generate"
+        self.tags_endpoint = f"{self.base_url}/api/tags"
+        self.pool_size = max(1, pool_size)
+        self.keepalive_timeout = keepalive_timeout
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the pooled session, creating it in the current loop if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self):
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def agenerate(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        max_tokens: int = 2048,
+        stream: bool = False,
+        keep_alive: Optional[str] = None,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: int = 600
+    ) -> Dict[str, Any]:
+        """Generate text using an Ollama model.
+
+        Args:
+            model: Model name (e.g., "qwen2.5:1.5b", "deepseek-r1:7b")
+            prompt: The prompt text to send to the model
+            temperature: Sampling temperature (0.0-1.0)
+            top_p: Top-p sampling parameter (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            stream: Read the response incrementally and record streaming
+                latency metrics (default: False)
+            keep_alive: How long to keep the model loaded afterwards (e.g. "30m")
+            seed: Sampling seed, for reproducible or deliberately varied samples
+            options: Further Ollama options, e.g. num_ctx, num_batch, num_thread
+            timeout: Request timeout in seconds (default: 600)
+
+        Returns:
+            Dict with the same fields as OllamaClient.generate
+
+        Raises:
+            aiohttp.ClientError: If the API call fails; the exception's
+                ``retries`` attribute holds the retries made
+            asyncio.TimeoutError: If the request times out
+            ValueError: If the response is invalid
+        """
+        payload = build_generate_payload(
+            model, prompt,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stream=stream,
+            keep_alive=keep_alive,
+            seed=seed,
+            options=options
+        )
+
+        logger.info(f"Generating text with model: {model} (max_tokens: {max_tokens})")
+        logger.debug(f"Prompt length: {len(prompt)} characters")
+
+        result, retries = await acall_with_retry(
+            lambda: self._agenerate_once(model, payload, timeout),
+            self.retry_policy,
+            self.circuit_breaker,
+            description=f"Generation with {model}"
+        )
+        result["retries"] = retries
+        return result
+
+    async def _agenerate_once(
+        self,
+        model: str,
+        payload: Dict[str, Any],
+        timeout: int
+    ) -> Dict[str, Any]:
+        """Send one generate request and return the checked result.
+
+        Args:
+            model: Model name
+            payload: Request payload from build_generate_payload
+            timeout: Request timeout in seconds
+
+        Returns:
+            Generation result dict
+        """
+        try:
+            if payload["stream"]:
+                accumulator = StreamAccumulator()
+                async for chunk in self._aiter_stream(payload, timeout):
+                    accumulator.add(chunk)
+                return check_generation_result(model, accumulator.result())
+
+            async with self._get_session().post(
+                self.generate_endpoint,
+                json=payload,
+                timeout=_generate_timeout(timeout)
+            ) as response:
+                response.raise_for_status()
+                result = await response.json(content_type=None)
+
+            return check_generation_result(model, result)
+
+        except aiohttp.ClientConnectionError:
+            logger.error(
+                f"Could not connect to Ollama at {self.base_url}. "
+                "Make sure Ollama is running (try: ollama serve)"
+            )
+            raise
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error from Ollama API: {e}")
+            raise
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON response from Ollama: {e}")
+            raise ValueError(f"Invalid response from Ollama API: {e}")
+
+    async def astream_generate(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        max_tokens: int = 2048,
+        keep_alive: Optional[str] = None,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: int = 600
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream generation chunks from an Ollama model.
+
+        Ollama streams newline-delimited JSON objects; each is yielded as soon
+        as it arrives. The final chunk has ``done=True`` and carries the
+        timing and token count fields.
+
+        Args:
+            model: Model name
+            prompt: The prompt text to send to the model
+            temperature: Sampling temperature (0.0-1.0)
+            top_p: Top-p sampling parameter (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            keep_alive: How long to keep the model loaded afterwards (e.g. "30m")
+            seed: Sampling seed, for reproducible or deliberately varied samples
+            options: Further Ollama options, e.g. num_ctx, num_batch, num_thread
+            timeout: Timeout in seconds for connecting and between chunks
+                (default: 600)
+
+        Yields:
+            Parsed NDJSON chunk dicts
+
+        Raises:
+            aiohttp.ClientError: If the API call fails
+            ValueError: If a chunk is not valid JSON
+        """
+        payload = build_generate_payload(
+            model, prompt,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stream=True,
+            keep_alive=keep_alive,
+            seed=seed,
+            options=options
+        )
+        async for chunk in self._aiter_stream(payload, timeout):
+            yield chunk
+
+    async def _aiter_stream(
+        self,
+        payload: Dict[str, Any],
+        timeout: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming payload and yield parsed NDJSON chunks.
+
+        Args:
+            payload: Request payload with stream=True
+            timeout: Timeout in seconds for connecting and between chunks
+
+        Yields:
+            Parsed chunk dicts
+        """
+        async with self._get_session().post(
+            self.generate_endpoint,
+            json=payload,
+            timeout=_generate_timeout(timeout)
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Invalid JSON chunk from Ollama: {e}")
+                    raise ValueError(f"Invalid response from Ollama API: {e}")
+
+    async def alist_models(self) -> List[str]:
+        """List all available models in Ollama.
+
+        Returns:
+            List of model names
+
+        Raises:
+            aiohttp.ClientError: If the API call fails
+        """
+        try:
+            async with self._get_session().get(
+                self.tags_endpoint,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+
+            models = [m.get("name", "") for m in data.get("models", [])]
+            logger.info(f"Found {len(models)} available models")
+            return models
+
+        except Exception as e:
+            logger.error(f"Error listing models: {e}")
+            raise
+
+    async def acheck_model_availability(self, model: str) -> bool:
+        """Check if a model is available in Ollama.
+
+        Args:
+            model: Model name to check
+
+        Returns:
+            True if model is available, False otherwise
+        """
+        try:
+            return model in await self.alist_models()
+        except Exception as e:
+            logger.error(f"Error checking model availability: {e}")
+            return False
+
+    async def atest_connection(self) -> bool:
+        """Test connection to Ollama server.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            async with self._get_session().get(
+                self.tags_endpoint,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+            logger.info("Successfully connected to Ollama server")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to Ollama: {e}")
+            return False
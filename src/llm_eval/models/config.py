@@ -1,7 +1,23 @@
 """Model configurations for LLM evaluation."""
 
+import logging
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Options accepted by Ollama's /api/generate "options" object
+OLLAMA_OPTIONS = frozenset({
+    # Model loading and hardware
+    "num_ctx", "num_batch", "num_thread", "num_gpu", "main_gpu", "low_vram",
+    "use_mmap", "use_mlock", "numa", "num_keep",
+    # Sampling
+    "seed", "num_predict", "temperature", "top_k", "top_p", "min_p", "typical_p",
+    "tfs_z", "repeat_last_n", "repeat_penalty", "presence_penalty",
+    "frequency_penalty", "penalize_newline", "mirostat", "mirostat_tau",
+    "mirostat_eta", "stop"
+})
 
 
 @dataclass
@@ -18,7 +34,17 @@ class ModelConfig:
         temperature: Temperature parameter for generation (0.0-1.0)
         top_p: Top-p sampling parameter
         max_tokens: Maximum tokens to generate
-        additional_params: Optional additional Ollama parameters
+        n_samples: Generations per evaluation cell, each with its own seed
+        additional_params: Further Ollama options sent with every request
+            (e.g. num_ctx, num_batch, num_thread, num_gpu, seed, use_mmap,
+            use_mlock); "keep_alive" is sent as the request's keep_alive.
+            temperature, top_p and max_tokens above take precedence
+        few_shot_selection: How few-shot examples are chosen: "first" (in
+            task order) or "similar" (most similar to the evaluation input)
+        prompt_token_budget: Estimated tokens a few-shot prompt may use;
+            examples that do not fit are left out. None derives it from
+            num_ctx (minus max_tokens, if set) when num_ctx is set, and
+            otherwise leaves prompts unlimited
     """
     name: str
     display_name: str
@@ -29,7 +55,42 @@ class ModelConfig:
     temperature: float = 0.7
     top_p: float = 0.9
     max_tokens: int = 2048
+    n_samples: int = 1
     additional_params: Dict = field(default_factory=dict)
+    few_shot_selection: str = "first"
+    prompt_token_budget: Optional[int] = None
+
+    def __post_init__(self):
+        unknown = set(self.additional_params) - OLLAMA_OPTIONS - {"keep_alive"}
+        if unknown:
+            logger.warning(
+                f"Unknown Ollama option(s) for {self.name}: {', '.join(sorted(unknown))}; "
+                f"sending them anyway"
+            )
+
+    @property
+    def ollama_options(self) -> Dict[str, Any]:
+        """Ollama request options from additional_params."""
+        return {k: v for k, v in self.additional_params.items() if k != "keep_alive"}
+
+    @property
+    def keep_alive(self) -> Optional[str]:
+        """keep_alive from additional_params, or None if not set."""
+        value = self.additional_params.get("keep_alive")
+        return str(value) if value is not None else None
+
+    @property
+    def prompt_params(self) -> Dict[str, Any]:
+        """Prompt strategy parameters for this model; empty unless selection is configured."""
+        params: Dict[str, Any] = {}
+        if self.few_shot_selection != "first":
+            params["selection"] = self.few_shot_selection
+        budget = self.prompt_token_budget
+        if budget is None and self.additional_params.get("num_ctx"):
+            budget = int(self.additional_params["num_ctx"]) - max(self.max_tokens, 0)
+        if budget is not None:
+            params["token_budget"] = budget
+        return params
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
@@ -43,7 +104,10 @@ class ModelConfig:
             "temperature": self.temperature,
             "top_p": self.top_p,
             "max_tokens": self.max_tokens,
-            "additional_params": self.additional_params
+            "n_samples": self.n_samples,
+            "additional_params": self.additional_params,
+            "few_shot_selection": self.few_shot_selection,
+            "prompt_token_budget": self.prompt_token_budget
         }
 
 
@@ -0,0 +1,404 @@
+"""Load balancing across several Ollama hosts."""
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ollama_client import OllamaClient
+from .resilience import CircuitBreaker, RetryPolicy, call_with_retry
+
+
+logger = logging.getLogger(__name__)
+
+
+def _create_health_session() -> requests.Session:
+    """Create a small session for health checks, separate from generate traffic.
+
+    The generate session blocks when every pooled connection is busy, which
+    under full load would stall health checks indefinitely. This one never
+    blocks (an extra connection is opened instead) and does not retry, since
+    a failed check is simply repeated on the next poll.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclass
+class _Endpoint:
+    """One Ollama host and its routing state."""
+    client: OllamaClient
+    health_session: requests.Session
+    breaker: Optional[CircuitBreaker] = None
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    healthy: bool = True
+    models: Optional[Set[str]] = None
+    loaded_models: Set[str] = field(default_factory=set)
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+
+class OllamaEndpointPool:
+    """Spread generation requests over several Ollama hosts.
+
+    Exposes the same interface as OllamaClient, so it can be passed to the
+    Evaluator in its place. Each request goes to the healthy host with the
+    fewest outstanding requests among those that have the model, preferring
+    hosts where the model is already loaded to avoid model swaps.
+
+    A background thread polls every host's ``/api/tags`` (and ``/api/ps``
+    for loaded models). Hosts that fail ``failure_threshold`` consecutive
+    requests or a health check are ejected and rejoin once a health check
+    succeeds. Requests that fail to connect are retried on another host
+    right away; other failures are only retried as ``retry_policy`` allows.
+
+    With circuit breakers, each host has its own, kept by the pool: hosts
+    whose circuit is open are skipped, so requests fail over to the other
+    hosts, and only once every circuit is open do callers wait for the
+    first to let a probe through.
+    """
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        health_check_interval: float = 30.0,
+        failure_threshold: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker_factory: Optional[Callable[[], CircuitBreaker]] = None
+    ):
+        """Initialize the pool and run an initial health check.
+
+        Args:
+            base_urls: Base URLs of the Ollama hosts
+            pool_size: Pooled keep-alive connections per host (default: 10)
+            max_retries: Connection-level retries per request (default: 3)
+            backoff_factor: Backoff factor between connection retries in seconds
+            health_check_interval: Seconds between health checks; 0 disables
+                the background thread (default: 30)
+            failure_threshold: Consecutive failures before a host is ejected
+                (default: 3)
+            retry_policy: Retries of failed generate calls; each retry picks
+                a host again (default: no retries). The hosts' own clients
+                make a single attempt
+            circuit_breaker_factory: Creates one circuit breaker per host;
+                hosts with an open circuit are skipped while any other host
+                can take the request
+
+        Raises:
+            ValueError: If no base URLs are given
+        """
+        if not base_urls:
+            raise ValueError("OllamaEndpointPool needs at least one base URL")
+
+        unique_urls = list(dict.fromkeys(url.rstrip("/") for url in base_urls))
+        if len(unique_urls) < len(base_urls):
+            logger.warning("Ignoring duplicate Ollama host URLs")
+        self.endpoints = [
+            _Endpoint(
+                OllamaClient(url, pool_size, max_retries, backoff_factor),
+                _create_health_session(),
+                breaker=circuit_breaker_factory() if circuit_breaker_factory else None
+            )
+            for url in unique_urls
+        ]
+        self.retry_policy = retry_policy
+        self.base_url = ",".join(endpoint.base_url for endpoint in self.endpoints)
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self.failure_threshold = max(1, failure_threshold)
+
+        self._lock = threading.Lock()
+        self._tie_breaker = itertools.count()
+        self._stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+
+        self.check_health()
+        if health_check_interval > 0:
+            self._health_thread = threading.Thread(
+                target=self._health_loop,
+                name="ollama-health-check",
+                daemon=True
+            )
+            self._health_thread.start()
+
+    def close(self):
+        """Stop health checks and close every host's sessions."""
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join(timeout=5)
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+            endpoint.health_session.close()
+
+    def __enter__(self) -> "OllamaEndpointPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _health_loop(self):
+        while not self._stop.wait(self.health_check_interval):
+            self.check_health()
+
+    def check_health(self):
+        """Poll every host for its models and update its health.
+
+        Polls go through each host's own health session, so they are not
+        queued behind generate requests holding every pooled connection.
+        """
+        for endpoint in self.endpoints:
+            session = endpoint.health_session
+            try:
+                response = session.get(endpoint.client.tags_endpoint, timeout=5)
+                response.raise_for_status()
+                models = {m.get("name", "") for m in response.json().get("models", [])}
+            except Exception as e:
+                with self._lock:
+                    if endpoint.healthy:
+                        logger.warning(f"Ejecting Ollama host {endpoint.base_url}: {e}")
+                    endpoint.healthy = False
+                continue
+
+            # Loaded models are only a routing preference; older servers lack /api/ps
+            loaded: Set[str] = set()
+            try:
+                response = session.get(f"{endpoint.base_url}/api/ps", timeout=5)
+                if response.ok:
+                    loaded = {m.get("name", "") for m in response.json().get("models", [])}
+            except Exception:
+                pass
+
+            with self._lock:
+                if not endpoint.healthy:
+                    logger.info(f"Ollama host {endpoint.base_url} is healthy again")
+                endpoint.healthy = True
+                endpoint.consecutive_failures = 0
+                endpoint.models = models
+                endpoint.loaded_models = loaded
+
+    def _acquire(self, model: str, exclude: Set[str]) -> Optional[_Endpoint]:
+        """Pick a host for a request and count it as outstanding.
+
+        Hosts whose circuit is open are skipped; if every remaining host's
+        circuit is open, waits until one lets a request through.
+
+        Returns:
+            The host, or None if every host is in ``exclude``
+        """
+        while True:
+            with self._lock:
+                candidates = [e for e in self.endpoints if e.base_url not in exclude]
+                healthy = [e for e in candidates if e.healthy]
+                # With every host ejected, keep trying rather than failing the run
+                candidates = healthy or candidates
+                having_model = [e for e in candidates if e.models is None or model in e.models]
+                candidates = having_model or candidates
+                if not candidates:
+                    return None
+
+                ready = [e for e in candidates if e.breaker is None or e.breaker.retry_after() == 0]
+                if ready:
+                    endpoint = min(
+                        ready,
+                        key=lambda e: (
+                            model not in e.loaded_models,
+                            e.outstanding,
+                            next(self._tie_breaker)
+                        )
+                    )
+                    # Breakers are only used under the pool lock, so the check above holds
+                    if endpoint.breaker is not None:
+                        endpoint.breaker.acquire()
+                    endpoint.outstanding += 1
+                    return endpoint
+                wait = min(e.breaker.retry_after() for e in candidates)
+            time.sleep(wait)
+
+    def _release(self, endpoint: _Endpoint, model: str, error: Optional[BaseException] = None):
+        """Finish a request and record its outcome."""
+        with self._lock:
+            endpoint.outstanding -= 1
+            if endpoint.breaker is not None:
+                if error is None:
+                    endpoint.breaker.record_success()
+                elif (self.retry_policy or RetryPolicy()).is_retryable(error):
+                    endpoint.breaker.record_failure()
+                else:
+                    endpoint.breaker.record_ignored()
+            if error is None:
+                endpoint.consecutive_failures = 0
+                endpoint.loaded_models.add(model)
+                return
+
+            if not isinstance(error, (requests.exceptions.ConnectionError,
+                                      requests.exceptions.Timeout)):
+                return
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and endpoint.consecutive_failures >= self.failure_threshold:
+                endpoint.healthy = False
+                logger.warning(
+                    f"Ejecting Ollama host {endpoint.base_url} after "
+                    f"{endpoint.consecutive_failures} consecutive failures"
+                )
+
+    def generate(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Generate text on the least loaded host that has the model.
+
+        Takes the same arguments and returns the same dict as
+        OllamaClient.generate, plus ``endpoint`` with the host's base URL.
+
+        Raises:
+            requests.exceptions.RequestException: If the API call fails; the
+                exception's ``retries`` attribute holds the retries made
+            ValueError: If the response is invalid
+        """
+        result, retries = call_with_retry(
+            lambda: self._generate_once(model, prompt, kwargs),
+            self.retry_policy,
+            description=f"Generation with {model}"
+        )
+        result["retries"] = retries
+        return result
+
+    def _generate_once(self, model: str, prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one generate request, failing over to other hosts if it cannot connect."""
+        tried: Set[str] = set()
+        while True:
+            endpoint = self._next_endpoint(model, tried)
+            error = None
+            try:
+                result = endpoint.client.generate(model, prompt, **kwargs)
+                result["endpoint"] = endpoint.base_url
+                return result
+            except Exception as e:
+                error = e
+                if self._can_fail_over(endpoint, e, tried):
+                    continue
+                raise
+            finally:
+                self._release(endpoint, model, error)
+
+    def stream_generate(self, model: str, prompt: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Stream generation chunks from the least loaded host that has the model.
+
+        Takes the same arguments as OllamaClient.stream_generate. Like
+        generate, fails over to another host if the connection fails before
+        the first chunk arrives.
+
+        Yields:
+            Parsed NDJSON chunk dicts
+        """
+        tried: Set[str] = set()
+        while True:
+            endpoint = self._next_endpoint(model, tried)
+            error = None
+            started = False
+            try:
+                for chunk in endpoint.client.stream_generate(model, prompt, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                error = e
+                if not started and self._can_fail_over(endpoint, e, tried):
+                    continue
+                raise
+            finally:
+                self._release(endpoint, model, error)
+
+    def _next_endpoint(self, model: str, tried: Set[str]) -> _Endpoint:
+        """Acquire a host not tried yet for a request.
+
+        Raises:
+            requests.exceptions.ConnectionError: If every host has been tried
+        """
+        endpoint = self._acquire(model, tried)
+        if endpoint is None:
+            raise requests.exceptions.ConnectionError(
+                f"Could not connect to any Ollama host ({', '.join(sorted(tried))})"
+            )
+        return endpoint
+
+    def _can_fail_over(self, endpoint: _Endpoint, error: BaseException, tried: Set[str]) -> bool:
+        """Record a failed host; True if the request can go to another host."""
+        tried.add(endpoint.base_url)
+        # Nothing was sent if the connection failed, so another host can take it
+        if (isinstance(error, requests.exceptions.ConnectionError)
+                and len(tried) < len(self.endpoints)):
+            logger.warning(f"Retrying on another host after {endpoint.base_url} failed: {error}")
+            return True
+        return False
+
+    def check_model_availability(self, model: str) -> bool:
+        """Check if any healthy host has a model.
+
+        Args:
+            model: Model name to check
+
+        Returns:
+            True if model is available, False otherwise
+        """
+        return model in self.list_models()
+
+    def list_models(self) -> list:
+        """List models available on any healthy host.
+
+        Returns:
+            Sorted list of model names
+        """
+        self.check_health()
+        with self._lock:
+            models = set()
+            for endpoint in self.endpoints:
+                if endpoint.healthy and endpoint.models:
+                    models |= endpoint.models
+        logger.info(f"Found {len(models)} available models across {len(self.endpoints)} hosts")
+        return sorted(models)
+
+    def test_connection(self) -> bool:
+        """Test connection to the Ollama hosts.
+
+        Returns:
+            True if at least one host is reachable, False otherwise
+        """
+        self.check_health()
+        with self._lock:
+            healthy = [e.base_url for e in self.endpoints if e.healthy]
+        for endpoint in self.endpoints:
+            if endpoint.base_url not in healthy:
+                logger.error(f"Failed to connect to Ollama host: {endpoint.base_url}")
+        if healthy:
+            logger.info(f"Connected to {len(healthy)}/{len(self.endpoints)} Ollama hosts")
+        return bool(healthy)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get the routing state of every host.
+
+        Returns:
+            List of dicts with base_url, healthy, outstanding and model counts
+        """
+        with self._lock:
+            return [
+                {
+                    "base_url": endpoint.base_url,
+                    "healthy": endpoint.healthy,
+                    "outstanding": endpoint.outstanding,
+                    "models": len(endpoint.models or ()),
+                    "loaded_models": sorted(endpoint.loaded_models)
+                }
+                for endpoint in self.endpoints
+            ]
@@ -0,0 +1,394 @@
+"""Local stand-in for the Ollama HTTP API, for benchmarking the harness offline."""
+
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Shapes of the per-request base latency, see MockOllamaConfig.latency_distribution
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+# Filler vocabulary for generated responses
+_WORDS = (
+    "the", "model", "answer", "is", "because", "first", "then", "so", "we",
+    "step", "result", "therefore", "value", "and", "of", "a", "to", "in"
+)
+
+
+@dataclass
+class MockOllamaConfig:
+    """Behavior of the mock server.
+
+    Durations are in milliseconds of simulated time; ``time_scale`` converts
+    them to real sleeping time, so 0 answers instantly while still reporting
+    the simulated durations in Ollama's timing fields.
+
+    Attributes:
+        models: Model names served by /api/generate and listed by /api/tags
+        latency_ms: Mean base latency added to every request before the
+            prompt is processed
+        latency_distribution: Shape of the base latency, one of
+            LATENCY_DISTRIBUTIONS
+        prompt_tokens_per_second: Prompt processing rate
+        tokens_per_second: Decode rate
+        response_tokens: Mean tokens generated when the request sets no
+            num_predict; actual counts vary by +-50%
+        load_duration_ms: Time to load a model that is not loaded
+        keep_alive_sec: How long a model stays loaded after its last request
+            unless the request sets keep_alive
+        max_loaded_models: Models loaded at once; loading another evicts the
+            least recently used one
+        num_parallel: Requests processed at once (like OLLAMA_NUM_PARALLEL);
+            further requests wait, so latency grows with concurrency
+        failure_rate: Fraction of generate requests failed with failure_status
+        failure_status: HTTP status of injected failures
+        time_scale: Real seconds slept per simulated second
+        seed: Seed for latency, length and failure randomness
+    """
+    models: List[str] = field(default_factory=lambda: ["qwen2.5:1.5b", "deepseek-r1:7b"])
+    latency_ms: float = 20.0
+    latency_distribution: str = "lognormal"
+    prompt_tokens_per_second: float = 2000.0
+    tokens_per_second: float = 50.0
+    response_tokens: int = 100
+    load_duration_ms: float = 2000.0
+    keep_alive_sec: float = 300.0
+    max_loaded_models: int = 1
+    num_parallel: int = 4
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    time_scale: float = 1.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{self.latency_distribution}', "
+                f"expected one of {LATENCY_DISTRIBUTIONS}"
+            )
+        if self.num_parallel < 1 or self.max_loaded_models < 1:
+            raise ValueError("num_parallel and max_loaded_models must be at least 1")
+
+
+class _MockState:
+    """Loaded models, concurrency slots and request counters shared by handlers."""
+
+    def __init__(self, config: MockOllamaConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(config.num_parallel)
+        self.rng = random.Random(config.seed)
+        # model name -> monotonic time its keep_alive expires
+        self.loaded: Dict[str, float] = {}
+        self.in_flight = 0
+        self.counters = {
+            "requests": 0,
+            "failures": 0,
+            "loads": 0,
+            "max_in_flight": 0,
+            "tokens_generated": 0
+        }
+
+    def base_latency_ms(self) -> float:
+        mean = self.config.latency_ms
+        distribution = self.config.latency_distribution
+        with self.lock:
+            if mean <= 0 or distribution == "constant":
+                return max(0.0, mean)
+            if distribution == "uniform":
+                return self.rng.uniform(0, 2 * mean)
+            if distribution == "exponential":
+                return self.rng.expovariate(1 / mean)
+            # Lognormal with the given mean and a long right tail
+            sigma = 0.5
+            return self.rng.lognormvariate(0, sigma) * mean / math.exp(sigma ** 2 / 2)
+
+    def should_fail(self) -> bool:
+        with self.lock:
+            self.counters["requests"] += 1
+            failed = self.rng.random() < self.config.failure_rate
+            if failed:
+                self.counters["failures"] += 1
+            return failed
+
+    def load(self, model: str, keep_alive_sec: float) -> float:
+        """Mark a model loaded and return the simulated load time in ms."""
+        now = time.monotonic()
+        with self.lock:
+            for name, expires in list(self.loaded.items()):
+                if expires < now:
+                    del self.loaded[name]
+            load_ms = 0.0
+            if model not in self.loaded:
+                load_ms = self.config.load_duration_ms
+                self.counters["loads"] += 1
+                while len(self.loaded) >= self.config.max_loaded_models:
+                    del self.loaded[min(self.loaded, key=self.loaded.get)]
+            self.loaded[model] = now + keep_alive_sec
+            return load_ms
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.counters["max_in_flight"] = max(self.counters["max_in_flight"], self.in_flight)
+
+    def leave(self, tokens: int):
+        with self.lock:
+            self.in_flight -= 1
+            self.counters["tokens_generated"] += tokens
+
+
+def _parse_keep_alive(value: Any, default: float) -> float:
+    """Seconds from an Ollama keep_alive value ("30m", "10s", 300, "-1")."""
+    if value is None:
+        return default
+    text = str(value).strip()
+    units = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    for suffix in ("ms", "s", "m", "h"):
+        if text.endswith(suffix):
+            number = float(text[:-len(suffix)])
+            break
+    else:
+        number, suffix = float(text), "s"
+    if number < 0:
+        return float("inf")
+    return number * units[suffix]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler for the mock API; ``server.state`` holds the shared state."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm the
+    # body waits for the client's delayed ACK, adding ~40ms per request
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    @property
+    def state(self) -> _MockState:
+        return self.server.state
+
+    def _send_json(self, status: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, body: Dict[str, Any]):
+        data = json.dumps(body).encode() + b"\n"
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _sleep(self, simulated_ms: float):
+        if simulated_ms > 0 and self.state.config.time_scale > 0:
+            time.sleep(simulated_ms / 1000 * self.state.config.time_scale)
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [
+                {"name": name, "model": name, "size": 0, "details": {"family": "mock"}}
+                for name in self.state.config.models
+            ]})
+        elif self.path == "/api/ps":
+            with self.state.lock:
+                loaded = list(self.state.loaded)
+            self._send_json(200, {"models": [{"name": name, "model": name} for name in loaded]})
+        elif self.path in ("/", "/api/version"):
+            self._send_json(200, {"version": "mock"})
+        else:
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"invalid JSON: {e}"})
+            return
+
+        model = request.get("model", "")
+        if model not in self.state.config.models:
+            self._send_json(404, {"error": f"model '{model}' not found"})
+            return
+        if self.state.should_fail():
+            self._send_json(self.state.config.failure_status, {"error": "injected failure"})
+            return
+
+        with self.state.slots:
+            self.state.enter()
+            tokens = 0
+            try:
+                tokens = self._generate(request)
+            finally:
+                self.state.leave(tokens)
+
+    def _plan(self, request: Dict[str, Any]) -> Tuple[int, int, List[str]]:
+        """Prompt token count, completion token count and output tokens of a request."""
+        config = self.state.config
+        options = request.get("options") or {}
+        prompt_tokens = max(1, len(request.get("prompt", "")) // 4)
+
+        # A request seed makes the response reproducible, like a real sampler
+        seed = options.get("seed")
+        if seed is not None:
+            rng = random.Random(f"{request.get('model')}:{request.get('prompt')}:{seed}")
+        else:
+            with self.state.lock:
+                rng = random.Random(self.state.rng.random())
+
+        num_predict = options.get("num_predict")
+        if num_predict is not None and num_predict >= 0:
+            completion_tokens = num_predict
+        else:
+            completion_tokens = max(1, int(config.response_tokens * rng.uniform(0.5, 1.5)))
+        words = [rng.choice(_WORDS) + " " for _ in range(completion_tokens)]
+        return prompt_tokens, completion_tokens, words
+
+    def _generate(self, request: Dict[str, Any]) -> int:
+        """Simulate one generation and write the response; returns tokens generated."""
+        config = self.state.config
+        model = request["model"]
+        stream = request.get("stream", True)
+        prompt_tokens, completion_tokens, words = self._plan(request)
+
+        base_ms = self.state.base_latency_ms()
+        load_ms = self.state.load(model, _parse_keep_alive(request.get("keep_alive"), config.keep_alive_sec))
+        prompt_eval_ms = prompt_tokens / config.prompt_tokens_per_second * 1000
+        eval_ms = completion_tokens / config.tokens_per_second * 1000
+        total_ms = base_ms + load_ms + prompt_eval_ms + eval_ms
+
+        final = {
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "response": "",
+            "done": True,
+            "done_reason": "length" if (request.get("options") or {}).get("num_predict") else "stop",
+            "context": [],
+            "total_duration": int(total_ms * 1e6),
+            "load_duration": int(load_ms * 1e6),
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prompt_eval_ms * 1e6),
+            "eval_count": completion_tokens,
+            "eval_duration": int(eval_ms * 1e6)
+        }
+
+        self._sleep(base_ms + load_ms + prompt_eval_ms)
+        if not stream:
+            self._sleep(eval_ms)
+            self._send_json(200, {**final, "response": "".join(words)})
+            return completion_tokens
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        per_token_ms = eval_ms / max(completion_tokens, 1)
+        for word in words:
+            self._sleep(per_token_ms)
+            self._write_chunk({
+                "model": model,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "response": word,
+                "done": False
+            })
+        self._write_chunk(final)
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+        return completion_tokens
+
+
+class MockOllamaServer:
+    """Ollama API stand-in serving /api/generate, /api/tags and /api/ps.
+
+    Runs a threaded HTTP server in a background thread, so it can back an
+    OllamaClient (or several, via OllamaEndpointPool) in the same process:
+
+        with MockOllamaServer(MockOllamaConfig(time_scale=0.01)) as server:
+            client = OllamaClient(server.url)
+
+    Responses carry the same fields as Ollama's, with timings derived from
+    the configured rates, so harness behavior (concurrency, scheduling,
+    retries, storage) can be measured without a model.
+    """
+
+    def __init__(
+        self,
+        config: Optional[MockOllamaConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """Bind the server; it starts serving on start().
+
+        Args:
+            config: Server behavior (default: MockOllamaConfig())
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one (default: 0)
+        """
+        self.config = config or MockOllamaConfig()
+        self._state = _MockState(self.config)
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self._state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to OllamaClient."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockOllamaServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="mock-ollama",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Mock Ollama server listening on {self.url}")
+        return self
+
+    def serve_forever(self):
+        """Serve requests in the calling thread until interrupted."""
+        logger.info(f"Mock Ollama server listening on {self.url}")
+        self._httpd.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockOllamaServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get request counters.
+
+        Returns:
+            Dict with requests, failures, loads, max_in_flight and
+            tokens_generated
+        """
+        with self._state.lock:
+            return dict(self._state.counters)
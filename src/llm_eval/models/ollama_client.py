@@ -2,30 +2,265 @@
 
 import json
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .resilience import CircuitBreaker, RetryPolicy, call_with_retry
 
 
 logger = logging.getLogger(__name__)
 
 
+def build_generate_payload(
+    model: str,
+    prompt: str,
+    temperature: float = 0.7,
+    top_p: float = 0.9,
+    max_tokens: int = 2048,
+    stream: bool = False,
+    keep_alive: Optional[str] = None,
+    seed: Optional[int] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build the JSON payload for Ollama's /api/generate endpoint.
+
+    Shared by the sync and async clients so both send identical requests.
+
+    Args:
+        model: Model name
+        prompt: The prompt text
+        temperature: Sampling temperature (0.0-1.0)
+        top_p: Top-p sampling parameter (0.0-1.0)
+        max_tokens: Maximum tokens to generate (-1 for unlimited)
+        stream: Whether to request a streamed response
+        keep_alive: How long Ollama keeps the model loaded after the request
+            (e.g. "30m", "-1" for indefinitely); server default if None
+        seed: Sampling seed; server default (random) if None
+        options: Further Ollama options (e.g. num_ctx, num_thread); the
+            arguments above take precedence over the same keys here
+
+    Returns:
+        Request payload dict
+    """
+    # Build options dict
+    request_options = dict(options or {})
+    request_options["temperature"] = temperature
+    request_options["top_p"] = top_p
+
+    # Only add num_predict if it's not -1 (unlimited)
+    # For unlimited generation, we omit the parameter entirely
+    if max_tokens != -1:
+        request_options["num_predict"] = max_tokens
+
+    if seed is not None:
+        request_options["seed"] = seed
+
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+        "options": request_options
+    }
+    if keep_alive is not None:
+        payload["keep_alive"] = keep_alive
+    return payload
+
+
+def check_generation_result(model: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Log warnings for incomplete or empty generation results.
+
+    Args:
+        model: Model name the result came from
+        result: Parsed /api/generate response
+
+    Returns:
+        The same result dict
+    """
+    if not result.get("done", False):
+        logger.warning("Generation may not be complete (done=False)")
+
+    # Check if response is empty
+    response_text = result.get("response", "")
+    if not response_text or response_text.strip() == "":
+        logger.warning(
+            f"Empty response received from model {model}. "
+            f"Generated {result.get('eval_count', 0)} tokens but response field is empty. "
+            f"This may happen with reasoning models that hit token limits."
+        )
+
+    logger.info(f"Generation complete. Tokens: {result.get('eval_count', 0)}")
+    return result
+
+
+class StreamAccumulator:
+    """Assemble streamed /api/generate chunks into a single result.
+
+    Chunks are timestamped as they are added, so the assembled result also
+    carries client-side latency metrics:
+        - time_to_first_token_ms: Request start to first non-empty chunk
+        - inter_token_latency_ms: Mean gap between consecutive output chunks
+        - inter_token_latency_p95_ms: 95th percentile of those gaps
+        - tokens_per_second: Decode rate from Ollama's eval timings, or from
+          chunk arrival times if those are missing
+
+    Reasoning output in a separate ``thinking`` field counts as output for
+    latency purposes but is not included in the response text.
+    """
+
+    def __init__(self):
+        """Start the clock for a new streamed generation."""
+        self.start_time = time.perf_counter()
+        self._parts: List[str] = []
+        self._first_output_at: Optional[float] = None
+        self._last_output_at: Optional[float] = None
+        self._gaps_ms: List[float] = []
+        self._output_chunks = 0
+        self._final: Dict[str, Any] = {}
+
+    def add(self, chunk: Dict[str, Any]):
+        """Record one streamed chunk.
+
+        Args:
+            chunk: Parsed NDJSON chunk from Ollama
+        """
+        now = time.perf_counter()
+        text = chunk.get("response", "")
+
+        if text or chunk.get("thinking"):
+            if self._first_output_at is None:
+                self._first_output_at = now
+            else:
+                self._gaps_ms.append((now - self._last_output_at) * 1000)
+            self._last_output_at = now
+            self._output_chunks += 1
+
+        if text:
+            self._parts.append(text)
+        if chunk.get("done"):
+            self._final = chunk
+
+    def result(self) -> Dict[str, Any]:
+        """Build the combined result dict.
+
+        Returns:
+            The final chunk's fields with the full response text and
+            streaming latency metrics added
+        """
+        result = dict(self._final)
+        result["response"] = "".join(self._parts)
+
+        if self._first_output_at is not None:
+            result["time_to_first_token_ms"] = int(
+                (self._first_output_at - self.start_time) * 1000
+            )
+        if self._gaps_ms:
+            gaps = sorted(self._gaps_ms)
+            result["inter_token_latency_ms"] = sum(gaps) / len(gaps)
+            result["inter_token_latency_p95_ms"] = gaps[min(len(gaps) - 1, int(len(gaps) * 0.95))]
+
+        eval_count = result.get("eval_count", 0)
+        eval_duration = result.get("eval_duration", 0)
+        if eval_count and eval_duration:
+            result["tokens_per_second"] = eval_count / (eval_duration / 1e9)
+        elif self._output_chunks > 1:
+            elapsed = self._last_output_at - self._first_output_at
+            if elapsed > 0:
+                result["tokens_per_second"] = (self._output_chunks - 1) / elapsed
+
+        return result
+
+
 class OllamaClient:
     """Client for interacting with Ollama HTTP API.
 
     This client provides methods to generate text using Ollama models
     running locally on the default port (11434).
+
+    All requests go through a pooled ``requests.Session`` so TCP connections
+    are kept alive and reused. Size ``pool_size`` to at least the number of
+    concurrent requests, otherwise callers wait for a free connection.
     """
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """Initialize Ollama client.
 
         Args:
             base_url: Base URL for Ollama API (default: http://localhost:11434)
+            pool_size: Maximum number of pooled keep-alive connections (default: 10)
+            max_retries: Connection-level retries per request (default: 3)
+            backoff_factor: Backoff factor between connection retries in seconds
+            retry_policy: Retries of failed generate calls, e.g. on 503 or a
+                reset connection (default: no retries)
+            circuit_breaker: Optional breaker that pauses generate calls while
+                the server keeps failing
         """
         self.base_url = base_url.rstrip("/")
         self.generate_endpoint = f"{self.base_url}/api/generate"
         self.tags_endpoint = f"{self.base_url}/api/tags"
+        self.pool_size = max(1, pool_size)
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.session = self._create_session(max_retries, backoff_factor)
+
+    def _create_session(self, max_retries: int, backoff_factor: float) -> requests.Session:
+        """Create a pooled HTTP session with retrying adapters.
+
+        Connection failures are retried for every method since the request
+        never reached the server. Read errors and 5xx responses are only
+        retried for idempotent GETs; a POST to /api/generate may already be
+        running on the server.
+
+        Args:
+            max_retries: Maximum number of retries
+            backoff_factor: Backoff factor between retries
+
+        Returns:
+            Configured requests.Session
+        """
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+            pool_block=True
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "OllamaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def generate(
         self,
@@ -35,6 +270,9 @@ class OllamaClient:
         top_p: float = 0.9,
         max_tokens: int = 2048,
         stream: bool = False,
+        keep_alive: Optional[str] = None,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
         timeout: int = 600
     ) -> Dict[str, Any]:
         """Generate text using an Ollama model.
@@ -46,8 +284,18 @@ class OllamaClient:
             top_p: Top-p sampling parameter (0.0-1.0)
             max_tokens: Maximum tokens to generate
             stream: Whether to stream the response (default: False)
+            keep_alive: How long to keep the model loaded afterwards (e.g. "30m")
+            seed: Sampling seed, for reproducible or deliberately varied samples
+            options: Further Ollama options, e.g. num_ctx, num_batch, num_thread
             timeout: Request timeout in seconds (default: 600)
 
+        When ``stream`` is True the response is read incrementally via
+        stream_generate and assembled by StreamAccumulator, which adds
+        time-to-first-token and inter-token latency fields.
+
+        Transient failures are retried according to ``retry_policy``, waiting
+        on ``circuit_breaker`` before each attempt.
+
         Returns:
             Dict containing:
                 - response: The generated text
@@ -59,56 +307,62 @@ class OllamaClient:
                 - load_duration: Model load time in nanoseconds
                 - prompt_eval_count: Number of tokens in prompt
                 - eval_count: Number of tokens generated
+                - retries: Number of retried attempts
 
         Raises:
-            requests.exceptions.RequestException: If the API call fails
+            requests.exceptions.RequestException: If the API call fails; the
+                exception's ``retries`` attribute holds the retries made
             ValueError: If the response is invalid
         """
-        # Build options dict
-        options = {
-            "temperature": temperature,
-            "top_p": top_p
-        }
-
-        # Only add num_predict if it's not -1 (unlimited)
-        # For unlimited generation, we omit the parameter entirely
-        if max_tokens != -1:
-            options["num_predict"] = max_tokens
-
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": stream,
-            "options": options
-        }
+        payload = build_generate_payload(
+            model, prompt,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stream=stream,
+            keep_alive=keep_alive,
+            seed=seed,
+            options=options
+        )
 
         logger.info(f"Generating text with model: {model} (max_tokens: {max_tokens})")
         logger.debug(f"Prompt length: {len(prompt)} characters")
 
+        result, retries = call_with_retry(
+            lambda: self._generate_once(model, payload, timeout),
+            self.retry_policy,
+            self.circuit_breaker,
+            description=f"Generation with {model}"
+        )
+        result["retries"] = retries
+        return result
+
+    def _generate_once(self, model: str, payload: Dict[str, Any], timeout: int) -> Dict[str, Any]:
+        """Send one generate request and return the checked result.
+
+        Args:
+            model: Model name
+            payload: Request payload from build_generate_payload
+            timeout: Request timeout in seconds
+
+        Returns:
+            Generation result dict
+        """
         try:
-            response = requests.post(
+            if payload["stream"]:
+                accumulator = StreamAccumulator()
+                for chunk in self._iter_stream(payload, timeout):
+                    accumulator.add(chunk)
+                return check_generation_result(model, accumulator.result())
+
+            response = self.session.post(
                 self.generate_endpoint,
                 json=payload,
                 timeout=timeout
             )
             response.raise_for_status()
 
-            result = response.json()
-
-            if not result.get("done", False):
-                logger.warning("Generation may not be complete (done=False)")
-
-            # Check if response is empty
-            response_text = result.get("response", "")
-            if not response_text or response_text.strip() == "":
-                logger.warning(
-                    f"Empty response received from model {model}. "
-                    f"Generated {result.get('eval_count', 0)} tokens but response field is empty. "
-                    f"This may happen with reasoning models that hit token limits."
-                )
-
-            logger.info(f"Generation complete. Tokens: {result.get('eval_count', 0)}")
-            return result
+            return check_generation_result(model, response.json())
 
         except requests.exceptions.Timeout:
             logger.error(f"Request timeout after {timeout}s for model {model}")
@@ -126,6 +380,80 @@ class OllamaClient:
             logger.error(f"Invalid JSON response from Ollama: {e}")
             raise ValueError(f"Invalid response from Ollama API: {e}")
 
+    def stream_generate(
+        self,
+        model: str,
+        prompt: str,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        max_tokens: int = 2048,
+        keep_alive: Optional[str] = None,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: int = 600
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream generation chunks from an Ollama model.
+
+        Ollama streams newline-delimited JSON objects; each is yielded as soon
+        as it arrives. The final chunk has ``done=True`` and carries the
+        timing and token count fields.
+
+        Args:
+            model: Model name
+            prompt: The prompt text to send to the model
+            temperature: Sampling temperature (0.0-1.0)
+            top_p: Top-p sampling parameter (0.0-1.0)
+            max_tokens: Maximum tokens to generate
+            keep_alive: How long to keep the model loaded afterwards (e.g. "30m")
+            seed: Sampling seed, for reproducible or deliberately varied samples
+            options: Further Ollama options, e.g. num_ctx, num_batch, num_thread
+            timeout: Timeout in seconds for connecting and between chunks
+
+        Yields:
+            Parsed NDJSON chunk dicts
+
+        Raises:
+            requests.exceptions.RequestException: If the API call fails
+            ValueError: If a chunk is not valid JSON
+        """
+        payload = build_generate_payload(
+            model, prompt,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            stream=True,
+            keep_alive=keep_alive,
+            seed=seed,
+            options=options
+        )
+        yield from self._iter_stream(payload, timeout)
+
+    def _iter_stream(self, payload: Dict[str, Any], timeout: int) -> Iterator[Dict[str, Any]]:
+        """POST a streaming payload and yield parsed NDJSON chunks.
+
+        Args:
+            payload: Request payload with stream=True
+            timeout: Timeout in seconds for connecting and between chunks
+
+        Yields:
+            Parsed chunk dicts
+        """
+        with self.session.post(
+            self.generate_endpoint,
+            json=payload,
+            timeout=timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Invalid JSON chunk from Ollama: {e}")
+                    raise ValueError(f"Invalid response from Ollama API: {e}")
+
     def check_model_availability(self, model: str) -> bool:
         """Check if a model is available in Ollama.
 
@@ -136,7 +464,7 @@ class OllamaClient:
             True if model is available, False otherwise
         """
         try:
-            response = requests.get(self.tags_endpoint, timeout=10)
+            response = self.session.get(self.tags_endpoint, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -157,7 +485,7 @@ class OllamaClient:
             requests.exceptions.RequestException: If the API call fails
         """
         try:
-            response = requests.get(self.tags_endpoint, timeout=10)
+            response = self.session.get(self.tags_endpoint, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -176,7 +504,7 @@ class OllamaClient:
             True if connection successful, False otherwise
         """
         try:
-            response = requests.get(self.tags_endpoint, timeout=5)
+            response = self.session.get(self.tags_endpoint, timeout=5)
             response.raise_for_status()
             logger.info("Successfully connected to Ollama server")
             return True
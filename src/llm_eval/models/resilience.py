@@ -0,0 +1,257 @@
+"""Retry policies and circuit breaking for Ollama requests."""
+
+import asyncio
+import logging
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Tuple, TypeVar
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _connection_errors() -> Tuple[type, ...]:
+    errors = [requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError]
+    # aiohttp errors can only come from the async client, which has imported
+    # aiohttp already; importing it here would slow down every sync run
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        errors.extend([aiohttp.ClientConnectionError, aiohttp.ClientPayloadError])
+    return tuple(errors)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of a requests or aiohttp error, if it has one."""
+    response = getattr(error, "response", None)
+    if response is not None and getattr(response, "status_code", None) is not None:
+        return response.status_code
+    return getattr(error, "status", None)
+
+
+@dataclass
+class RetryPolicy:
+    """When and how often to retry a failed generation request.
+
+    Attributes:
+        max_attempts: Total attempts including the first (1 disables retries)
+        backoff_base: Delay before the first retry in seconds; doubles on
+            every further retry
+        backoff_max: Upper bound for a single delay in seconds
+        jitter: Randomize each delay between 0 and its backoff ("full jitter")
+            so concurrent workers do not retry in lockstep
+        retryable_status_codes: HTTP statuses treated as transient
+        retry_on_timeout: Also retry requests that timed out
+    """
+    max_attempts: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retryable_status_codes: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    retry_on_timeout: bool = False
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether an error is transient and worth retrying."""
+        if isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+            return self.retry_on_timeout
+        if isinstance(error, _connection_errors()):
+            return True
+        return _status_code(error) in self.retryable_status_codes
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before the given retry (1 for the first retry)."""
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+class CircuitBreaker:
+    """Pause requests while a server keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and callers wait instead of sending more requests. Once
+    ``reset_timeout`` has passed, a single probe request is let through; if
+    it succeeds the circuit closes, otherwise it opens again. Shared by all
+    threads (or coroutines) using a client.
+    """
+
+    # Seconds between checks while another caller's probe is in flight
+    PROBE_POLL_INTERVAL = 0.5
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize a closed circuit.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being held back."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def acquire(self) -> float:
+        """Ask to send a request.
+
+        Returns:
+            0 if the request may be sent now, otherwise seconds to wait
+            before asking again
+        """
+        with self._lock:
+            wait = self._retry_after()
+            if wait == 0 and self._opened_at is not None:
+                self._probing = True
+            return wait
+
+    def retry_after(self) -> float:
+        """Like acquire, but without claiming the probe: 0 if a request could be sent now."""
+        with self._lock:
+            return self._retry_after()
+
+    def _retry_after(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if remaining > 0:
+            return remaining
+        return self.PROBE_POLL_INTERVAL if self._probing else 0.0
+
+    def record_success(self):
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit breaker closed: server is responding again")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        """Record a transient failure, opening the circuit at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    f"Circuit breaker open after {self._failures} consecutive failures; "
+                    f"pausing requests for {self.reset_timeout:.0f}s"
+                )
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def record_ignored(self):
+        """Release a probe slot without judging the server (e.g. a 404)."""
+        with self._lock:
+            self._probing = False
+
+
+def call_with_retry(
+    call: Callable[[], T],
+    policy: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    description: str = "request"
+) -> Tuple[T, int]:
+    """Run a request, retrying transient failures.
+
+    Args:
+        call: Function performing one attempt
+        policy: Retry policy (default: a single attempt)
+        breaker: Optional circuit breaker to wait on and report to
+        description: Name of the request for log messages
+
+    Returns:
+        (result, number of retries)
+
+    Raises:
+        The last error once attempts are exhausted or it is not retryable;
+        its ``retries`` attribute holds the number of retries made
+    """
+    policy = policy or RetryPolicy(max_attempts=1)
+    for attempt in range(1, policy.max_attempts + 1):
+        if breaker is not None:
+            while (wait := breaker.acquire()) > 0:
+                time.sleep(wait)
+        try:
+            result = call()
+        except Exception as e:
+            retry = _after_failure(e, attempt, policy, breaker, description)
+            if retry is None:
+                raise
+            time.sleep(retry)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result, attempt - 1
+
+
+async def acall_with_retry(
+    call: Callable[[], Awaitable[T]],
+    policy: Optional[RetryPolicy] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    description: str = "request"
+) -> Tuple[T, int]:
+    """Async counterpart to call_with_retry; waits without blocking the loop."""
+    policy = policy or RetryPolicy(max_attempts=1)
+    for attempt in range(1, policy.max_attempts + 1):
+        if breaker is not None:
+            while (wait := breaker.acquire()) > 0:
+                await asyncio.sleep(wait)
+        try:
+            result = await call()
+        except Exception as e:
+            retry = _after_failure(e, attempt, policy, breaker, description)
+            if retry is None:
+                raise
+            await asyncio.sleep(retry)
+            continue
+        if breaker is not None:
+            breaker.record_success()
+        return result, attempt - 1
+
+
+def _after_failure(
+    error: BaseException,
+    attempt: int,
+    policy: RetryPolicy,
+    breaker: Optional[CircuitBreaker],
+    description: str
+) -> Optional[float]:
+    """Record a failed attempt.
+
+    Returns:
+        Seconds to wait before retrying, or None if the error should be raised
+    """
+    retryable = policy.is_retryable(error)
+    if breaker is not None:
+        if retryable:
+            breaker.record_failure()
+        else:
+            breaker.record_ignored()
+
+    if not retryable or attempt >= policy.max_attempts:
+        error.retries = attempt - 1
+        return None
+
+    delay = policy.delay(attempt)
+    logger.warning(
+        f"{description} failed (attempt {attempt}/{policy.max_attempts}): {error}; "
+        f"retrying in {delay:.1f}s"
+    )
+    return delay
@@ -0,0 +1,179 @@
+"""Content-addressed on-disk cache for Ollama generation responses."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, prompt: str, options: Dict[str, Any]) -> str:
+    """Compute the cache key for a generation request.
+
+    Args:
+        model: Ollama model name
+        prompt: The exact prompt text sent to the model
+        options: Ollama generation options (temperature, top_p, num_predict, ...)
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    material = json.dumps(
+        {"model": model, "prompt": prompt, "options": options},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """On-disk response cache with size-based LRU eviction.
+
+    Entries are stored as ``<cache_dir>/<key[:2]>/<key>.json``. Recency is
+    kept in memory and mirrored to file mtimes, so the LRU order survives
+    restarts. The cache is safe to share between worker threads.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that found no entry
+        evictions: Number of entries removed to stay under max_bytes
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 1024 * 1024 * 1024, bypass: bool = False):
+        """Initialize the cache, indexing any existing entries.
+
+        Args:
+            cache_dir: Directory for cache entries
+            max_bytes: Maximum total size of cache entries (default: 1 GiB)
+            bypass: If True, lookups always miss but new responses are still
+                written, refreshing existing entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Index existing entries from disk, oldest first."""
+        files = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, path.stem, stat.st_size))
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        logger.info(
+            f"Response cache at {self.cache_dir}: {len(self._entries)} entries, "
+            f"{self._total_bytes / (1024 * 1024):.1f} MiB"
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached entry.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Entry dict with "response" and "duration_ms", or None on a miss
+        """
+        with self._lock:
+            if self.bypass or key not in self._entries:
+                self.misses += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, 'r') as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, response: Dict[str, Any], duration_ms: int):
+        """Store a generation response.
+
+        The returned ``context`` token array is dropped; it is large and not
+        needed to reproduce an evaluation result.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: Generation response dict
+            duration_ms: Client-measured generation time of the original call
+        """
+        stored = {k: v for k, v in response.items() if k != "context"}
+        content = json.dumps({"response": stored, "duration_ms": duration_ms})
+        size = len(content.encode("utf-8"))
+
+        path = self._path(key)
+        with self._lock:
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until under max_bytes."""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        self._total_bytes -= self._entries.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters and size.
+
+        Returns:
+            Dict with hits, misses, hit_rate, evictions, entries and size_bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "size_bytes": self._total_bytes
+            }
@@ -0,0 +1,157 @@
+"""Bounded cache of prompts built from compiled strategy templates."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ..tasks.base import Task
+from ..tasks.dataset import EvaluationItem
+from .strategies import PromptTemplate, get_strategy
+
+
+@dataclass(frozen=True)
+class BuiltPrompt:
+    """A prompt and its hash.
+
+    Attributes:
+        text: The prompt sent to the model
+        hash: Hex SHA-256 digest of the text (see prompt_hash)
+    """
+    text: str
+    hash: str
+
+
+def prompt_hash(prompt: str) -> str:
+    """Hex SHA-256 digest of a prompt, identifying it for caching and deduplication."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """Builds prompts from compiled templates, memoizing both.
+
+    A strategy's template is compiled once per (task, strategy, params) and
+    rendered for each evaluation input, so the task description and few-shot
+    block are not rebuilt for every item, model or sample; the prefix is also
+    hashed once, so hashing a prompt only reads its input and suffix.
+    Templates of strategies that choose content by the input (see
+    PromptStrategy.uses_input) are compiled per prompt instead. Built
+    prompts are kept per (task, item, strategy, params). Both caches evict
+    the least recently used entry when full. Safe to share between threads.
+
+    Tasks are identified by object, so a task changed with
+    ``dataclasses.replace`` gets its own entries.
+    """
+
+    def __init__(self, max_prompts: int = 4096, max_templates: int = 1024):
+        """Initialize empty caches.
+
+        Args:
+            max_prompts: Built prompts to keep (default: 4096)
+            max_templates: Compiled templates to keep (default: 1024)
+        """
+        self.max_prompts = max_prompts
+        self.max_templates = max_templates
+        # Values hold the task, so its id() is not reused while the entry exists
+        self._templates: "OrderedDict[Tuple, Tuple[Task, Optional[PromptTemplate], Any]]" = OrderedDict()
+        self._prompts: "OrderedDict[Tuple, Tuple[Task, BuiltPrompt]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def build(
+        self,
+        task: Task,
+        strategy_name: str,
+        item: Optional[EvaluationItem] = None,
+        **params: Any
+    ) -> BuiltPrompt:
+        """Build (or reuse) the prompt for a task or one of its dataset items.
+
+        Args:
+            task: Task to build the prompt for
+            strategy_name: Prompting strategy to apply
+            item: Dataset item whose input replaces the task's evaluation input
+            **params: Strategy parameters (e.g. num_examples, token_budget)
+
+        Returns:
+            The prompt and its hash
+
+        Raises:
+            KeyError: If the strategy name is not recognized
+        """
+        param_key = tuple(sorted(params.items()))
+        key = (id(task), strategy_name, item.id if item is not None else None, param_key)
+        with self._lock:
+            entry = self._prompts.get(key)
+            if entry is not None:
+                self._prompts.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        evaluation_input = item.input if item is not None else task.evaluation_input
+        strategy = get_strategy(strategy_name)
+        if strategy.uses_input(**params):
+            # Templates chosen by the input are only good for that input, so not cached
+            template = strategy.compile(task, query=evaluation_input, **params)
+            prefix_digest = None
+        else:
+            template, prefix_digest = self._template(task, strategy_name, param_key, params)
+
+        if prefix_digest is not None:
+            digest = prefix_digest.copy()
+            digest.update(f"{evaluation_input}{template.suffix}".encode("utf-8"))
+            built = BuiltPrompt(text=template.render(evaluation_input), hash=digest.hexdigest())
+        else:
+            if template is not None:
+                text = template.render(evaluation_input)
+            else:
+                # Strategies without a template build the whole prompt each time
+                text = strategy.build_prompt(task.for_item(item), **params)
+            built = BuiltPrompt(text=text, hash=prompt_hash(text))
+
+        with self._lock:
+            self._prompts[key] = (task, built)
+            while len(self._prompts) > self.max_prompts:
+                self._prompts.popitem(last=False)
+        return built
+
+    def _template(
+        self,
+        task: Task,
+        strategy_name: str,
+        param_key: Tuple,
+        params: Dict[str, Any]
+    ) -> Tuple[Optional[PromptTemplate], Any]:
+        """Compiled template of a strategy for a task and the hash state of its prefix.
+
+        Both are None if the strategy has no template.
+        """
+        key = (id(task), strategy_name, param_key)
+        with self._lock:
+            entry = self._templates.get(key)
+            if entry is not None:
+                self._templates.move_to_end(key)
+                return entry[1], entry[2]
+
+        template = get_strategy(strategy_name).compile(task, **params)
+        prefix_digest = hashlib.sha256(template.prefix.encode("utf-8")) if template is not None else None
+        with self._lock:
+            self._templates[key] = (task, template, prefix_digest)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return template, prefix_digest
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics: hits, misses, hit rate and entry counts."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "prompts": len(self._prompts),
+                "templates": len(self._templates)
+            }
@@ -0,0 +1,168 @@
+"""Selection of few-shot examples by token budget and similarity to the evaluation input."""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..tasks.base import Task, TaskExample
+
+
+# Ways of ordering the example pool before fitting it into a budget
+SELECTION_MODES = ("first", "similar")
+
+# Average characters per token of the BPE tokenizers used by Ollama models on
+# English text; estimates err towards fewer tokens on code and numbers
+CHARS_PER_TOKEN = 4
+
+_WORD = re.compile(r"\w+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens of a text without a tokenizer.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (characters / CHARS_PER_TOKEN, rounded up)
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def format_example(number: int, example: TaskExample) -> str:
+    """Render one example of the few-shot block."""
+    text = f"Example {number}:\nInput: {example.input}\nOutput: {example.output}\n"
+    if example.explanation:
+        text += f"Explanation: {example.explanation}\n"
+    return text + "\n"
+
+
+def _terms(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+class ExampleIndex:
+    """TF-IDF index over the inputs of a task's development examples.
+
+    Ranks examples by cosine similarity between their input and an
+    evaluation input. Also caches each example's estimated token count
+    (as rendered in the few-shot block), so fitting examples into a budget
+    does not re-measure them for every evaluation input.
+    """
+
+    def __init__(self, examples: Sequence[TaskExample]):
+        """Index a pool of examples.
+
+        Args:
+            examples: The task's development examples
+        """
+        self.examples = list(examples)
+        documents = [Counter(_terms(example.input)) for example in self.examples]
+        document_frequency = Counter(term for document in documents for term in document)
+        # Smoothed IDF, so terms found in every example still count a little
+        self._idf = {
+            term: math.log((1 + len(documents)) / (1 + frequency)) + 1
+            for term, frequency in document_frequency.items()
+        }
+        self._vectors = [self._vector(document) for document in documents]
+        # Example numbers take at most a few digits, so one width fits all
+        self.tokens = [estimate_tokens(format_example(99, example)) for example in self.examples]
+
+    def _vector(self, counts: Counter) -> Dict[str, float]:
+        """Unit-length TF-IDF vector of term counts; unknown terms are dropped."""
+        weights = {term: count * self._idf[term] for term, count in counts.items() if term in self._idf}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+        return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+    def rank(self, query: str) -> List[int]:
+        """Indexes of the examples, most similar to the query first.
+
+        Ties (including examples sharing no term with the query) keep the
+        pool order.
+
+        Args:
+            query: Evaluation input to compare against
+
+        Returns:
+            Every example index, ordered by descending similarity
+        """
+        query_vector = self._vector(Counter(_terms(query)))
+        scores = [
+            sum(weight * vector.get(term, 0.0) for term, weight in query_vector.items())
+            for vector in self._vectors
+        ]
+        return sorted(range(len(self.examples)), key=lambda i: -scores[i])
+
+
+def select_examples(
+    index: ExampleIndex,
+    num_examples: int,
+    selection: str = "first",
+    token_budget: Optional[int] = None,
+    query: str = ""
+) -> List[TaskExample]:
+    """Choose the examples of a few-shot block.
+
+    Candidates are taken in pool order ("first") or by similarity to the
+    query ("similar"); an example is skipped if it would push the block over
+    the token budget, and a shorter later candidate is tried instead.
+
+    Args:
+        index: Index of the task's examples
+        num_examples: Maximum number of examples
+        selection: "first" or "similar" (default: "first")
+        token_budget: Estimated tokens the examples may use (default: no limit)
+        query: Evaluation input, for "similar" selection
+
+    Returns:
+        Chosen examples, in pool order so the block reads the same whichever
+        candidates won
+
+    Raises:
+        ValueError: If the selection mode is not recognized
+    """
+    if selection not in SELECTION_MODES:
+        raise ValueError(f"Unknown few-shot selection '{selection}'; expected one of {SELECTION_MODES}")
+
+    candidates = index.rank(query) if selection == "similar" else range(len(index.examples))
+    chosen = []
+    remaining = token_budget
+    for i in candidates:
+        if len(chosen) >= num_examples:
+            break
+        if remaining is not None:
+            if index.tokens[i] > remaining:
+                continue
+            remaining -= index.tokens[i]
+        chosen.append(i)
+    return [index.examples[i] for i in sorted(chosen)]
+
+
+class ExampleIndexCache:
+    """Example indexes built once per task and shared between threads.
+
+    Tasks are identified by object, like in PromptCache; the oldest index is
+    dropped when the cache is full.
+    """
+
+    def __init__(self, max_tasks: int = 256):
+        self.max_tasks = max_tasks
+        # Values hold the task, so its id() is not reused while the entry exists
+        self._indexes: Dict[int, Tuple[Task, ExampleIndex]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, task: Task) -> ExampleIndex:
+        """Index of a task's development examples, built on first use."""
+        with self._lock:
+            entry = self._indexes.get(id(task))
+        if entry is not None:
+            return entry[1]
+
+        index = ExampleIndex(task.development_examples)
+        with self._lock:
+            self._indexes[id(task)] = (task, index)
+            while len(self._indexes) > self.max_tasks:
+                del self._indexes[next(iter(self._indexes))]
+        return index
@@ -1,13 +1,36 @@
 """Prompting strategies for LLM evaluation."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from typing import List, Optional
 
 from ..tasks.base import Task, TaskExample
+from .selection import ExampleIndexCache, estimate_tokens, format_example, select_examples
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A prompt with every part except the evaluation input already rendered.
+
+    Attributes:
+        prefix: Text before the evaluation input (description, examples, ...)
+        suffix: Text after the evaluation input (e.g. reasoning instructions)
+    """
+    prefix: str
+    suffix: str = ""
+
+    def render(self, evaluation_input: str) -> str:
+        """Build the prompt for one evaluation input."""
+        return f"{self.prefix}{evaluation_input}{self.suffix}"
 
 
 class PromptStrategy(ABC):
-    """Abstract base class for prompting strategies."""
+    """Abstract base class for prompting strategies.
+
+    Strategies whose prompt is fixed text around the evaluation input can
+    implement ``compile`` as well, so the fixed text is rendered once per
+    task and reused for every input (see prompts.cache.PromptCache).
+    """
 
     @abstractmethod
     def build_prompt(self, task: Task, **kwargs) -> str:
@@ -22,6 +45,33 @@ class PromptStrategy(ABC):
         """
         pass
 
+    def compile(self, task: Task, **kwargs) -> Optional[PromptTemplate]:
+        """Render the parts of the prompt that do not depend on the evaluation input.
+
+        Args:
+            task: The Task object
+            **kwargs: Additional strategy-specific parameters
+
+        Returns:
+            Template whose render(task.evaluation_input) equals
+            build_prompt(task), or None if the strategy has no template
+        """
+        return None
+
+    def uses_input(self, **kwargs) -> bool:
+        """Whether the template depends on the evaluation input.
+
+        Such templates are compiled for every input, which is passed to
+        ``compile`` as ``query``.
+
+        Args:
+            **kwargs: Strategy-specific parameters, as passed to compile
+
+        Returns:
+            False unless the strategy chooses content by the input
+        """
+        return False
+
     @abstractmethod
     def get_strategy_name(self) -> str:
         """Get the name of this strategy.
@@ -48,9 +98,11 @@ class ZeroShotStrategy(PromptStrategy):
         Returns:
             Prompt with just task description and input
         """
-        return f"""{task.description}
+        return self.compile(task).render(task.evaluation_input)
 
-{task.evaluation_input}"""
+    def compile(self, task: Task, **kwargs) -> PromptTemplate:
+        """Compile the zero-shot template: the task description."""
+        return PromptTemplate(prefix=f"{task.description}\n\n")
 
     def get_strategy_name(self) -> str:
         """Get strategy name."""
@@ -61,42 +113,93 @@ class FewShotStrategy(PromptStrategy):
     """Few-shot prompting: includes 2-3 examples before the task.
 
     This strategy provides example inputs and outputs to guide the model
-    before presenting the actual evaluation task.
+    before presenting the actual evaluation task. By default the first
+    examples of the task are used; they can instead be chosen by similarity
+    to the evaluation input, and limited to those fitting a token budget
+    (see prompts.selection).
     """
 
-    def build_prompt(self, task: Task, num_examples: int = 2, **kwargs) -> str:
+    def __init__(self):
+        self._indexes = ExampleIndexCache()
+
+    def build_prompt(
+        self,
+        task: Task,
+        num_examples: int = 2,
+        selection: str = "first",
+        token_budget: Optional[int] = None,
+        **kwargs
+    ) -> str:
         """Build a few-shot prompt with examples.
 
         Args:
             task: The Task object
             num_examples: Number of examples to include (default: 2)
+            selection: "first" to take examples in task order, or "similar"
+                to take the examples most similar to the input (default: "first")
+            token_budget: Estimated tokens the whole prompt may use; examples
+                that do not fit are left out (default: no limit)
 
         Returns:
             Prompt with examples followed by the actual task
         """
-        if not task.development_examples:
-            # Fallback to zero-shot if no examples available
-            return ZeroShotStrategy().build_prompt(task)
-
-        # Limit to available examples
-        num_examples = min(num_examples, len(task.development_examples))
-        examples = task.development_examples[:num_examples]
-
-        # Build examples section
-        examples_text = "Here are some examples:\n\n"
-        for i, example in enumerate(examples, 1):
-            examples_text += f"Example {i}:\n"
-            examples_text += f"Input: {example.input}\n"
-            examples_text += f"Output: {example.output}\n"
-            if example.explanation:
-                examples_text += f"Explanation: {example.explanation}\n"
-            examples_text += "\n"
+        return self.compile(
+            task, num_examples=num_examples, selection=selection,
+            token_budget=token_budget, query=task.evaluation_input
+        ).render(task.evaluation_input)
+
+    def compile(
+        self,
+        task: Task,
+        num_examples: int = 2,
+        selection: str = "first",
+        token_budget: Optional[int] = None,
+        query: Optional[str] = None,
+        **kwargs
+    ) -> PromptTemplate:
+        """Compile the few-shot template: description and examples block.
 
-        # Combine with actual task
-        return f"""{task.description}
+        Args:
+            task: The Task object
+            num_examples: Number of examples to include (default: 2)
+            selection: "first" or "similar" (default: "first")
+            token_budget: Estimated tokens the whole prompt may use
+                (default: no limit)
+            query: Evaluation input the template is for; needed when
+                uses_input() is True
 
-{examples_text}Now solve this:
-{task.evaluation_input}"""
+        Returns:
+            Template ending in "Now solve this:" before the input, or the
+            zero-shot template if no example is available or fits
+        """
+        if not task.development_examples:
+            # Fallback to zero-shot if no examples available
+            return ZeroShotStrategy().compile(task)
+
+        head = f"{task.description}\n\nHere are some examples:\n\n"
+        tail = "Now solve this:\n"
+        if selection == "first" and token_budget is None:
+            # Limit to available examples
+            examples = task.development_examples[:num_examples]
+        else:
+            examples_budget = None
+            if token_budget is not None:
+                examples_budget = token_budget - estimate_tokens(f"{head}{tail}{query or ''}")
+            examples = select_examples(
+                self._indexes.get(task), num_examples, selection, examples_budget, query or ""
+            )
+            if not examples:
+                return ZeroShotStrategy().compile(task)
+
+        # Build examples section, then combine with actual task
+        parts = [head]
+        parts.extend(format_example(i, example) for i, example in enumerate(examples, 1))
+        parts.append(tail)
+        return PromptTemplate(prefix="".join(parts))
+
+    def uses_input(self, selection: str = "first", token_budget: Optional[int] = None, **kwargs) -> bool:
+        """Whether examples are chosen by similarity or fitted to a budget, both of which depend on the input."""
+        return selection != "first" or token_budget is not None
 
     def get_strategy_name(self) -> str:
         """Get strategy name."""
@@ -120,9 +223,13 @@ class ChainOfThoughtStrategy(PromptStrategy):
         Returns:
             Prompt with step-by-step reasoning instructions
         """
-        return f"""{task.description}
+        return self.compile(task).render(task.evaluation_input)
 
-{task.evaluation_input}
+    def compile(self, task: Task, **kwargs) -> PromptTemplate:
+        """Compile the chain-of-thought template: description and reasoning instructions."""
+        return PromptTemplate(
+            prefix=f"{task.description}\n\n",
+            suffix="""
 
 Let's approach this step by step:
 1. First, analyze the problem carefully
@@ -130,6 +237,7 @@ Let's approach this step by step:
 3. Finally, provide your answer
 
 Please show your reasoning at each step."""
+        )
 
     def get_strategy_name(self) -> str:
         """Get strategy name."""
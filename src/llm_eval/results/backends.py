@@ -0,0 +1,283 @@
+"""Pluggable on-disk formats for evaluation results."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from .result import EvaluationResult
+
+
+logger = logging.getLogger(__name__)
+
+# File name of the append-only segment in a JSONL run directory
+SEGMENT_NAME = "results.jsonl"
+
+
+def write_atomic(filepath: Path, content: str):
+    """Write a file so readers never observe a partially written result.
+
+    Args:
+        filepath: Destination path
+        content: Text content to write
+    """
+    tmp_path = filepath.with_name(f".{filepath.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
+
+
+class ResultsBackend(ABC):
+    """Abstract base class for result storage formats.
+
+    A backend knows how to write results into a run directory and how to
+    read them back. ResultsStorage writes with one configured backend but
+    reads with all of them, so runs in different formats can coexist.
+    Callers are responsible for serializing writes.
+    """
+
+    name: str = ""
+    append_only: bool = False
+
+    @abstractmethod
+    def save(self, result: EvaluationResult, run_dir: Path) -> Path:
+        """Persist a result in the run directory.
+
+        Args:
+            result: The EvaluationResult to save
+            run_dir: Run directory (must exist)
+
+        Returns:
+            Location the result was written to
+        """
+        pass
+
+    @abstractmethod
+    def iter_results(
+        self,
+        run_dir: Path,
+        task_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> Iterator[Tuple[Path, EvaluationResult]]:
+        """Iterate results stored in this format, with optional filters.
+
+        Args:
+            run_dir: Run directory to read
+            task_id: Filter by task ID
+            model_name: Filter by model name
+            strategy: Filter by strategy name
+
+        Yields:
+            (location, result) pairs; location can be passed to update()
+        """
+        pass
+
+    @abstractmethod
+    def update(self, location: Path, result: EvaluationResult):
+        """Replace a stored result.
+
+        Args:
+            location: Location returned by save() or iter_results()
+            result: Updated EvaluationResult
+        """
+        pass
+
+    @abstractmethod
+    def owns(self, location: Path) -> bool:
+        """Check whether a location belongs to this format."""
+        pass
+
+    def last_modified(self, run_dir: Path) -> float:
+        """Timestamp of the most recent write to a run directory."""
+        return run_dir.stat().st_mtime
+
+
+class FileBackend(ResultsBackend):
+    """One JSON file plus one ``_res.md`` response file per evaluation cell.
+
+    This is the original layout and the one the manual scoring workflow
+    edits by hand.
+    """
+
+    name = "files"
+
+    @staticmethod
+    def result_path(result: EvaluationResult, run_dir: Path) -> Path:
+        """Path of the JSON file for a result: {task_id}_{model}_{strategy}.json.
+
+        Results of dataset items are named {task_id}_{item_id}_{model}_{strategy}.json;
+        item IDs that are not filename-safe are replaced by a safe form plus a
+        short hash, so distinct IDs never share a file.
+        """
+        model_short = result.model_name.replace(":", "_").replace("/", "_")
+        task_part = result.task_id
+        if result.item_id is not None:
+            item_part = re.sub(r"[^A-Za-z0-9._-]", "_", result.item_id)[:64]
+            if item_part != result.item_id:
+                item_part += "-" + hashlib.sha1(result.item_id.encode("utf-8")).hexdigest()[:8]
+            task_part = f"{task_part}_{item_part}"
+        return run_dir / f"{task_part}_{model_short}_{result.strategy}.json"
+
+    def save(self, result: EvaluationResult, run_dir: Path) -> Path:
+        json_filepath = self.result_path(result, run_dir)
+        md_filepath = json_filepath.with_name(f"{json_filepath.stem}_res.md")
+
+        # Save JSON file
+        write_atomic(json_filepath, result.to_json())
+
+        # Save markdown file with just the response
+        write_atomic(md_filepath, result.response)
+
+        logger.debug(f"Saved result to: {json_filepath}")
+        logger.debug(f"Saved response to: {md_filepath}")
+        return json_filepath
+
+    @staticmethod
+    def load_file(filepath: Path) -> Optional[EvaluationResult]:
+        """Load a single result from a JSON file.
+
+        Args:
+            filepath: Path to the JSON file
+
+        Returns:
+            EvaluationResult if successful, None otherwise
+        """
+        try:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+            return EvaluationResult.from_dict(data)
+        except Exception as e:
+            logger.error(f"Failed to load result from {filepath}: {e}")
+            return None
+
+    def iter_results(
+        self,
+        run_dir: Path,
+        task_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> Iterator[Tuple[Path, EvaluationResult]]:
+        for filepath in run_dir.glob("*.json"):
+            result = self.load_file(filepath)
+            if result is None:
+                continue
+
+            # Apply filters
+            if task_id and result.task_id != task_id:
+                continue
+            if model_name and result.model_name != model_name:
+                continue
+            if strategy and result.strategy != strategy:
+                continue
+
+            yield filepath, result
+
+    def update(self, location: Path, result: EvaluationResult):
+        write_atomic(location, result.to_json())
+
+    def owns(self, location: Path) -> bool:
+        return location.suffix == ".json"
+
+
+class JsonlBackend(ResultsBackend):
+    """Append-only JSONL segment, one per run directory.
+
+    Every save or update appends one line, so a run costs a single file no
+    matter how many cells it has. When a cell appears more than once, the
+    last record wins. Filtered reads check each raw line for the serialized
+    filter values before parsing it, so non-matching records are never
+    deserialized.
+    """
+
+    name = "jsonl"
+    append_only = True
+
+    @staticmethod
+    def segment_path(run_dir: Path) -> Path:
+        """Path of the run's JSONL segment."""
+        return run_dir / SEGMENT_NAME
+
+    def save(self, result: EvaluationResult, run_dir: Path) -> Path:
+        segment = self.segment_path(run_dir)
+        self.update(segment, result)
+        logger.debug(f"Appended result to: {segment}")
+        return segment
+
+    def iter_results(
+        self,
+        run_dir: Path,
+        task_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+        strategy: Optional[str] = None
+    ) -> Iterator[Tuple[Path, EvaluationResult]]:
+        segment = self.segment_path(run_dir)
+        if not segment.exists():
+            return
+
+        filters = {"task_id": task_id, "model_name": model_name, "strategy": strategy}
+        filters = {key: value for key, value in filters.items() if value}
+        needles = [f'"{key}": {json.dumps(value)}' for key, value in filters.items()]
+
+        latest: Dict[Tuple, EvaluationResult] = {}
+        with open(segment, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                # Cheap pre-filter on the raw line; confirmed after parsing
+                if not all(needle in line for needle in needles):
+                    continue
+                try:
+                    result = EvaluationResult.from_dict(json.loads(line))
+                except Exception as e:
+                    logger.error(f"Skipping invalid record {segment}:{line_number}: {e}")
+                    continue
+                if any(getattr(result, key) != value for key, value in filters.items()):
+                    continue
+                latest[result.cell_key] = result
+
+        for result in latest.values():
+            yield segment, result
+
+    def update(self, location: Path, result: EvaluationResult):
+        with open(location, 'a') as f:
+            f.write(json.dumps(result.to_dict()) + "\n")
+
+    def owns(self, location: Path) -> bool:
+        return location.suffix == ".jsonl"
+
+    def last_modified(self, run_dir: Path) -> float:
+        segment = self.segment_path(run_dir)
+        if segment.exists():
+            return max(run_dir.stat().st_mtime, segment.stat().st_mtime)
+        return run_dir.stat().st_mtime
+
+
+# Backend registry for easy access
+BACKENDS = {
+    "files": FileBackend,
+    "jsonl": JsonlBackend
+}
+
+
+def get_backend(backend_name: str) -> ResultsBackend:
+    """Create a results backend by name.
+
+    Args:
+        backend_name: Name of the backend ("files", "jsonl")
+
+    Returns:
+        A new ResultsBackend instance
+
+    Raises:
+        KeyError: If backend name is not recognized
+    """
+    if backend_name not in BACKENDS:
+        raise KeyError(
+            f"Storage backend '{backend_name}' not found. "
+            f"Available backends: {list(BACKENDS.keys())}"
+        )
+    return BACKENDS[backend_name]()
@@ -0,0 +1,318 @@
+"""SQLite index of evaluation results for fast filtered queries across runs."""
+
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .result import EvaluationResult
+from .summary import RunningSummary, SummaryRecord, sample_statistics
+
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    item_id TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL,
+    timestamp TEXT,
+    generation_time_ms INTEGER,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    load_duration_ms INTEGER,
+    prompt_eval_duration_ms INTEGER,
+    time_to_first_token_ms INTEGER,
+    tokens_per_second REAL,
+    total_duration_ms INTEGER,
+    eval_duration_ms INTEGER,
+    client_overhead_ms INTEGER,
+    prompt_tokens_per_second REAL,
+    eval_tokens_per_second REAL,
+    n_samples INTEGER,
+    sample_generation_time_ms INTEGER,
+    generation_time_stdev_ms REAL,
+    completion_tokens_stdev REAL,
+    distinct_response_ratio REAL,
+    is_error INTEGER NOT NULL DEFAULT 0,
+    scores TEXT,
+    total_score INTEGER,
+    PRIMARY KEY (run_id, task_id, model_name, strategy, item_id)
+);
+CREATE INDEX IF NOT EXISTS idx_results_task ON results (task_id);
+CREATE INDEX IF NOT EXISTS idx_results_model ON results (model_name);
+CREATE INDEX IF NOT EXISTS idx_results_strategy ON results (strategy);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    indexed_mtime REAL NOT NULL
+);
+"""
+
+# Columns added after the first schema version, created on open if missing.
+# Changes to the primary key cannot be migrated this way; see _rebuild_if_outdated.
+_ADDED_COLUMNS = {
+    "prompt_eval_duration_ms": "INTEGER",
+    "total_duration_ms": "INTEGER",
+    "eval_duration_ms": "INTEGER",
+    "client_overhead_ms": "INTEGER",
+    "prompt_tokens_per_second": "REAL",
+    "eval_tokens_per_second": "REAL",
+    "n_samples": "INTEGER",
+    "sample_generation_time_ms": "INTEGER",
+    "generation_time_stdev_ms": "REAL",
+    "completion_tokens_stdev": "REAL",
+    "distinct_response_ratio": "REAL"
+}
+
+# Timing breakdown columns, named like the EvaluationResult fields
+_TIMING_COLUMNS = (
+    "total_duration_ms", "eval_duration_ms", "client_overhead_ms",
+    "prompt_tokens_per_second", "eval_tokens_per_second"
+)
+
+# Sampling statistics stored per row, in SummaryRecord field order
+_SAMPLING_COLUMNS = (
+    "n_samples", "sample_generation_time_ms", "generation_time_stdev_ms",
+    "completion_tokens_stdev", "distinct_response_ratio"
+)
+
+
+class ResultsIndex:
+    """SQLite index over stored results.
+
+    The index holds one row per evaluation cell with identifiers, timings,
+    token counts and scores, plus where the full result is stored. It is
+    kept up to date incrementally by ResultsStorage, and runs written
+    without the index are picked up by comparing modification times.
+
+    Processes sharing a results directory (e.g. distributed workers) share
+    its index. Like the work queue, the database uses the default rollback
+    journal rather than WAL, since WAL does not work on network file
+    systems. Every write takes the write lock up front (BEGIN IMMEDIATE),
+    and writes grouped with ``transaction`` commit once.
+
+    The index is not thread-safe on its own; ResultsStorage serializes
+    access with its lock.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (or create) the index database.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._depth = 0
+        # Indexes created by earlier versions may have switched to WAL, which persists
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        with self.transaction():
+            self._rebuild_if_outdated()
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    self._conn.execute(statement)
+            self._add_missing_columns()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one transaction holding the write lock.
+
+        Nested uses join the outermost transaction, which commits (or rolls
+        back on error) when it exits.
+        """
+        if self._depth == 0:
+            self._conn.execute("BEGIN IMMEDIATE")
+        self._depth += 1
+        try:
+            yield
+        except BaseException:
+            self._depth -= 1
+            if self._depth == 0:
+                self._conn.execute("ROLLBACK")
+            raise
+        self._depth -= 1
+        if self._depth == 0:
+            self._conn.execute("COMMIT")
+
+    def _rebuild_if_outdated(self):
+        """Drop an index whose primary key predates dataset items.
+
+        The index only mirrors stored results, so dropping it loses nothing:
+        every run is indexed again from its files on the next sync.
+        """
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(results)")}
+        if existing and "item_id" not in existing:
+            logger.info(f"Rebuilding results index {self.db_path} for item IDs")
+            self._conn.execute("DROP TABLE results")
+            self._conn.execute("DROP TABLE IF EXISTS runs")
+
+    def _add_missing_columns(self):
+        """Upgrade an index created by an older version of the schema."""
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(results)")}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in existing:
+                self._conn.execute(f"ALTER TABLE results ADD COLUMN {column} {column_type}")
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def upsert(self, run_id: str, result: EvaluationResult, location: Path):
+        """Insert or replace the row for a result's cell.
+
+        Args:
+            run_id: Run identifier
+            result: The stored EvaluationResult
+            location: JSON file or JSONL segment holding the result
+        """
+        sampling = sample_statistics(result)
+        with self.transaction():
+            self._upsert(run_id, result, location, sampling)
+
+    def _upsert(self, run_id: str, result: EvaluationResult, location: Path, sampling: Dict):
+        self._conn.execute(
+            f"""
+            INSERT OR REPLACE INTO results (
+                run_id, task_id, model_name, strategy, item_id, location, timestamp,
+                generation_time_ms, prompt_tokens, completion_tokens,
+                load_duration_ms, prompt_eval_duration_ms, time_to_first_token_ms,
+                tokens_per_second, {", ".join(_TIMING_COLUMNS + _SAMPLING_COLUMNS)},
+                is_error, scores, total_score
+            ) VALUES ({", ".join("?" * (17 + len(_TIMING_COLUMNS) + len(_SAMPLING_COLUMNS)))})
+            """,
+            (
+                run_id, result.task_id, result.model_name, result.strategy,
+                result.item_id or "", str(location), result.timestamp,
+                result.generation_time_ms, result.prompt_tokens, result.completion_tokens,
+                result.load_duration_ms, result.prompt_eval_duration_ms,
+                result.time_to_first_token_ms, result.tokens_per_second,
+                *(getattr(result, column) for column in _TIMING_COLUMNS),
+                *(sampling[column] for column in _SAMPLING_COLUMNS),
+                int(result.response.startswith("ERROR:")),
+                json.dumps(result.scores) if result.scores is not None else None,
+                result.total_score
+            )
+        )
+
+    def mark_run(self, run_id: str, mtime: float):
+        """Record that a run is indexed up to the given modification time."""
+        with self.transaction():
+            self._conn.execute(
+                "INSERT OR REPLACE INTO runs (run_id, indexed_mtime) VALUES (?, ?)",
+                (run_id, mtime)
+            )
+
+    def indexed_mtime(self, run_id: str) -> Optional[float]:
+        """Modification time a run is indexed up to, or None if it is not indexed."""
+        row = self._conn.execute(
+            "SELECT indexed_mtime FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return row["indexed_mtime"] if row is not None else None
+
+    def indexed_runs(self) -> Dict[str, float]:
+        """Get indexed runs and the modification time they were indexed at."""
+        rows = self._conn.execute("SELECT run_id, indexed_mtime FROM runs").fetchall()
+        return {row["run_id"]: row["indexed_mtime"] for row in rows}
+
+    def drop_run(self, run_id: str):
+        """Remove all rows of a run."""
+        with self.transaction():
+            self._conn.execute("DELETE FROM results WHERE run_id = ?", (run_id,))
+            self._conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+    @staticmethod
+    def _where(
+        run_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+        strategy: Optional[str] = None,
+        item_id: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause for the given filters."""
+        filters = {
+            "run_id": run_id,
+            "task_id": task_id,
+            "model_name": model_name,
+            "strategy": strategy,
+            "item_id": item_id
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params = [value for value in filters.values() if value]
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def query(
+        self,
+        run_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+        strategy: Optional[str] = None,
+        item_id: Optional[str] = None
+    ) -> List[sqlite3.Row]:
+        """Find indexed cells matching the filters.
+
+        Args:
+            run_id: Filter by run ID
+            task_id: Filter by task ID
+            model_name: Filter by model name
+            strategy: Filter by strategy name
+            item_id: Filter by dataset item ID
+
+        Returns:
+            Matching rows (run_id, task_id, model_name, strategy, item_id,
+            location, ...); item_id is '' for tasks without a dataset
+        """
+        where, params = self._where(run_id, task_id, model_name, strategy, item_id)
+        return self._conn.execute(f"SELECT * FROM results {where}", params).fetchall()
+
+    def summary(self, run_id: Optional[str] = None) -> Dict:
+        """Compute summary statistics from indexed rows.
+
+        Only the index columns are read; no result files are opened.
+
+        Args:
+            run_id: Optional run ID to summarize
+
+        Returns:
+            Dictionary with the same keys as ResultsStorage.generate_summary_report
+        """
+        where, params = self._where(run_id)
+        rows = self._conn.execute(
+            f"""
+            SELECT
+                run_id, task_id, model_name, strategy, item_id, generation_time_ms,
+                completion_tokens, scores IS NOT NULL AS scored, load_duration_ms,
+                prompt_eval_duration_ms, time_to_first_token_ms, tokens_per_second,
+                {", ".join(_TIMING_COLUMNS + _SAMPLING_COLUMNS)}
+            FROM results {where}
+            """,
+            params
+        )
+
+        summary = RunningSummary()
+        for row in rows:
+            summary.add_record(
+                (row["run_id"], row["task_id"], row["model_name"], row["strategy"], row["item_id"]),
+                SummaryRecord(
+                    task_id=row["task_id"],
+                    model_name=row["model_name"],
+                    strategy=row["strategy"],
+                    generation_time_ms=row["generation_time_ms"] or 0,
+                    completion_tokens=row["completion_tokens"] or 0,
+                    scored=bool(row["scored"]),
+                    load_duration_ms=row["load_duration_ms"],
+                    prompt_eval_duration_ms=row["prompt_eval_duration_ms"],
+                    time_to_first_token_ms=row["time_to_first_token_ms"],
+                    tokens_per_second=row["tokens_per_second"],
+                    **{column: row[column] for column in _TIMING_COLUMNS + _SAMPLING_COLUMNS}
+                )
+            )
+        return summary.to_dict()
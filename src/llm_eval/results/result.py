@@ -0,0 +1,99 @@
+"""Evaluation result data structure."""
+
+import json
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class EvaluationResult:
+    """Single evaluation result.
+
+    This class stores all information about a single evaluation run,
+    including the prompt, response, metadata, and scores (filled in later).
+    """
+    # Identifiers
+    task_id: str
+    model_name: str
+    strategy: str
+
+    # Input/Output
+    prompt: str
+    response: str
+
+    # Metadata
+    timestamp: str
+
+    # Dataset item of the task; None for a task's single built-in input
+    item_id: Optional[str] = None
+
+    # Hex SHA-256 of the prompt; equal hashes mean identical prompts
+    prompt_hash: Optional[str] = None
+
+    model_config: Dict[str, Any] = field(default_factory=dict)
+
+    # Performance metrics
+    generation_time_ms: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    # Streaming latency metrics (only recorded for streamed generations)
+    time_to_first_token_ms: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    inter_token_latency_ms: Optional[float] = None
+    inter_token_latency_p95_ms: Optional[float] = None
+
+    # Time Ollama spent loading the model for this request
+    load_duration_ms: Optional[int] = None
+
+    # Time Ollama spent evaluating the prompt; shorter when a cached prefix is reused
+    prompt_eval_duration_ms: Optional[int] = None
+
+    # Remaining Ollama timings: whole request on the server, and decoding
+    total_duration_ms: Optional[int] = None
+    eval_duration_ms: Optional[int] = None
+
+    # Derived from the timings above: prompt processing and decode rates, and
+    # client time not spent on the server (network, HTTP and JSON handling)
+    prompt_tokens_per_second: Optional[float] = None
+    eval_tokens_per_second: Optional[float] = None
+    client_overhead_ms: Optional[int] = None
+
+    # True if the response was served from the response cache
+    cache_hit: bool = False
+
+    # Generation attempts retried after transient failures
+    retries: int = 0
+
+    # Repeated sampling: one entry per sample (seed, response, timings,
+    # token counts); the fields above describe the first sample
+    samples: Optional[List[Dict[str, Any]]] = None
+
+    # Evaluation (filled in manually later)
+    scores: Optional[Dict[str, int]] = None
+    total_score: Optional[int] = None
+    evaluator_notes: Optional[str] = None
+
+    @property
+    def cell_key(self) -> Tuple[str, str, str, Optional[str]]:
+        """Identity of the evaluation cell: (task_id, model_name, strategy, item_id)."""
+        return (self.task_id, self.model_name, self.strategy, self.item_id)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+    def to_json(self) -> str:
+        """Convert to JSON string."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "EvaluationResult":
+        """Create from dictionary."""
+        return cls(**data)
+
+    @classmethod
+    def from_json(cls, json_str: str) -> "EvaluationResult":
+        """Create from JSON string."""
+        data = json.loads(json_str)
+        return cls.from_dict(data)
@@ -2,98 +2,77 @@
 
 import json
 import logging
-from dataclasses import dataclass, field, asdict
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
-import pandas as pd
+from .backends import BACKENDS, FileBackend, ResultsBackend, get_backend
+from .index import ResultsIndex
+from .result import EvaluationResult
+from .summary import RunningSummary, summarize
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class EvaluationResult:
-    """Single evaluation result.
-
-    This class stores all information about a single evaluation run,
-    including the prompt, response, metadata, and scores (filled in later).
-    """
-    # Identifiers
-    task_id: str
-    model_name: str
-    strategy: str
-
-    # Input/Output
-    prompt: str
-    response: str
-
-    # Metadata
-    timestamp: str
-    model_config: Dict[str, Any] = field(default_factory=dict)
-
-    # Performance metrics
-    generation_time_ms: int = 0
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-
-    # Evaluation (filled in manually later)
-    scores: Optional[Dict[str, int]] = None
-    total_score: Optional[int] = None
-    evaluator_notes: Optional[str] = None
-
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization."""
-        return asdict(self)
-
-    def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
-
-    @classmethod
-    def from_dict(cls, data: Dict) -> "EvaluationResult":
-        """Create from dictionary."""
-        return cls(**data)
-
-    @classmethod
-    def from_json(cls, json_str: str) -> "EvaluationResult":
-        """Create from JSON string."""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
-
-
 class ResultsStorage:
     """Manager for storing and retrieving evaluation results.
 
-    Results are stored as JSON files in a hierarchical directory structure.
+    Results are stored per run in a hierarchical directory structure, in the
+    format of the configured backend (per-cell JSON files by default, or an
+    append-only JSONL segment). Reads understand every backend format, so
+    runs written in different formats can be loaded side by side.
+    Saving is thread-safe, so a single instance can be shared by concurrent
+    evaluation workers.
+
+    With ``use_index=True`` a SQLite index (``<base_path>/index.sqlite``) is
+    maintained on every save and update. Filtered loads and summaries then
+    become indexed queries instead of scans over every run directory. A save
+    only adds its own row; runs changed by writers that do not use the index
+    are re-indexed when they are next read.
+
+    Runs registered with ``track_run`` also keep a RunningSummary that is
+    updated on every save, so their summary is available at any time during
+    the run without reloading results.
     """
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, backend: str = "files", use_index: bool = False):
         """Initialize results storage.
 
         Args:
             base_path: Base directory for storing results (e.g., data/results)
+            backend: Storage format for new results, one of BACKENDS
+                (default: "files")
+            use_index: Maintain and query a SQLite results index (default: False)
         """
         self.base_path = Path(base_path)
         self.raw_dir = self.base_path / "raw"
         self.reports_dir = self.base_path / "reports"
+        self.backend: ResultsBackend = get_backend(backend)
+        self._readers: List[ResultsBackend] = [get_backend(name) for name in BACKENDS]
+        self._lock = threading.RLock()
+        self._summaries: Dict[str, RunningSummary] = {}
 
         # Create directories if they don't exist
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.reports_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Results storage initialized at: {self.base_path}")
+        self.index: Optional[ResultsIndex] = None
+        if use_index:
+            self.index = ResultsIndex(self.base_path / "index.sqlite")
+
+        logger.info(f"Results storage initialized at: {self.base_path} (backend: {backend})")
 
     def save_result(self, result: EvaluationResult, run_id: Optional[str] = None) -> Path:
-        """Save a single evaluation result as JSON and markdown.
+        """Save a single evaluation result using the configured backend.
 
         Args:
             result: The EvaluationResult to save
             run_id: Optional run identifier for organizing results
 
         Returns:
-            Path to the saved JSON file
+            Path the result was written to (JSON file or JSONL segment)
         """
         # Generate run ID if not provided
         if run_id is None:
@@ -101,25 +80,125 @@ class ResultsStorage:
 
         # Create run-specific directory
         run_dir = self.raw_dir / run_id
-        run_dir.mkdir(exist_ok=True)
+        try:
+            run_dir.mkdir()
+            created = True
+        except FileExistsError:
+            created = False
+
+        with self._lock:
+            if self.index is None:
+                location = self.backend.save(result, run_dir)
+            else:
+                # Other writers may share the directory and the index, so the
+                # run is neither rescanned nor marked up to date unless the
+                # index covered every earlier write (see _sync_run)
+                in_sync = created or self.index.indexed_mtime(run_id) == self._run_mtime(run_dir)
+                location = self.backend.save(result, run_dir)
+                with self.index.transaction():
+                    if created:
+                        # Rows of an earlier run directory with the same name
+                        self.index.drop_run(run_id)
+                    self.index.upsert(run_id, result, location)
+                    if in_sync:
+                        self._mark_indexed(run_dir)
+
+            if run_id in self._summaries:
+                self._summaries[run_id].add(result)
+            return location
+
+    def track_run(self, run_id: str):
+        """Maintain a running summary for a run as results are saved.
+
+        Results already stored for the run (e.g. when resuming) are loaded
+        once to seed the summary.
 
-        # Generate base filename: {task_id}_{model}_{strategy}
-        model_short = result.model_name.replace(":", "_").replace("/", "_")
-        base_filename = f"{result.task_id}_{model_short}_{result.strategy}"
+        Args:
+            run_id: Run identifier
+        """
+        with self._lock:
+            if run_id in self._summaries:
+                return
+            existing = []
+            if (self.raw_dir / run_id).is_dir():
+                existing = self.load_results(run_id=run_id)
+            self._summaries[run_id] = RunningSummary.from_results(existing)
+
+    def get_live_summary(self, run_id: str) -> Optional[Dict]:
+        """Get the current summary of a tracked run.
+
+        Args:
+            run_id: Run identifier
 
-        # Save JSON file
-        json_filepath = run_dir / f"{base_filename}.json"
-        with open(json_filepath, 'w') as f:
-            f.write(result.to_json())
+        Returns:
+            Summary dictionary, or None if the run is not tracked
+        """
+        with self._lock:
+            summary = self._summaries.get(run_id)
+            return summary.to_dict() if summary is not None else None
+
+    def _run_mtime(self, run_dir: Path) -> float:
+        """Most recent write to a run directory across all formats."""
+        return max(reader.last_modified(run_dir) for reader in self._readers)
+
+    def _mark_indexed(self, run_dir: Path):
+        """Record a run as indexed up to its current modification time."""
+        self.index.mark_run(run_dir.name, self._run_mtime(run_dir))
 
-        # Save markdown file with just the response
-        md_filepath = run_dir / f"{base_filename}_res.md"
-        with open(md_filepath, 'w') as f:
-            f.write(result.response)
+    def _sync_run(self, run_dir: Path, indexed_mtime: Optional[float] = None):
+        """Re-index a run if it changed since it was last indexed.
 
-        logger.debug(f"Saved result to: {json_filepath}")
-        logger.debug(f"Saved response to: {md_filepath}")
-        return json_filepath
+        Catches runs written without the index. The indexed modification
+        time is kept in the index itself, so saves by other processes that
+        use the index do not cause a rescan.
+
+        Args:
+            run_dir: Run directory
+            indexed_mtime: The run's indexed modification time, if already
+                looked up (default: read from the index)
+        """
+        if not run_dir.exists():
+            return
+        if indexed_mtime is None:
+            indexed_mtime = self.index.indexed_mtime(run_dir.name)
+        if indexed_mtime == self._run_mtime(run_dir):
+            return
+
+        logger.debug(f"Indexing run: {run_dir.name}")
+        with self.index.transaction():
+            self.index.drop_run(run_dir.name)
+            # Later formats override earlier ones for the same cell
+            for reader in self._readers:
+                for location, result in reader.iter_results(run_dir):
+                    self.index.upsert(run_dir.name, result, location)
+            self._mark_indexed(run_dir)
+
+    def _sync_index(self, run_id: Optional[str] = None):
+        """Bring the index up to date for one run or all runs."""
+        if run_id:
+            self._sync_run(self.raw_dir / run_id)
+            return
+
+        indexed = self.index.indexed_runs()
+        run_dirs = {d.name: d for d in self.raw_dir.iterdir() if d.is_dir()}
+        for name in set(indexed) - set(run_dirs):
+            self.index.drop_run(name)
+        for name, run_dir in run_dirs.items():
+            self._sync_run(run_dir, indexed.get(name))
+
+    def rebuild_index(self):
+        """Re-index every run from scratch.
+
+        Needed only if result files were edited in place without changing
+        their run directory's modification time.
+        """
+        if self.index is None:
+            return
+        with self._lock:
+            with self.index.transaction():
+                for run_id in self.index.indexed_runs():
+                    self.index.drop_run(run_id)
+            self._sync_index()
 
     def load_result(self, filepath: Path) -> Optional[EvaluationResult]:
         """Load a single result from JSON file.
@@ -130,13 +209,7 @@ class ResultsStorage:
         Returns:
             EvaluationResult if successful, None otherwise
         """
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            return EvaluationResult.from_dict(data)
-        except Exception as e:
-            logger.error(f"Failed to load result from {filepath}: {e}")
-            return None
+        return FileBackend.load_file(filepath)
 
     def load_results(
         self,
@@ -156,6 +229,9 @@ class ResultsStorage:
         Returns:
             List of matching EvaluationResult objects
         """
+        if self.index is not None:
+            return self._load_indexed(run_id, task_id, model_name, strategy)
+
         results = []
 
         # Determine which directories to search
@@ -164,29 +240,100 @@ class ResultsStorage:
         else:
             search_dirs = [d for d in self.raw_dir.iterdir() if d.is_dir()]
 
-        # Load all JSON files from search directories
         for search_dir in search_dirs:
             if not search_dir.exists():
                 continue
 
-            for filepath in search_dir.glob("*.json"):
-                result = self.load_result(filepath)
-                if result is None:
-                    continue
+            # Later formats override earlier ones for the same cell
+            run_results: Dict[Tuple, EvaluationResult] = {}
+            for reader in self._readers:
+                for _, result in reader.iter_results(
+                    search_dir,
+                    task_id=task_id,
+                    model_name=model_name,
+                    strategy=strategy
+                ):
+                    run_results[result.cell_key] = result
+            results.extend(run_results.values())
 
-                # Apply filters
-                if task_id and result.task_id != task_id:
-                    continue
-                if model_name and result.model_name != model_name:
-                    continue
-                if strategy and result.strategy != strategy:
-                    continue
+        logger.info(f"Loaded {len(results)} results")
+        return results
 
-                results.append(result)
+    def _load_indexed(
+        self,
+        run_id: Optional[str],
+        task_id: Optional[str],
+        model_name: Optional[str],
+        strategy: Optional[str]
+    ) -> List[EvaluationResult]:
+        """Load results by looking up matching cells in the index first.
 
-        logger.info(f"Loaded {len(results)} results")
+        Only JSON files of matching cells are opened; JSONL segments are
+        read with the same filters and narrowed to the matching cells.
+        """
+        with self._lock:
+            self._sync_index(run_id)
+            rows = self.index.query(run_id, task_id, model_name, strategy)
+
+        wanted: Dict[str, set] = {}
+        for row in rows:
+            wanted.setdefault(row["location"], set()).add(
+                (row["task_id"], row["model_name"], row["strategy"], row["item_id"] or None)
+            )
+
+        results = []
+        for location, cells in wanted.items():
+            path = Path(location)
+            if path.suffix == ".json":
+                result = FileBackend.load_file(path)
+                if result is not None:
+                    results.append(result)
+                continue
+
+            for reader in self._readers:
+                if not reader.owns(path):
+                    continue
+                for _, result in reader.iter_results(
+                    path.parent,
+                    task_id=task_id,
+                    model_name=model_name,
+                    strategy=strategy
+                ):
+                    if result.cell_key in cells:
+                        results.append(result)
+
+        logger.info(f"Loaded {len(results)} results (indexed)")
         return results
 
+    def get_completed_cells(self, run_id: str) -> Set[Tuple[str, str, str, Optional[str]]]:
+        """Get the cells of a run that finished successfully.
+
+        Results whose response is an ``ERROR:`` placeholder count as not
+        completed, so resuming a run retries them.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Set of (task_id, model_name, strategy, item_id) tuples; item_id
+            is None for tasks without a dataset
+        """
+        if self.index is not None:
+            with self._lock:
+                self._sync_index(run_id)
+                rows = self.index.query(run_id=run_id)
+            return {
+                (row["task_id"], row["model_name"], row["strategy"], row["item_id"] or None)
+                for row in rows if not row["is_error"]
+            }
+
+        completed = set()
+        for result in self.load_results(run_id=run_id):
+            if result.response.startswith("ERROR:"):
+                continue
+            completed.add(result.cell_key)
+        return completed
+
     def export_to_csv(self, output_path: Path, run_id: Optional[str] = None):
         """Export results to CSV for analysis.
 
@@ -203,7 +350,9 @@ class ResultsStorage:
         # Convert to list of dicts
         data = [result.to_dict() for result in results]
 
-        # Create DataFrame
+        # Create DataFrame (pandas is only imported by exports)
+        import pandas as pd
+
         df = pd.DataFrame(data)
 
         # Save to CSV
@@ -213,36 +362,35 @@ class ResultsStorage:
     def generate_summary_report(self, run_id: Optional[str] = None) -> Dict:
         """Generate summary statistics for results.
 
+        Tracked runs are answered from their running summary; otherwise
+        the index or the stored results are aggregated in one pass.
+
         Args:
             run_id: Optional run ID to summarize
 
         Returns:
             Dictionary with summary statistics
         """
-        results = self.load_results(run_id=run_id)
+        if run_id is not None:
+            live = self.get_live_summary(run_id)
+            if live is not None:
+                return live
 
-        if not results:
-            return {"error": "No results found"}
-
-        summary = {
-            "total_evaluations": len(results),
-            "tasks": list(set(r.task_id for r in results)),
-            "models": list(set(r.model_name for r in results)),
-            "strategies": list(set(r.strategy for r in results)),
-            "total_generation_time_sec": sum(r.generation_time_ms for r in results) / 1000,
-            "average_generation_time_sec": sum(r.generation_time_ms for r in results) / len(results) / 1000,
-            "total_tokens_generated": sum(r.completion_tokens for r in results),
-            "evaluated_results": sum(1 for r in results if r.scores is not None),
-            "pending_evaluation": sum(1 for r in results if r.scores is None)
-        }
+        if self.index is not None:
+            with self._lock:
+                self._sync_index(run_id)
+                return self.index.summary(run_id)
 
-        return summary
+        return summarize(self.load_results(run_id=run_id))
 
-    def save_summary_report(self, run_id: str):
+    def save_summary_report(self, run_id: str) -> Dict:
         """Generate and save a summary report.
 
         Args:
             run_id: Run identifier
+
+        Returns:
+            The saved summary dictionary
         """
         summary = self.generate_summary_report(run_id)
 
@@ -252,23 +400,38 @@ class ResultsStorage:
             json.dump(summary, f, indent=2)
 
         logger.info(f"Summary report saved to: {report_path}")
+        return summary
 
     def update_result(self, filepath: Path, result: EvaluationResult):
-        """Update a result file with new data.
+        """Update a stored result with new data.
 
         Args:
-            filepath: Path to the JSON file to update
+            filepath: JSON file or JSONL segment holding the result
             result: Updated EvaluationResult object
         """
-        with open(filepath, 'w') as f:
-            f.write(result.to_json())
+        backend = next(
+            (reader for reader in self._readers if reader.owns(filepath)),
+            self._readers[0]
+        )
+        with self._lock:
+            if self.index is not None:
+                in_sync = self.index.indexed_mtime(filepath.parent.name) == self._run_mtime(filepath.parent)
+                backend.update(filepath, result)
+                with self.index.transaction():
+                    self.index.upsert(filepath.parent.name, result, filepath)
+                    if in_sync:
+                        self._mark_indexed(filepath.parent)
+            else:
+                backend.update(filepath, result)
+            if filepath.parent.name in self._summaries:
+                self._summaries[filepath.parent.name].add(result)
         logger.debug(f"Updated result at: {filepath}")
 
     def calculate_and_update_total_scores(self, run_id: str) -> int:
         """Calculate total_score for all results with scores in a run.
 
-        This reads each JSON file, calculates total_score from scores dict,
-        and updates the file.
+        This reads each stored result, calculates total_score from the scores
+        dict, and writes the result back.
 
         Args:
             run_id: Run identifier
@@ -282,18 +445,23 @@ class ResultsStorage:
             return 0
 
         updated_count = 0
-        for filepath in run_dir.glob("*.json"):
-            result = self.load_result(filepath)
-            if result is None:
-                continue
+        for reader in self._readers:
+            for location, result in reader.iter_results(run_dir):
+                # Calculate total_score if scores exist
+                if result.scores is None:
+                    continue
+
+                total_score = sum(result.scores.values())
+                if reader.append_only and result.total_score == total_score:
+                    # Avoid growing append-only segments with no-op updates
+                    continue
 
-            # Calculate total_score if scores exist
-            if result.scores is not None:
-                result.total_score = sum(result.scores.values())
-                self.update_result(filepath, result)
+                result.total_score = total_score
+                self.update_result(location, result)
                 updated_count += 1
                 logger.debug(
-                    f"Calculated total_score={result.total_score} for {filepath.name}"
+                    f"Calculated total_score={result.total_score} for "
+                    f"{result.task_id}/{result.model_name}/{result.strategy}"
                 )
 
         logger.info(f"Updated total_score in {updated_count} files")
@@ -309,5 +477,80 @@ class ResultsStorage:
         if not run_dirs:
             return None
 
-        latest = max(run_dirs, key=lambda d: d.stat().st_mtime)
+        latest = max(
+            run_dirs,
+            key=lambda d: max(reader.last_modified(d) for reader in self._readers)
+        )
         return latest.name
+
+    def export_columnar(self, run_id: str, format: str = "parquet") -> Path:
+        """Compact a run into a single columnar file for analysis.
+
+        Nested fields (model_config, scores) are stored as JSON strings.
+        Requires pyarrow (``uv sync --extra columnar``).
+
+        Args:
+            run_id: Run identifier
+            format: "parquet" or "feather" (default: "parquet")
+
+        Returns:
+            Path to the written file in the reports directory
+
+        Raises:
+            ValueError: If the format is unknown or the run has no results
+            ImportError: If pyarrow is not installed
+        """
+        if format not in ("parquet", "feather"):
+            raise ValueError(f"Unknown columnar format '{format}'. Use 'parquet' or 'feather'")
+
+        results = self.load_results(run_id=run_id)
+        if not results:
+            raise ValueError(f"No results found for run: {run_id}")
+
+        import pandas as pd
+
+        df = pd.DataFrame([result.to_dict() for result in results])
+        for column in df.columns:
+            if df[column].map(lambda v: isinstance(v, (dict, list))).any():
+                df[column] = df[column].map(
+                    lambda v: json.dumps(v) if isinstance(v, (dict, list)) else v
+                )
+
+        output_path = self.reports_dir / f"{run_id}_results.{format}"
+        try:
+            if format == "parquet":
+                df.to_parquet(output_path, index=False)
+            else:
+                df.to_feather(output_path)
+        except ImportError as e:
+            raise ImportError(
+                f"Writing {format} requires pyarrow. Install it with: uv sync --extra columnar"
+            ) from e
+
+        logger.info(f"Exported {len(results)} results to: {output_path}")
+        return output_path
+
+    def export_files(self, run_id: str, output_dir: Optional[Path] = None) -> Path:
+        """Export a run in the per-cell JSON + markdown file layout.
+
+        Useful for manually scoring runs stored in another backend.
+
+        Args:
+            run_id: Run identifier
+            output_dir: Destination directory (default: <base_path>/exports/<run_id>)
+
+        Returns:
+            Directory the files were written to
+        """
+        if output_dir is None:
+            output_dir = self.base_path / "exports" / run_id
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        file_backend = FileBackend()
+        results = self.load_results(run_id=run_id)
+        for result in results:
+            file_backend.save(result, output_dir)
+
+        logger.info(f"Exported {len(results)} results to: {output_dir}")
+        return output_dir
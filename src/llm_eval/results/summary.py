@@ -0,0 +1,373 @@
+"""Incremental summary aggregation for evaluation runs."""
+
+import math
+import statistics
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .result import EvaluationResult
+
+
+class QuantileSketch:
+    """Streaming quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets, so any quantile is accurate to
+    within ``relative_accuracy`` of the true value regardless of how many
+    values were added. Unlike most sketches, values can also be removed,
+    which lets a summary replace a re-saved result.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+        """
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = defaultdict(int)
+        self._zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float):
+        """Add a non-negative value."""
+        if value <= 0:
+            self._zero_count += 1
+        else:
+            self._buckets[self._key(value)] += 1
+        self.count += 1
+
+    def remove(self, value: float):
+        """Remove a value previously added."""
+        if value <= 0:
+            self._zero_count -= 1
+        else:
+            key = self._key(value)
+            self._buckets[key] -= 1
+            if self._buckets[key] == 0:
+                del self._buckets[key]
+        self.count -= 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-th quantile (0.0-1.0), or None if empty."""
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                # Bucket midpoint in log space
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+@dataclass
+class SummaryRecord:
+    """The fields of one result that contribute to a summary."""
+    task_id: str
+    model_name: str
+    strategy: str
+    generation_time_ms: int
+    completion_tokens: int
+    scored: bool
+    load_duration_ms: Optional[int] = None
+    prompt_eval_duration_ms: Optional[int] = None
+    time_to_first_token_ms: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    total_duration_ms: Optional[int] = None
+    eval_duration_ms: Optional[int] = None
+    client_overhead_ms: Optional[int] = None
+    prompt_tokens_per_second: Optional[float] = None
+    eval_tokens_per_second: Optional[float] = None
+    # Repeated sampling; None unless the cell has several samples
+    n_samples: Optional[int] = None
+    sample_generation_time_ms: Optional[int] = None
+    generation_time_stdev_ms: Optional[float] = None
+    completion_tokens_stdev: Optional[float] = None
+    distinct_response_ratio: Optional[float] = None
+
+
+def sample_statistics(result: EvaluationResult) -> Dict[str, Any]:
+    """Spread of a cell's repeated samples, as SummaryRecord sampling fields.
+
+    Args:
+        result: EvaluationResult, possibly with ``samples``
+
+    Returns:
+        Dict with n_samples, sample_generation_time_ms,
+        generation_time_stdev_ms, completion_tokens_stdev and
+        distinct_response_ratio; all None if the result has under two samples
+    """
+    samples = result.samples or []
+    if len(samples) < 2:
+        return {
+            "n_samples": None,
+            "sample_generation_time_ms": None,
+            "generation_time_stdev_ms": None,
+            "completion_tokens_stdev": None,
+            "distinct_response_ratio": None
+        }
+
+    times = [sample["generation_time_ms"] for sample in samples]
+    tokens = [sample["completion_tokens"] for sample in samples]
+    return {
+        "n_samples": len(samples),
+        "sample_generation_time_ms": sum(times),
+        "generation_time_stdev_ms": statistics.pstdev(times),
+        "completion_tokens_stdev": statistics.pstdev(tokens),
+        "distinct_response_ratio": len({sample["response"] for sample in samples}) / len(samples)
+    }
+
+
+class _Totals:
+    """Count, time and token sums for one slice of a run."""
+
+    def __init__(self):
+        self.count = 0
+        self.generation_time_ms = 0
+        self.completion_tokens = 0
+
+    def apply(self, record: SummaryRecord, sign: int):
+        self.count += sign
+        self.generation_time_ms += sign * record.generation_time_ms
+        self.completion_tokens += sign * record.completion_tokens
+
+    def to_dict(self) -> Dict:
+        return {
+            "evaluations": self.count,
+            "total_generation_time_sec": self.generation_time_ms / 1000,
+            "average_generation_time_sec": (
+                self.generation_time_ms / self.count / 1000 if self.count else 0.0
+            ),
+            "total_tokens_generated": self.completion_tokens
+        }
+
+
+class RunningSummary:
+    """Summary statistics maintained incrementally as results are saved.
+
+    Each result is recorded by cell; saving the same cell again (a resumed
+    retry, or a scored update) replaces its previous contribution, so totals
+    always describe the latest result per cell. Producing the summary dict
+    costs the same no matter how many results were added.
+    """
+
+    def __init__(self):
+        """Initialize an empty summary."""
+        self._cells: Dict[Tuple, SummaryRecord] = {}
+        self._totals = _Totals()
+        self._by_model: Dict[str, _Totals] = defaultdict(_Totals)
+        self._by_strategy: Dict[str, _Totals] = defaultdict(_Totals)
+        self._value_counts: Dict[str, Dict[str, int]] = {
+            "tasks": defaultdict(int),
+            "models": defaultdict(int),
+            "strategies": defaultdict(int)
+        }
+        self._generation_times = QuantileSketch()
+        self._scored = 0
+        self._load_ms = [0, 0]
+        self._prompt_eval_ms = [0, 0]
+        self._ttft_ms = [0, 0]
+        self._tokens_per_second = [0.0, 0]
+        self._server_ms = [0, 0]
+        self._eval_ms = [0, 0]
+        self._overhead_ms = [0, 0]
+        self._prompt_rate = [0.0, 0]
+        self._eval_rate = [0.0, 0]
+        # Sampled cells, total samples, sample time, and sums of the per-cell spreads
+        self._sampling = [0, 0, 0, 0.0, 0.0, 0.0]
+
+    @classmethod
+    def from_results(cls, results: Iterable[EvaluationResult]) -> "RunningSummary":
+        """Build a summary from existing results."""
+        summary = cls()
+        for result in results:
+            summary.add(result)
+        return summary
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def add(self, result: EvaluationResult, cell_key: Optional[Tuple] = None):
+        """Add a result, replacing any earlier result for the same cell.
+
+        Args:
+            result: The saved EvaluationResult
+            cell_key: Identity of the result (default: result.cell_key)
+        """
+        self.add_record(
+            cell_key if cell_key is not None else result.cell_key,
+            SummaryRecord(
+                task_id=result.task_id,
+                model_name=result.model_name,
+                strategy=result.strategy,
+                generation_time_ms=result.generation_time_ms,
+                completion_tokens=result.completion_tokens,
+                scored=result.scores is not None,
+                load_duration_ms=result.load_duration_ms,
+                prompt_eval_duration_ms=result.prompt_eval_duration_ms,
+                time_to_first_token_ms=result.time_to_first_token_ms,
+                tokens_per_second=result.tokens_per_second,
+                total_duration_ms=result.total_duration_ms,
+                eval_duration_ms=result.eval_duration_ms,
+                client_overhead_ms=result.client_overhead_ms,
+                prompt_tokens_per_second=result.prompt_tokens_per_second,
+                eval_tokens_per_second=result.eval_tokens_per_second,
+                **sample_statistics(result)
+            )
+        )
+
+    def add_record(self, cell_key: Tuple, record: SummaryRecord):
+        """Add the summary fields of a cell, replacing any earlier record.
+
+        Args:
+            cell_key: Identity of the evaluation cell
+            record: Contributing fields of the result
+        """
+        previous = self._cells.pop(cell_key, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        self._cells[cell_key] = record
+        self._apply(record, 1)
+
+    def _apply(self, record: SummaryRecord, sign: int):
+        self._totals.apply(record, sign)
+        self._by_model[record.model_name].apply(record, sign)
+        self._by_strategy[record.strategy].apply(record, sign)
+
+        for group, value in (
+            ("tasks", record.task_id),
+            ("models", record.model_name),
+            ("strategies", record.strategy)
+        ):
+            counts = self._value_counts[group]
+            counts[value] += sign
+            if counts[value] == 0:
+                del counts[value]
+
+        if sign > 0:
+            self._generation_times.add(record.generation_time_ms)
+        else:
+            self._generation_times.remove(record.generation_time_ms)
+
+        self._scored += sign * int(record.scored)
+        for accumulator, value in (
+            (self._load_ms, record.load_duration_ms),
+            (self._prompt_eval_ms, record.prompt_eval_duration_ms),
+            (self._ttft_ms, record.time_to_first_token_ms),
+            (self._tokens_per_second, record.tokens_per_second),
+            (self._server_ms, record.total_duration_ms),
+            (self._eval_ms, record.eval_duration_ms),
+            (self._overhead_ms, record.client_overhead_ms),
+            (self._prompt_rate, record.prompt_tokens_per_second),
+            (self._eval_rate, record.eval_tokens_per_second)
+        ):
+            if value is not None:
+                accumulator[0] += sign * value
+                accumulator[1] += sign
+
+        if record.n_samples is not None:
+            for i, value in enumerate((
+                1,
+                record.n_samples,
+                record.sample_generation_time_ms,
+                record.generation_time_stdev_ms,
+                record.completion_tokens_stdev,
+                record.distinct_response_ratio
+            )):
+                self._sampling[i] += sign * value
+
+    def to_dict(self) -> Dict:
+        """Produce the summary report.
+
+        Returns:
+            Dictionary with summary statistics
+        """
+        count = self._totals.count
+        if count == 0:
+            return {"error": "No results found"}
+
+        summary = {
+            "total_evaluations": count,
+            "tasks": list(self._value_counts["tasks"]),
+            "models": list(self._value_counts["models"]),
+            "strategies": list(self._value_counts["strategies"]),
+            "total_generation_time_sec": self._totals.generation_time_ms / 1000,
+            "average_generation_time_sec": self._totals.generation_time_ms / count / 1000,
+            "total_tokens_generated": self._totals.completion_tokens,
+            "evaluated_results": self._scored,
+            "pending_evaluation": count - self._scored,
+            "generation_time_percentiles_sec": {
+                name: self._generation_times.quantile(q) / 1000
+                for name, q in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+            },
+            "by_model": {
+                name: totals.to_dict() for name, totals in self._by_model.items() if totals.count
+            },
+            "by_strategy": {
+                name: totals.to_dict() for name, totals in self._by_strategy.items() if totals.count
+            }
+        }
+
+        if self._load_ms[1]:
+            summary["total_load_time_sec"] = self._load_ms[0] / 1000
+        if self._prompt_eval_ms[1]:
+            summary["total_prompt_eval_time_sec"] = self._prompt_eval_ms[0] / 1000
+
+        # Where generation time went: server total, decoding, and client overhead
+        if self._server_ms[1]:
+            summary["total_server_time_sec"] = self._server_ms[0] / 1000
+        if self._eval_ms[1]:
+            summary["total_eval_time_sec"] = self._eval_ms[0] / 1000
+        if self._overhead_ms[1]:
+            summary["total_client_overhead_sec"] = self._overhead_ms[0] / 1000
+        if self._prompt_rate[1]:
+            summary["average_prompt_tokens_per_second"] = self._prompt_rate[0] / self._prompt_rate[1]
+        if self._eval_rate[1]:
+            summary["average_eval_tokens_per_second"] = self._eval_rate[0] / self._eval_rate[1]
+
+        # Streaming latency metrics are only present for streamed generations
+        if self._ttft_ms[1]:
+            summary["average_time_to_first_token_ms"] = self._ttft_ms[0] / self._ttft_ms[1]
+        if self._tokens_per_second[1]:
+            summary["average_tokens_per_second"] = (
+                self._tokens_per_second[0] / self._tokens_per_second[1]
+            )
+
+        cells, samples, sample_ms, time_stdev, token_stdev, distinct = self._sampling
+        if cells:
+            summary["sampling"] = {
+                "sampled_cells": cells,
+                "total_samples": samples,
+                "total_sample_generation_time_sec": sample_ms / 1000,
+                "mean_generation_time_stdev_sec": time_stdev / cells / 1000,
+                "mean_completion_tokens_stdev": token_stdev / cells,
+                "mean_distinct_response_ratio": distinct / cells
+            }
+
+        return summary
+
+
+def summarize(results: List[EvaluationResult]) -> Dict:
+    """Summarize a list of results in one pass.
+
+    Every result counts, even if several share a cell (e.g. across runs).
+
+    Args:
+        results: EvaluationResult objects
+
+    Returns:
+        Dictionary with summary statistics
+    """
+    summary = RunningSummary()
+    for position, result in enumerate(results):
+        summary.add(result, cell_key=(position,))
+    return summary.to_dict()
@@ -1,7 +1,9 @@
 """Base classes for task definitions."""
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterator, List, Optional
+
+from .dataset import EvaluationItem, TaskDataset
 
 
 @dataclass
@@ -43,6 +45,8 @@ class Task:
         evaluation_criteria: Dict of criterion_name -> description
         scoring_rubric: Dict of aspect -> maximum_points
         is_complete: Whether the task is fully implemented and ready for evaluation
+        dataset: Optional file of evaluation items; when set, every item is
+            evaluated in place of evaluation_input
     """
     id: str
     name: str
@@ -54,6 +58,30 @@ class Task:
     evaluation_criteria: Dict[str, str] = field(default_factory=dict)
     scoring_rubric: Dict[str, int] = field(default_factory=dict)
     is_complete: bool = False
+    dataset: Optional[TaskDataset] = None
+
+    def iter_items(self) -> Iterator[Optional[EvaluationItem]]:
+        """Yield the dataset's items lazily, or a single None if the task has no dataset."""
+        if self.dataset is None:
+            yield None
+            return
+        yield from self.dataset
+
+    def item_count(self) -> int:
+        """Number of evaluation items (1 without a dataset)."""
+        return self.dataset.count() if self.dataset is not None else 1
+
+    def get_item(self, item_id: Optional[str]) -> Optional[EvaluationItem]:
+        """Look up a dataset item by ID; None for a task's single built-in input."""
+        if item_id is None or self.dataset is None:
+            return None
+        return self.dataset.get(item_id)
+
+    def for_item(self, item: Optional[EvaluationItem]) -> "Task":
+        """The task with one item's input as its evaluation input, for prompt building."""
+        if item is None:
+            return self
+        return replace(self, evaluation_input=item.input, dataset=None)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
@@ -67,7 +95,8 @@ class Task:
             "development_examples": [ex.to_dict() for ex in self.development_examples],
             "evaluation_criteria": self.evaluation_criteria,
             "scoring_rubric": self.scoring_rubric,
-            "is_complete": self.is_complete
+            "is_complete": self.is_complete,
+            "dataset": str(self.dataset.path) if self.dataset is not None else None
         }
 
     def get_max_score(self) -> int:
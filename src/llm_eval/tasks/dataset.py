@@ -0,0 +1,233 @@
+"""Evaluation item datasets read lazily from JSONL or CSV files."""
+
+import csv
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Supported file formats, by file suffix
+DATASET_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+@dataclass
+class EvaluationItem:
+    """One evaluation input of a task.
+
+    Attributes:
+        id: Identifier unique within the task's dataset
+        input: The problem text, used in place of Task.evaluation_input
+        reference: Optional reference answer for scoring
+        metadata: Remaining fields of the record
+    """
+    id: str
+    input: str
+    reference: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class TaskDataset:
+    """Evaluation items of a task, stored one per line (JSONL) or row (CSV).
+
+    Items are read from disk every time the dataset is iterated and never
+    held in memory as a whole, so a task can have millions of items. Records
+    without an ID are identified by their position, as "#1", "#2", ...
+
+    Invalid records (malformed JSON or CSV, no input field, or an ID already
+    used by an earlier record) are logged and skipped rather than failing
+    the run; their numbers and errors are kept in ``invalid_records``. ``count`` reads the whole file, so calling
+    it before evaluating reports every invalid record up front.
+
+    Lookups by ID (used by distributed workers) build an index of byte
+    offsets on first use and read only the requested record.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        id_field: str = "id",
+        input_field: str = "input",
+        reference_field: str = "reference",
+        format: Optional[str] = None
+    ):
+        """Describe a dataset file; nothing is read until it is iterated.
+
+        Args:
+            path: Path to the JSONL or CSV file
+            id_field: Field holding the item ID (default: "id")
+            input_field: Field holding the evaluation input (default: "input")
+            reference_field: Field holding the reference answer, if any
+                (default: "reference")
+            format: "jsonl" or "csv" (default: from the file suffix)
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        self.path = Path(path)
+        self.id_field = id_field
+        self.input_field = input_field
+        self.reference_field = reference_field
+        self.format = format or DATASET_FORMATS.get(self.path.suffix.lower())
+        if self.format not in ("jsonl", "csv"):
+            raise ValueError(
+                f"Unsupported dataset format for {self.path}; "
+                f"expected one of {sorted(DATASET_FORMATS)} or format='jsonl'/'csv'"
+            )
+        self._count: Optional[int] = None
+        self._offsets: Optional[Dict[str, Tuple[int, int]]] = None
+        self._fieldnames: Optional[List[str]] = None
+        self.invalid_records: Dict[int, str] = {}
+
+    def __repr__(self) -> str:
+        return f"TaskDataset({str(self.path)!r})"
+
+    def __iter__(self) -> Iterator[EvaluationItem]:
+        """Yield items in file order."""
+        for _, _, item in self._iter_records():
+            yield item
+
+    def count(self) -> int:
+        """Number of valid items, counted with one pass over the file and cached.
+
+        Every record is parsed, so invalid records are found and logged here
+        rather than partway through an evaluation.
+        """
+        if self._count is None:
+            self._count = sum(1 for _ in self._iter_records())
+            if self.invalid_records:
+                logger.warning(
+                    f"Skipping {len(self.invalid_records)} invalid record(s) of {self.path}"
+                )
+        return self._count
+
+    def get(self, item_id: str) -> Optional[EvaluationItem]:
+        """Look up an item by ID.
+
+        Args:
+            item_id: Item identifier
+
+        Returns:
+            The item, or None if the dataset has no such ID
+        """
+        if self._offsets is None:
+            self._offsets = {
+                item.id: (offset, number) for offset, number, item in self._iter_records()
+            }
+        if item_id not in self._offsets:
+            return None
+        offset, number = self._offsets[item_id]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            _, record = next(self._records(f))
+            return self._to_item(record, number)
+
+    def _iter_records(self) -> Iterator[Tuple[int, int, EvaluationItem]]:
+        """Yield (byte offset, record number, item) of every valid record.
+
+        A record repeating the ID of an earlier one is invalid, so every ID
+        identifies exactly one item.
+        """
+        with open(self.path, "rb") as f:
+            if self.format == "csv":
+                header = f.readline().decode("utf-8-sig")
+                self._fieldnames = next(csv.reader([header]), [])
+                if self.input_field not in self._fieldnames:
+                    raise ValueError(f"{self.path} has no '{self.input_field}' column")
+
+            numbers: Dict[str, int] = {}
+            for number, (offset, record) in enumerate(self._records(f), start=1):
+                try:
+                    if isinstance(record, ValueError):
+                        raise record
+                    item = self._to_item(record, number)
+                    if item.id in numbers:
+                        raise ValueError(f"duplicate ID '{item.id}' (first used by record {numbers[item.id]})")
+                except ValueError as e:
+                    if number not in self.invalid_records:
+                        logger.error(f"Skipping record {number} of {self.path}: {e}")
+                        self.invalid_records[number] = str(e)
+                    continue
+                numbers[item.id] = number
+                yield offset, number, item
+
+    def _records(self, f: BinaryIO) -> Iterator[Tuple[int, Any]]:
+        """Yield (byte offset, fields) of the records from the file position on.
+
+        Blank lines are skipped. A malformed record yields the ValueError
+        describing it in place of its fields, so reading can go on past it.
+        CSV records are split by csv.reader, which may read several lines
+        for one record when a quoted field spans them.
+        """
+        if self.format == "csv":
+            reader = csv.reader(_decoded_lines(f))
+            while True:
+                # The reader pulls lines one at a time and only as far as the
+                # end of a record, so the file is positioned at the next one
+                offset = f.tell()
+                try:
+                    values = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    yield offset, ValueError(f"invalid CSV: {e}")
+                    continue
+                if not "".join(values).strip() and len(values) <= 1:
+                    continue
+                # Missing trailing fields are None, like csv.DictReader
+                values += [None] * (len(self._fieldnames) - len(values))
+                yield offset, dict(zip(self._fieldnames, values))
+            return
+
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                return
+            if line.strip():
+                yield offset, self._parse_json(line)
+
+    @staticmethod
+    def _parse_json(line: bytes) -> Any:
+        """Parse one JSONL record into a dict, or the ValueError describing it."""
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return ValueError(f"invalid JSON: {e}")
+        if not isinstance(record, dict):
+            return ValueError(f"expected a JSON object, got {type(record).__name__}")
+        return record
+
+    def _to_item(self, record: Dict[str, Any], position: int) -> EvaluationItem:
+        """Convert a raw record into an EvaluationItem.
+
+        Raises:
+            ValueError: If the record has no input field
+        """
+        if record.get(self.input_field) is None:
+            raise ValueError(f"no '{self.input_field}' field")
+        item_id = record.get(self.id_field)
+        reference = record.get(self.reference_field)
+        return EvaluationItem(
+            # "#" keeps positional IDs apart from numeric IDs of other records
+            id=str(item_id) if item_id not in (None, "") else f"#{position}",
+            input=str(record[self.input_field]),
+            reference=str(reference) if reference not in (None, "") else None,
+            metadata={
+                key: value for key, value in record.items()
+                if key not in (self.id_field, self.input_field, self.reference_field)
+            }
+        )
+
+
+def _decoded_lines(f: BinaryIO) -> Iterator[str]:
+    """Decode the lines of a binary file from its position on, one at a time.
+
+    Undecodable bytes are replaced with U+FFFD rather than raised, since an
+    error raised here would end the CSV reader along with the read.
+    """
+    for line in iter(f.readline, b""):
+        yield line.decode("utf-8", errors="replace")
@@ -1,62 +1,133 @@
 """Task registry for managing evaluation tasks."""
 
+import importlib
 import logging
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
 
 from .base import Task
 
-# Import task creation functions
-from .definitions.instruction_following import create_instruction_following_task
-from .definitions.logical_reasoning import create_logical_reasoning_task
-from .definitions.creative_writing import create_creative_writing_task
-from .definitions.code_generation import create_code_generation_task
-from .definitions.reading_comprehension import create_reading_comprehension_task
-from .definitions.common_sense import create_common_sense_task
-from .definitions.language_understanding import create_language_understanding_task
-from .definitions.factual_knowledge import create_factual_knowledge_task
-from .definitions.math_solving import create_math_solving_task
-from .definitions.ethical_reasoning import create_ethical_reasoning_task
-
 
 logger = logging.getLogger(__name__)
 
+# Entry point group under which other packages register task factories, e.g.
+#   [project.entry-points."llm_eval.tasks"]
+#   my_task = "my_package.tasks:create_my_task"
+ENTRY_POINT_GROUP = "llm_eval.tasks"
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+    """Where a task is defined.
+
+    Name, category and completion status are only read from the built
+    Task, so they cannot drift from the definition.
+
+    Attributes:
+        id: Task identifier
+        factory: "module:function" path of a function returning the Task,
+            or the function itself
+    """
+    id: str
+    factory: Union[str, Callable[[], Task]]
+
+
+def _builtin(module: str) -> TaskSpec:
+    """Spec of a task in the definitions package."""
+    return TaskSpec(id=module, factory=f"{__package__}.definitions.{module}:create_{module}_task")
+
+
+# Manifest of the bundled tasks, in display order
+BUILTIN_TASKS = (
+    _builtin("instruction_following"),
+    _builtin("logical_reasoning"),
+    _builtin("creative_writing"),
+    _builtin("code_generation"),
+    _builtin("reading_comprehension"),
+    _builtin("common_sense"),
+    _builtin("language_understanding"),
+    _builtin("factual_knowledge"),
+    _builtin("math_solving"),
+    _builtin("ethical_reasoning"),
+)
+
 
 class TaskRegistry:
     """Registry for managing and accessing evaluation tasks.
 
-    The registry loads all task definitions and provides methods to
-    retrieve tasks by ID or category.
+    Tasks are known from a manifest of specs (the bundled BUILTIN_TASKS,
+    factories registered by installed packages under the "llm_eval.tasks"
+    entry point group, and any passed to ``register``). A task's module is
+    imported and the Task built only when it is first requested, then
+    cached, so looking up one task or listing IDs does not import the
+    other definitions.
     """
 
-    def __init__(self):
-        """Initialize the task registry and load all tasks."""
+    def __init__(self, discover_plugins: bool = True):
+        """Initialize the task registry from the manifest.
+
+        Args:
+            discover_plugins: Also register tasks from installed packages'
+                entry points (default: True). Entry points are only read
+                when a task outside the manifest is looked up or all tasks
+                are listed.
+        """
+        self._specs: Dict[str, TaskSpec] = {spec.id: spec for spec in BUILTIN_TASKS}
         self._tasks: Dict[str, Task] = {}
-        self._load_tasks()
-
-    def _load_tasks(self):
-        """Load all task definitions."""
-        task_creators = [
-            create_instruction_following_task,
-            create_logical_reasoning_task,
-            create_creative_writing_task,
-            create_code_generation_task,
-            create_reading_comprehension_task,
-            create_common_sense_task,
-            create_language_understanding_task,
-            create_factual_knowledge_task,
-            create_math_solving_task,
-            create_ethical_reasoning_task
-        ]
-
-        for creator in task_creators:
-            try:
-                task = creator()
-                self._tasks[task.id] = task
-                logger.debug(f"Loaded task: {task.id}")
-            except Exception as e:
-                logger.error(f"Failed to load task from {creator.__name__}: {e}")
-
-        logger.info(f"Loaded {len(self._tasks)} tasks")
+        self._plugins_discovered = not discover_plugins
+
+    def register(self, spec: TaskSpec):
+        """Add a task to the registry, replacing any task with the same ID.
+
+        Args:
+            spec: Where the task is defined
+        """
+        self._specs[spec.id] = spec
+        self._tasks.pop(spec.id, None)
+
+    def _discover_plugins(self):
+        """Register task factories from the entry point group once."""
+        if self._plugins_discovered:
+            return
+        self._plugins_discovered = True
+        # Imported here since reading package metadata is slow to import
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name in self._specs:
+                logger.warning(
+                    f"Ignoring task entry point '{entry_point.name}' ({entry_point.value}): "
+                    f"the ID is already registered"
+                )
+                continue
+            self._specs[entry_point.name] = TaskSpec(id=entry_point.name, factory=entry_point.value)
+            logger.debug(f"Discovered task entry point: {entry_point.name}")
+
+    def _build(self, spec: TaskSpec) -> Optional[Task]:
+        """Import and call a spec's factory, caching the Task."""
+        if spec.id in self._tasks:
+            return self._tasks[spec.id]
+
+        try:
+            factory = spec.factory
+            if isinstance(factory, str):
+                module_name, _, attribute = factory.partition(":")
+                factory = getattr(importlib.import_module(module_name), attribute)
+            task = factory()
+        except Exception as e:
+            logger.error(f"Failed to load task {spec.id} from {spec.factory}: {e}")
+            return None
+
+        if task.id != spec.id:
+            logger.warning(f"Task registered as '{spec.id}' has ID '{task.id}'")
+
+        self._tasks[spec.id] = task
+        logger.debug(f"Loaded task: {spec.id}")
+        return task
+
+    def _all_specs(self) -> List[TaskSpec]:
+        self._discover_plugins()
+        return list(self._specs.values())
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by its ID.
@@ -67,10 +138,13 @@ class TaskRegistry:
         Returns:
             Task object if found, None otherwise
         """
-        task = self._tasks.get(task_id)
-        if task is None:
+        if task_id not in self._specs:
+            self._discover_plugins()
+        spec = self._specs.get(task_id)
+        if spec is None:
             logger.warning(f"Task not found: {task_id}")
-        return task
+            return None
+        return self._build(spec)
 
     def get_all_tasks(self) -> List[Task]:
         """Get all registered tasks.
@@ -78,7 +152,8 @@ class TaskRegistry:
         Returns:
             List of all Task objects
         """
-        return list(self._tasks.values())
+        tasks = [self._build(spec) for spec in self._all_specs()]
+        return [task for task in tasks if task is not None]
 
     def get_tasks_by_category(self, category: str) -> List[Task]:
         """Get all tasks in a specific category.
@@ -89,7 +164,7 @@ class TaskRegistry:
         Returns:
             List of Task objects in the category
         """
-        return [task for task in self._tasks.values() if task.category == category]
+        return [task for task in self.get_all_tasks() if task.category == category]
 
     def get_task_ids(self) -> List[str]:
         """Get all task IDs.
@@ -97,7 +172,7 @@ class TaskRegistry:
         Returns:
             List of task identifiers
         """
-        return list(self._tasks.keys())
+        return [spec.id for spec in self._all_specs()]
 
     def get_complete_tasks(self) -> List[Task]:
         """Get only tasks that are marked as complete.
@@ -105,7 +180,7 @@ class TaskRegistry:
         Returns:
             List of complete Task objects
         """
-        return [task for task in self._tasks.values() if task.is_complete]
+        return [task for task in self.get_all_tasks() if task.is_complete]
 
     def count_complete_tasks(self) -> int:
         """Count tasks that are complete.
@@ -113,7 +188,7 @@ class TaskRegistry:
         Returns:
             Number of complete tasks
         """
-        return sum(1 for task in self._tasks.values() if task.is_complete)
+        return sum(1 for task in self.get_all_tasks() if task.is_complete)
 
     def count_incomplete_tasks(self) -> int:
         """Count tasks that are incomplete.
@@ -121,7 +196,7 @@ class TaskRegistry:
         Returns:
             Number of incomplete tasks
         """
-        return sum(1 for task in self._tasks.values() if not task.is_complete)
+        return sum(1 for task in self.get_all_tasks() if not task.is_complete)
 
     def get_completion_status(self) -> Dict[str, bool]:
         """Get completion status for all tasks.
@@ -129,4 +204,4 @@ class TaskRegistry:
         Returns:
             Dict mapping task_id to completion status (True if complete)
         """
-        return {task_id: task.is_complete for task_id, task in self._tasks.items()}
+        return {task.id: task.is_complete for task in self.get_all_tasks()}
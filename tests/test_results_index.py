@@ -0,0 +1,172 @@
+"""Transactions, schema upgrades and resyncing of the SQLite results index."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from llm_eval.results.index import ResultsIndex
+from llm_eval.results.result import EvaluationResult
+from llm_eval.results.storage import ResultsStorage
+
+
+RUN = "run_test"
+
+
+def _result(task_id="task", item_id=None, response="answer"):
+    return EvaluationResult(
+        task_id=task_id,
+        model_name="model",
+        strategy="zero_shot",
+        prompt="prompt",
+        response=response,
+        timestamp="2026-01-01T00:00:00",
+        item_id=item_id
+    )
+
+
+def _indexed_tasks(index, run_id=RUN):
+    return sorted(row["task_id"] for row in index.query(run_id=run_id))
+
+
+def test_nested_transaction_rolls_back_as_a_whole(tmp_path):
+    index = ResultsIndex(tmp_path / "index.sqlite")
+    index.upsert(RUN, _result("kept"), tmp_path / "kept.json")
+
+    with pytest.raises(RuntimeError):
+        with index.transaction():
+            index.upsert(RUN, _result("outer"), tmp_path / "outer.json")
+            with index.transaction():
+                index.upsert(RUN, _result("inner"), tmp_path / "inner.json")
+                index.mark_run(RUN, 1.0)
+                raise RuntimeError("write failed")
+
+    assert _indexed_tasks(index) == ["kept"]
+    assert index.indexed_mtime(RUN) is None
+
+    # The connection is usable again afterwards
+    with index.transaction():
+        index.upsert(RUN, _result("after"), tmp_path / "after.json")
+    assert _indexed_tasks(index) == ["after", "kept"]
+    index.close()
+
+
+def test_nested_transaction_commits_with_the_outermost(tmp_path):
+    db_path = tmp_path / "index.sqlite"
+    index = ResultsIndex(db_path)
+    other = ResultsIndex(db_path)
+
+    with index.transaction():
+        with index.transaction():
+            index.upsert(RUN, _result("inner"), tmp_path / "inner.json")
+        # Not visible to other connections until the outermost commits
+        assert _indexed_tasks(other) == []
+    assert _indexed_tasks(other) == ["inner"]
+    index.close()
+    other.close()
+
+
+def test_contending_connections_keep_every_write(tmp_path):
+    db_path = tmp_path / "index.sqlite"
+    ResultsIndex(db_path).close()
+    barrier = threading.Barrier(4)
+
+    def writer(number):
+        index = ResultsIndex(db_path)
+        barrier.wait()
+        for i in range(25):
+            with index.transaction():
+                index.upsert(RUN, _result(f"task_{number}_{i}"), tmp_path / "result.json")
+        index.close()
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    index = ResultsIndex(db_path)
+    assert len(index.query(run_id=RUN)) == 100
+    index.close()
+
+
+def test_outdated_schema_is_rebuilt(tmp_path):
+    db_path = tmp_path / "index.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(
+        "CREATE TABLE results (run_id TEXT, task_id TEXT, model_name TEXT, strategy TEXT, "
+        "location TEXT, PRIMARY KEY (run_id, task_id, model_name, strategy));"
+        "INSERT INTO results VALUES ('old_run', 'task', 'model', 'zero_shot', 'x.json');"
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, indexed_mtime REAL NOT NULL);"
+        "INSERT INTO runs VALUES ('old_run', 1.0);"
+    )
+    conn.close()
+
+    index = ResultsIndex(db_path)
+    columns = {row["name"] for row in index._conn.execute("PRAGMA table_info(results)")}
+    assert {"item_id", "n_samples", "eval_tokens_per_second"} <= columns
+    assert index.query() == []
+    assert index.indexed_runs() == {}
+
+    index.upsert(RUN, _result(item_id="q1"), tmp_path / "result.json")
+    index.upsert(RUN, _result(item_id="q2"), tmp_path / "result.json")
+    assert sorted(row["item_id"] for row in index.query(run_id=RUN)) == ["q1", "q2"]
+    index.close()
+
+
+def test_outdated_index_is_refilled_from_results(tmp_path):
+    storage = ResultsStorage(tmp_path, use_index=True)
+    storage.save_result(_result("task_a"), run_id=RUN)
+    storage.index.close()
+
+    # Replace the index with one in the schema before item IDs
+    (tmp_path / "index.sqlite").unlink()
+    conn = sqlite3.connect(str(tmp_path / "index.sqlite"))
+    conn.execute(
+        "CREATE TABLE results (run_id TEXT, task_id TEXT, model_name TEXT, strategy TEXT, "
+        "location TEXT, PRIMARY KEY (run_id, task_id, model_name, strategy))"
+    )
+    conn.commit()
+    conn.close()
+
+    storage = ResultsStorage(tmp_path, use_index=True)
+    assert [r.task_id for r in storage.load_results(run_id=RUN)] == ["task_a"]
+    assert _indexed_tasks(storage.index) == ["task_a"]
+
+
+def test_saves_through_the_index_keep_it_in_sync(tmp_path):
+    first = ResultsStorage(tmp_path, use_index=True)
+    second = ResultsStorage(tmp_path, use_index=True)
+    first.save_result(_result("task_a"), run_id=RUN)
+    second.save_result(_result("task_b"), run_id=RUN)
+
+    run_dir = first.raw_dir / RUN
+    assert first.index.indexed_mtime(RUN) == first._run_mtime(run_dir)
+
+    rescans = []
+    original = first.index.drop_run
+    first.index.drop_run = lambda run_id: (rescans.append(run_id), original(run_id))
+    assert sorted(r.task_id for r in first.load_results(run_id=RUN)) == ["task_a", "task_b"]
+    assert rescans == []
+
+
+def test_writes_without_the_index_are_resynced(tmp_path):
+    indexed = ResultsStorage(tmp_path, use_index=True)
+    indexed.save_result(_result("task_a"), run_id=RUN)
+
+    # A writer that does not use the index changes the run directory
+    ResultsStorage(tmp_path).save_result(_result("task_b"), run_id=RUN)
+    run_dir = indexed.raw_dir / RUN
+    assert indexed.index.indexed_mtime(RUN) != indexed._run_mtime(run_dir)
+    assert _indexed_tasks(indexed.index) == ["task_a"]
+
+    assert sorted(r.task_id for r in indexed.load_results(run_id=RUN)) == ["task_a", "task_b"]
+    assert _indexed_tasks(indexed.index) == ["task_a", "task_b"]
+    assert indexed.index.indexed_mtime(RUN) == indexed._run_mtime(run_dir)
+
+    # A deleted run is dropped on the next full sync
+    for path in run_dir.iterdir():
+        path.unlink()
+    run_dir.rmdir()
+    assert indexed.load_results() == []
+    assert indexed.index.indexed_runs() == {}
@@ -0,0 +1,40 @@
+"""Import-time budget of the CLI commands that do not evaluate anything.
+
+The measurements are shared with scripts/benchmark.py (see _startup_probe).
+"""
+
+import pytest
+
+from _startup_probe import (
+    ROOT,
+    STARTUP_BUDGET_SEC,
+    STARTUP_COMMANDS,
+    command_heavy_modules,
+    command_wall,
+    imported_heavy_modules,
+    interpreter_wall
+)
+
+
+@pytest.mark.parametrize("command", STARTUP_COMMANDS, ids=" ".join)
+def test_command_imports_no_heavy_modules(command):
+    assert command_heavy_modules(command) == []
+
+
+@pytest.mark.parametrize("command", STARTUP_COMMANDS, ids=" ".join)
+def test_command_starts_within_budget(command):
+    interpreter_sec = interpreter_wall()
+    command_sec = command_wall(command)
+    assert command_sec - interpreter_sec <= STARTUP_BUDGET_SEC, (
+        f"{' '.join(command)} took {command_sec:.3f}s, "
+        f"{command_sec - interpreter_sec:.3f}s more than a bare interpreter"
+    )
+
+
+def test_sync_run_does_not_import_aiohttp():
+    code = (
+        f"sys.path.insert(0, {str(ROOT / 'src')!r})\n"
+        "import llm_eval.evaluation.evaluator, llm_eval.models.endpoint_pool\n"
+        "import llm_eval.models.ollama_client, llm_eval.results.storage\n"
+    )
+    assert not {"aiohttp", "pandas"} & set(imported_heavy_modules(code))
@@ -0,0 +1,139 @@
+"""Leasing and cell state transitions of the SQLite work queue."""
+
+import sqlite3
+import threading
+import time
+
+from llm_eval.evaluation.work_queue import WorkQueue
+
+
+RUN = "run_test"
+CELLS = [(f"task_{i}", "model", "zero_shot", None) for i in range(20)]
+
+
+def _states(queue):
+    conn = sqlite3.connect(str(queue.db_path))
+    try:
+        return dict(
+            ((task_id, item_id or None), (state, attempts))
+            for task_id, item_id, state, attempts in conn.execute(
+                "SELECT task_id, item_id, state, attempts FROM cells WHERE run_id = ?", (RUN,)
+            )
+        )
+    finally:
+        conn.close()
+
+
+def test_publish_is_idempotent_and_keeps_order(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    assert queue.publish(RUN, CELLS) == len(CELLS)
+    assert queue.publish(RUN, CELLS + [("extra", "model", "zero_shot", "item-1")]) == 1
+
+    assert queue.lease(RUN, "w1", limit=3) == CELLS[:3]
+    assert queue.progress(RUN)["total"] == len(CELLS) + 1
+    assert queue.latest_run_id() == RUN
+
+
+def test_contending_connections_lease_each_cell_once(tmp_path):
+    db_path = tmp_path / "queue.sqlite"
+    WorkQueue(db_path).publish(RUN, CELLS)
+    barrier = threading.Barrier(4)
+    leased = {}
+
+    def worker(worker_id):
+        # Each worker has its own WorkQueue, as separate processes would
+        queue = WorkQueue(db_path)
+        leased[worker_id] = []
+        barrier.wait()
+        while True:
+            cells = queue.lease(RUN, worker_id, limit=2)
+            if not cells:
+                return
+            leased[worker_id].extend(cells)
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_leased = [cell for cells in leased.values() for cell in cells]
+    assert sorted(all_leased) == sorted(CELLS)
+    assert WorkQueue(db_path).progress(RUN)["leased"] == len(CELLS)
+
+
+def test_expired_lease_is_leased_again(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", lease_seconds=0.05)
+    queue.publish(RUN, CELLS[:1])
+    assert queue.lease(RUN, "dead-worker") == CELLS[:1]
+    assert queue.lease(RUN, "w2") == []
+
+    time.sleep(0.1)
+    assert queue.lease(RUN, "w2") == CELLS[:1]
+    assert _states(queue)[("task_0", None)] == ("leased", 2)
+
+    # The first worker lost its lease, so its completion is ignored
+    queue.complete(RUN, CELLS[0], "dead-worker")
+    assert queue.progress(RUN)["leased"] == 1
+    queue.complete(RUN, CELLS[0], "w2")
+    assert queue.progress(RUN)["done"] == 1
+
+
+def test_renewed_lease_does_not_expire(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", lease_seconds=0.2)
+    queue.publish(RUN, CELLS[:1])
+    queue.lease(RUN, "w1")
+    time.sleep(0.1)
+    assert queue.renew(RUN, "w1") == 1
+    time.sleep(0.15)
+    assert queue.lease(RUN, "w2") == []
+
+
+def test_complete_fail_and_release(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite")
+    queue.publish(RUN, CELLS[:3])
+    first, second, third = queue.lease(RUN, "w1", limit=3)
+
+    queue.complete(RUN, first, "w1")
+    queue.fail(RUN, second, "w1", "Unknown task")
+    queue.release(RUN, third, "w1")
+
+    assert queue.progress(RUN) == {"pending": 1, "leased": 0, "done": 1, "failed": 1, "total": 3}
+    assert queue.failures(RUN) == [(second, "Unknown task")]
+    assert queue.lease(RUN, "w2") == [third]
+
+
+def test_retry_returns_cell_until_attempts_run_out(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    queue.publish(RUN, CELLS[:1])
+    cell = CELLS[0]
+
+    queue.lease(RUN, "w1")
+    assert queue.retry(RUN, cell, "w1", "ERROR: timeout") is True
+    assert queue.progress(RUN)["pending"] == 1
+
+    queue.lease(RUN, "w2")
+    # A worker that no longer holds the lease cannot change the cell
+    assert queue.retry(RUN, cell, "w1", "ERROR: stale") is False
+    assert queue.progress(RUN)["leased"] == 1
+
+    assert queue.retry(RUN, cell, "w2", "ERROR: timeout again") is False
+    assert queue.failures(RUN) == [(cell, "ERROR: timeout again")]
+    assert queue.lease(RUN, "w3") == []
+
+
+def test_requeue_resets_finished_cells(tmp_path):
+    queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=1)
+    queue.publish(RUN, CELLS[:3])
+    done, failed, leased = queue.lease(RUN, "w1", limit=3)
+    queue.complete(RUN, done, "w1")
+    assert queue.retry(RUN, failed, "w1", "ERROR: boom") is False
+
+    queue.requeue(RUN, [done, failed, leased])
+
+    states = _states(queue)
+    assert states[("task_0", None)] == ("pending", 0)
+    assert states[("task_1", None)] == ("pending", 0)
+    # Cells still leased are left to their worker
+    assert states[("task_2", None)] == ("leased", 1)
+    assert queue.lease(RUN, "w2", limit=3) == [done, failed]